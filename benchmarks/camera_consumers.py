@@ -0,0 +1,122 @@
+# coding: utf-8
+
+"""
+This benchmark measures how many frames per second can be shared by a Camera
+Block with its CameraProcesses, depending on the number of CameraProcesses
+reading the frames. It does not require any hardware nor specific Python
+module to run.
+
+A producer Process writes 12 MP frames to a FrameRing as fast as possible,
+like the Camera Block does, while 1 to 4 consumer Processes read the latest
+available frame in a loop, like the CameraProcesses do. The consumers either
+copy the frame out of the ring, or lease its slot and read it through a
+read-only view. They only compute a cheap statistic on the frame, so that the
+cost of sharing the frames dominates.
+
+The results are printed in the console as the number of frames written by the
+producer per second, the mean number of frames read per second by each
+consumer, and the mean time it takes a consumer to get access to a frame.
+The frame rates are only meaningful on a machine with at least one CPU core
+per Process, i.e. 5 cores for the largest number of consumers.
+"""
+
+from multiprocessing import Process, Event, Value
+from time import perf_counter, sleep
+from typing import Optional
+import numpy as np
+
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+
+SHAPE = (3000, 4000)
+DURATION = 3
+N_CONSUMERS = (1, 2, 3, 4)
+
+
+def produce(ring: FrameRing, stop: Event, n_frames: Value) -> None:
+  """Writes frames to the ring until told to stop."""
+
+  img = np.random.randint(0, 256, SHAPE, dtype=np.uint8)
+  head = 0
+  while not stop.is_set():
+    ring.write(img, {'t(s)': perf_counter(), 'ImageUniqueID': head})
+    head += 1
+  n_frames.value = head
+
+
+def consume(ring: FrameRing,
+            stop: Event,
+            lessee: Optional[int],
+            n_frames: Value,
+            read_time: Value) -> None:
+  """Reads the latest frame of the ring until told to stop, either by copying
+  it or by leasing its slot."""
+
+  img = np.empty(SHAPE, dtype=np.uint8)
+  last = -1
+  count = 0
+  total = 0.
+  while not stop.is_set():
+    number = ring.head - 1
+    if number <= last:
+      continue
+    last = number
+
+    t0 = perf_counter()
+    if lessee is None:
+      ok = ring.read(number, img) is not None
+      frame = img
+    else:
+      leased = ring.lease(number, lessee)
+      ok = leased is not None
+      frame = leased[0] if ok else None
+    t1 = perf_counter()
+
+    if ok:
+      frame[::64, ::64].sum()
+      count += 1
+      total += t1 - t0
+
+  n_frames.value = count
+  read_time.value = total / count if count else 0
+
+
+def bench(n_consumers: int, zero_copy: bool) -> (float, float, float):
+  """Returns the frames written per second, the mean frames read per second
+  by each consumer, and the mean time to access a frame in milliseconds."""
+
+  ring = FrameRing(SHAPE, np.uint8, n_slots=3,
+                   n_lessees=n_consumers if zero_copy else 0)
+  stop = Event()
+  written = Value('q', 0)
+  read = [Value('q', 0) for _ in range(n_consumers)]
+  times = [Value('d', 0) for _ in range(n_consumers)]
+
+  procs = [Process(target=consume,
+                   args=(ring, stop, i if zero_copy else None, count, t))
+           for i, (count, t) in enumerate(zip(read, times))]
+  for proc in procs:
+    proc.start()
+  producer = Process(target=produce, args=(ring, stop, written))
+  producer.start()
+
+  sleep(DURATION)
+  stop.set()
+  for proc in (producer, *procs):
+    proc.join()
+
+  return (written.value / DURATION,
+          sum(count.value for count in read) / n_consumers / DURATION,
+          1000 * sum(t.value for t in times) / n_consumers)
+
+
+if __name__ == '__main__':
+
+  print(f"Frames of shape {SHAPE}, {DURATION}s per run\n")
+  print(f"{'consumers':>10} {'mode':>10} {'written/s':>10} {'read/s':>10} "
+        f"{'access(ms)':>10}")
+  for n in N_CONSUMERS:
+    for zero_copy in (False, True):
+      written_fps, read_fps, access = bench(n, zero_copy)
+      mode = 'zero-copy' if zero_copy else 'copy'
+      print(f"{n:>10} {mode:>10} {written_fps:>10.1f} {read_fps:>10.1f} "
+            f"{access:>10.3f}")
@@ -0,0 +1,84 @@
+# coding: utf-8
+
+"""
+This benchmark compares the time it takes the DISCorrelTool to process an
+image when computing the optical flow on the entire image, and when computing
+it only on the region of interest extended by a margin. It requires
+opencv-python to run.
+
+The images are made of the speckle pattern shipped with Crappy, tiled to a
+size of 4000x5000 pixels. The current image is the reference one translated by
+a few pixels and slightly stretched along x. The region of interest is a
+600x200 strip in the middle of the images.
+
+The results are printed in the console as the mean time to process an image,
+the speed-up compared to the full image, and the displacement and strain
+found by the correlation, that should be close to each other for all the
+modes.
+"""
+
+from time import perf_counter
+from typing import Optional
+import numpy as np
+import cv2
+
+from crappy import resources
+from crappy.tool.camera_config import Box
+from crappy.tool.image_processing import DISCorrelTool
+
+SHAPE = (4000, 5000)
+ROI = Box(x_start=2200, x_end=2800, y_start=1900, y_end=2100)
+MARGINS = (None, 100, 50, 20)
+N_IMAGES = 5
+
+
+def make_images() -> (np.ndarray, np.ndarray):
+  """Returns the reference image, and the translated and stretched one."""
+
+  speckle = resources.speckle
+  ref = np.tile(speckle, (-(-SHAPE[0] // speckle.shape[0]),
+                          -(-SHAPE[1] // speckle.shape[1])))
+  ref = np.ascontiguousarray(ref[:SHAPE[0], :SHAPE[1]])
+
+  # Translating by (3.5, -2) pixels and stretching by 0.2% along x around
+  # the center of the image
+  exx = 2e-3
+  matrix = np.array([[1 + exx, 0, 3.5 - exx * SHAPE[1] / 2],
+                     [0, 1, -2]], dtype=np.float64)
+  img = cv2.warpAffine(ref, matrix, (SHAPE[1], SHAPE[0]),
+                       flags=cv2.INTER_CUBIC)
+  return ref, img
+
+
+def bench(ref: np.ndarray,
+          img: np.ndarray,
+          margin: Optional[int]) -> (float, float, float):
+  """Returns the mean time to process an image in milliseconds, and the
+  displacement along x and strain along x found by the correlation."""
+
+  tool = DISCorrelTool(box=ROI, fields=['x', 'y', 'exx'], roi_margin=margin)
+  tool.set_box()
+  tool.set_img0(ref)
+
+  t0 = perf_counter()
+  for _ in range(N_IMAGES):
+    x, _, exx = tool.get_data(img)
+  return 1000 * (perf_counter() - t0) / N_IMAGES, x, exx
+
+
+if __name__ == '__main__':
+
+  reference, image = make_images()
+  print(f"Images of shape {SHAPE}, region of interest of "
+        f"{ROI.x_end - ROI.x_start}x{ROI.y_end - ROI.y_start} pixels, "
+        f"{N_IMAGES} images per run\n")
+  print(f"{'margin':>8} {'time(ms)':>10} {'speed-up':>10} {'x(pix)':>10} "
+        f"{'Exx(%)':>10}")
+
+  full = None
+  for margin in MARGINS:
+    duration, x_pix, exx_pct = bench(reference, image, margin)
+    full = full if full is not None else duration
+    name = 'full' if margin is None else str(margin)
+    print(f"{name:>8} {duration:>10.1f} {full / duration:>10.1f} "
+          f"{x_pix:>10.3f} {exx_pct:>10.3f}")
@@ -0,0 +1,110 @@
+# coding: utf-8
+
+"""
+This benchmark compares the time it takes to perform image correlation on
+high-resolution images, and the accuracy of the results, when the images are
+downscaled by a factor 1, 2 or 4 beforehand. It requires opencv-python to run.
+
+The correlation is performed the same way as in the DISCorrelProcess and the
+DICVEProcess, by downscaling the images and the region of interest and scaling
+the results back to full-resolution pixels. The DISCorrelTool computes the
+flow on a 1200x600 region of interest plus a margin of 50 pixels, and the
+DICVETool tracks two 256x256 patches.
+
+The images are made of the speckle pattern shipped with Crappy, tiled to a
+size of 2048x2448 pixels and stretched by a known strain along x. The results
+are printed in the console as the mean time to process an image including the
+downscaling, the speed-up compared to the full resolution, and the error on
+the strain compared to the applied one.
+"""
+
+from time import perf_counter
+import numpy as np
+
+from crappy import resources
+from crappy.tool import ApplyStrainToImage
+from crappy.tool.camera_config import Box, SpotsBoxes
+from crappy.tool.image_processing import DISCorrelTool, DICVETool
+from crappy.tool.image_processing.downscale import (downscale_image,
+                                                    downscale_box,
+                                                    downscale_spots,
+                                                    downscale_fields)
+
+SHAPE = (2048, 2448)
+ROI = Box(x_start=624, x_end=1824, y_start=724, y_end=1324)
+PATCHES = [(896, 424, 256, 256), (896, 1768, 256, 256)]
+FACTORS = (1, 2, 4)
+STRAINS = (0.2, 0.4, 0.6, 0.8, 1.)
+
+
+def make_images() -> (np.ndarray, list):
+  """Returns the reference image, and the images stretched along x by the
+  strains to apply."""
+
+  speckle = resources.speckle
+  ref = np.tile(speckle, (-(-SHAPE[0] // speckle.shape[0]),
+                          -(-SHAPE[1] // speckle.shape[1])))
+  ref = np.ascontiguousarray(ref[:SHAPE[0], :SHAPE[1]])
+  strain = ApplyStrainToImage(ref)
+  return ref, [strain(exx, 0) for exx in STRAINS]
+
+
+def bench_dis_correl(ref: np.ndarray,
+                     images: list,
+                     factor: int) -> (float, float):
+  """Returns the mean time to process an image with the DISCorrelTool in
+  milliseconds, and the maximum error on the strain in %."""
+
+  fields = ['x', 'y', 'exx']
+  tool = DISCorrelTool(box=downscale_box(ROI, factor),
+                       fields=downscale_fields(fields, ROI, factor),
+                       roi_margin=-(-50 // factor))
+  tool.set_box()
+  tool.set_img0(downscale_image(ref, factor))
+
+  t0 = perf_counter()
+  results = [[value * factor for value in
+              tool.get_data(downscale_image(img, factor))]
+             for img in images]
+  duration = 1000 * (perf_counter() - t0) / len(images)
+
+  return duration, max(abs(exx - applied) for (*_, exx), applied
+                       in zip(results, STRAINS))
+
+
+def bench_dic_ve(ref: np.ndarray,
+                 images: list,
+                 factor: int) -> (float, float):
+  """Returns the mean time to process an image with the DICVETool in
+  milliseconds, and the maximum error on the strain in %."""
+
+  patches = SpotsBoxes()
+  patches.set_spots(PATCHES)
+  patches.save_length()
+  tool = DICVETool(patches=downscale_spots(patches, factor))
+  tool.set_img0(downscale_image(ref, factor))
+
+  t0 = perf_counter()
+  results = [tool.calculate_displacement(downscale_image(img, factor))
+             for img in images]
+  duration = 1000 * (perf_counter() - t0) / len(images)
+
+  return duration, max(abs(exx - applied) for (_, _, exx, _), applied
+                       in zip(results, STRAINS))
+
+
+if __name__ == '__main__':
+
+  reference, stretched = make_images()
+  print(f"Images of shape {SHAPE}, applied strains {STRAINS}%\n")
+  print(f"{'tool':>12} {'factor':>8} {'time(ms)':>10} {'speed-up':>10} "
+        f"{'err Exx(%)':>12}")
+
+  for name, bench in (('DISCorrel', bench_dis_correl),
+                      ('DICVE', bench_dic_ve)):
+    full = None
+    for downscale in FACTORS:
+      time_ms, error = bench(reference, stretched, downscale)
+      full = full if full is not None else time_ms
+      print(f"{name:>12} {downscale:>8} {time_ms:>10.1f} "
+            f"{full / time_ms:>10.1f} {error:>12.4f}")
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+This benchmark measures the sustained number of frames per second the
+ImageSaver CameraProcess can record, depending on the number of worker
+Processes encoding the images and on the backend used. It does not require
+any hardware, but each backend requires its Python module to be installed.
+The backends whose module is missing are skipped.
+
+The ImageSaver is driven directly from this script, by repeatedly setting its
+current frame and calling its loop method, so that the acquisition is never
+the bottleneck. The frames are 4 MP 8-bits images, saved in the png format
+that requires compression, or as raw numpy arrays for the npy backend. The
+images are written to a temporary folder, that is deleted afterward.
+
+The results are printed in the console as the number of frames saved per
+second, including the time needed to save the last frames when stopping. The
+workers can only speed up the recording on a machine with several CPU cores,
+and for backends whose encoding is slower than copying the frames.
+"""
+
+from multiprocessing import Event
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import numpy as np
+
+from crappy._global import OptionalModule
+from crappy.blocks.camera_processes import ImageSaver
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+from crappy.blocks.camera_processes import record
+
+SHAPE = (2048, 2048)
+N_FRAMES = 60
+N_WORKERS = (0, 1, 2, 4)
+BACKENDS = {'sitk': record.Sitk, 'pil': record.PIL, 'cv2': record.cv2,
+            'npy': np}
+
+
+def bench(backend: str, n_workers: int, frames: np.ndarray) -> float:
+  """Returns the number of frames saved per second."""
+
+  with TemporaryDirectory() as folder:
+    saver = ImageSaver(img_extension='png', save_folder=Path(folder),
+                       save_backend=backend, n_workers=n_workers)
+    saver.set_shared(ring=FrameRing(SHAPE, np.uint8), barrier=None,
+                     event=Event(), shape=SHAPE, dtype=np.uint8,
+                     to_draw_conn=None, outputs=list(), labels=list(),
+                     log_queue=None)
+    saver.init()
+
+    t0 = perf_counter()
+    try:
+      for i in range(N_FRAMES):
+        saver.img = frames[i % len(frames)]
+        saver.metadata = {'t(s)': i / 100, 'ImageUniqueID': i}
+        saver.loop()
+    finally:
+      saver.finish()
+    return N_FRAMES / (perf_counter() - t0)
+
+
+if __name__ == '__main__':
+
+  # Smooth images with some noise, that are not trivial to compress
+  rng = np.random.default_rng(0)
+  y, x = np.mgrid[:SHAPE[0], :SHAPE[1]]
+  base = 127 + 100 * np.sin(x / 50) * np.cos(y / 70)
+  frames = [np.clip(base + rng.normal(0, 10, SHAPE), 0, 255).astype(np.uint8)
+            for _ in range(4)]
+
+  print(f"Saving {N_FRAMES} frames of shape {SHAPE}\n")
+  print(f"{'backend':>8}" + ''.join(f"{f'{n} workers':>12}"
+                                    for n in N_WORKERS))
+  for backend, module in BACKENDS.items():
+    if isinstance(module, OptionalModule):
+      print(f"{backend:>8}   module not installed, skipping")
+      continue
+    results = [bench(backend, n, frames) for n in N_WORKERS]
+    print(f"{backend:>8}" + ''.join(f"{fps:>12.1f}" for fps in results))
@@ -0,0 +1,69 @@
+# coding: utf-8
+
+"""
+This benchmark measures the time it takes for a Block to send data to several
+downstream Blocks. It does not require any hardware nor specific Python module
+to run.
+
+The Block.send method serializes the data to send only once, and writes the
+same bytes to every output Link that has no Modifier. Before, each Link was
+serializing the data again. Here, both methods are compared for a Block having
+1, 4 and 8 output Links, with a small dict resembling a typical data point and
+a larger one carrying a stream of values. Only the part of Block.send that
+writes to the Links is timed, the logging and data checks being left out.
+
+The Links are emptied in between the timed sends, so that they never get full.
+The results are printed in the console as the mean time per sent value, in
+microseconds.
+"""
+
+import crappy
+import numpy as np
+from time import perf_counter
+
+N_SAMPLES = 5000
+
+
+def bench(block: crappy.Block, data: dict, legacy: bool) -> float:
+  """Returns the mean time per send call, in microseconds."""
+
+  total = 0.
+  for _ in range(N_SAMPLES):
+    t0 = perf_counter()
+    if legacy:
+      # Each Link serializes the data again
+      for link in block.outputs:
+        link.send(data)
+    else:
+      # The data is serialized once for all the Links
+      block._send_to_outputs(data)
+    total += perf_counter() - t0
+
+    # Emptying the Links so that they never get full
+    for link in block.outputs:
+      link.recv_chunk()
+
+  return total / N_SAMPLES * 1e6
+
+
+if __name__ == '__main__':
+
+  payloads = {'point': {'t(s)': 1.23456, 'F(N)': 123.456, 'x(mm)': 0.0123,
+                        'cmd': 2.5, 'index': 3},
+              'stream': {'t(s)': np.linspace(0, 1, 1000),
+                         'stream': np.random.rand(1000, 4)}}
+
+  for n_out in (1, 4, 8):
+    # The Blocks are never started, they are only used for their Links
+    sender = crappy.Block()
+    receivers = [crappy.Block() for _ in range(n_out)]
+    for receiver in receivers:
+      crappy.link(sender, receiver)
+
+    for name, payload in payloads.items():
+      legacy = bench(sender, payload, legacy=True)
+      once = bench(sender, payload, legacy=False)
+      print(f"{n_out} output(s), {name:>6}: once per Link {legacy:8.2f} µs, "
+            f"once per send {once:8.2f} µs, speed-up {legacy / once:4.2f}")
+
+    crappy.reset()
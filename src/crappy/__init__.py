@@ -34,4 +34,5 @@ prepare = Block.prepare_all
 launch = Block.launch_all
 start = Block.start_all
 renice = Block.renice_all
+group = Block.group
 reset = Block.reset
@@ -1,18 +1,20 @@
 # coding: utf-8
 
-from typing import Callable, Union, Optional, Tuple
+from typing import Callable, Union, Optional, Tuple, List, Dict, Any
 from pathlib import Path
 import numpy as np
 from time import time, sleep, strftime, gmtime
 from types import MethodType
-from multiprocessing import Array, Manager, Event, RLock, Pipe, Barrier
-from multiprocessing.sharedctypes import SynchronizedArray
-from multiprocessing import managers, synchronize, connection
+from multiprocessing import Event, Pipe, Barrier, Queue
+from queue import Empty
+from heapq import heappush, heappop
+from multiprocessing import synchronize, connection
 from threading import BrokenBarrierError
 import logging
 
 from .meta_block import Block
 from .camera_processes import Displayer, ImageSaver, CameraProcess
+from .camera_processes.frame_ring import FrameRing
 from ..camera import camera_dict, Camera as BaseCam, deprecated_cameras
 from ..tool.camera_config import CameraConfig
 from .._global import CameraPrepareError, CameraRuntimeError, CameraConfigError
@@ -79,6 +81,11 @@ class Camera(Block):
                img_shape: Optional[Union[Tuple[int, int],
                                          Tuple[int, int, int]]] = None,
                img_dtype: Optional[str] = None,
+               ring_size: int = 3,
+               save_workers: int = 0,
+               save_metadata_period: float = 1,
+               save_metadata_sidecar: bool = False,
+               process_workers: int = 1,
                **kwargs) -> None:
     """Sets the arguments and initializes the parent class.
     
@@ -165,7 +172,8 @@ class Camera(Block):
         :class:`~crappy.camera.Camera` object, or the default one generated in
         the :meth:`loop` method of this Block. Depending on the framerate of
         the camera and the performance of the computer, it is not guaranteed 
-        that all the acquired images will be recorded.
+        that all the acquired images will be recorded. Increasing
+        ``ring_size`` helps recording all of them.
 
         .. versionadded:: 1.5.10
       img_extension: The file extension for the recorded images, as a
@@ -198,7 +206,7 @@ class Camera(Block):
         recording the images. It should be one of:
         ::
 
-          'sitk', 'cv2', 'pil', 'npy'
+          'sitk', 'cv2', 'pil', 'npy', 'raw'
         
         They correspond to the modules :mod:`SimpleITK`, :mod:`cv2` (OpenCV),
         :mod:`PIL` (Pillow Fork), and :mod:`numpy`. Note that the ``'npy'``
@@ -208,8 +216,14 @@ class Camera(Block):
         Python must of course be installed. If not provided and ``save_images``
         is :obj:`True`, the backends are tried in the same order as given above
         and the first available one is used. ``'npy'`` is always available.
+        The ``'raw'`` backend is never selected by default. It appends all the
+        images to a few large container files instead of creating one file
+        per image, which is much lighter on the filesystem at high framerates.
+        It also ignores ``img_extension``. The containers can be read back
+        with :class:`~crappy.camera.FileReader`.
 
         .. versionadded:: 1.5.10
+        .. versionchanged:: 2.0.6 added the *'raw'* backend
       image_generator: A callable taking two :obj:`float` as arguments and
         returning an image as a :obj:`numpy.array`. **This argument is intended
         for use in the examples of Crappy, to apply an artificial strain on a
@@ -233,6 +247,54 @@ class Camera(Block):
         It is otherwise ignored.
 
         .. versionadded:: 2.0.0
+      ring_size: The number of frames the ring shared with the
+        :class:`~crappy.blocks.camera_processes.CameraProcess` can hold. The
+        :class:`~crappy.blocks.camera_processes.ImageSaver` reads all the
+        frames in order, so with more than one slot it can temporarily fall
+        behind the acquisition without missing frames. The frames it misses
+        anyway are reported in the logs, along with the maximum number of
+        frames that were waiting to be saved. The other CameraProcesses always
+        read the latest frame. Each slot takes as much memory as one frame.
+        The frames are shared without locks, so the ring must hold at least
+        two frames for the latest one to be readable while the next one is
+        being written. The default is 3.
+
+        .. versionadded:: 2.0.6
+      save_workers: The number of worker Processes encoding and writing the
+        images in parallel, if ``save_images`` is :obj:`True`. Useful when
+        saving a single image takes longer than the acquisition period, for
+        example with compressed formats like `png`. If ``0``, the default, the
+        images are saved one after the other. The names of the images and the
+        content of the ``metadata.csv`` file are the same in both cases.
+
+        .. versionadded:: 2.0.6
+      save_metadata_period: If ``save_images`` is :obj:`True`, the metadata of
+        the saved images is buffered and written to the ``metadata.csv`` file
+        in batches, at most this number of seconds apart. The batches are also
+        written every 100 images. The default is 1 second.
+
+        .. versionadded:: 2.0.6
+      save_metadata_sidecar: If ``save_images`` is :obj:`True`, also writes
+        the metadata to a binary ``metadata.bin`` file, that is cheaper to
+        write at very high framerates and can be loaded as a structured
+        :class:`numpy.ndarray` with
+        :func:`crappy.tool.metadata_file.read_metadata`.
+
+        .. versionadded:: 2.0.6
+      process_workers: The number of identical
+        :class:`~crappy.blocks.camera_processes.CameraProcess` processing the
+        images in parallel, for the children of this Block that perform image
+        processing. Each of them processes one frame out of
+        ``process_workers`` in turn, so that more frames can be processed when
+        the processing takes longer than the acquisition period. The data
+        they output is put back in the order of the frames before being sent
+        to the downstream Blocks, which delays it by a few frames. As they
+        each only see one frame out of ``process_workers``, the motion between
+        their successive frames is larger. The ring then holds at least
+        ``2 * process_workers`` frames. The default is 1, i.e. a single
+        CameraProcess processing the latest frame.
+
+        .. versionadded:: 2.0.6
       **kwargs: Any additional argument will be passed to the 
         :class:`~crappy.camera.Camera` object, and used as a kwarg to its
         :meth:`~crappy.camera.Camera.open` method.
@@ -246,7 +308,7 @@ class Camera(Block):
     self._save_proc: Optional[ImageSaver] = None
     self._display_proc: Optional[Displayer] = None
     self.process_proc: Optional[CameraProcess] = None
-    self._manager: Optional[managers.SyncManager] = None
+    self._process_procs: List[CameraProcess] = list()
 
     self._camera: Optional[BaseCam] = None
 
@@ -274,6 +336,14 @@ class Camera(Block):
     else:
       self._camera_name = 'Image Generator'
 
+    # Checking that the frame ring can be read without locks
+    if ring_size < 2:
+      raise ValueError(f"The ring_size argument should be at least 2, got "
+                       f"{ring_size} !")
+    if process_workers < 1:
+      raise ValueError(f"The process_workers argument should be at least 1, "
+                       f"got {process_workers} !")
+
     # Counting the number of instantiated cameras for each type
     if self._camera_name not in Camera.cam_count:
       Camera.cam_count[self._camera_name] = 1
@@ -290,19 +360,24 @@ class Camera(Block):
     self._camera_kwargs = kwargs
 
     # The synchronization objects are initialized later
-    self._img_array: Optional[SynchronizedArray] = None
-    self._img: Optional[np.ndarray] = None
-    self._metadata: Optional[managers.DictProxy] = None
+    self._ring_size = ring_size
+    self._process_workers = process_workers
+    self._ring: Optional[FrameRing] = None
     self._cam_barrier: Optional[synchronize.Barrier] = None
     self._stop_event_cam: Optional[synchronize.Event] = None
     self._overlay_conn_in: Optional[connection.Connection] = None
     self._overlay_conn_out: Optional[connection.Connection] = None
-    self._save_lock: Optional[synchronize.RLock] = None
-    self._disp_lock: Optional[synchronize.RLock] = None
-    self._proc_lock: Optional[synchronize.RLock] = None
+
+    # The data output by the processing workers, not yet sent in order, and
+    # the ImageUniqueID of the last frame processed by each worker
+    self._results: Optional[Queue] = None
+    self._pending_results: List[Tuple[int, int, Dict[str, Any]]] = list()
+    self._n_results = 0
+    self._processed: List[int] = list()
 
     self._loop_count = 0
     self._fps_count = 0
+    self._metadata_warned = False
     self._last_cam_fps = time()
 
     # Instantiating the ImageSaver if requested
@@ -311,6 +386,9 @@ class Camera(Block):
     self._save_folder = save_folder
     self._save_period = save_period
     self._save_backend = save_backend
+    self._save_workers = save_workers
+    self._save_metadata_period = save_metadata_period
+    self._save_metadata_sidecar = save_metadata_sidecar
 
     # Instantiating the Displayer window if requested
     self._display_images = display_images
@@ -320,14 +398,15 @@ class Camera(Block):
 
   def __del__(self) -> None:
     """Safety method called when deleting the Block and ensuring that all the
-    instantiated :class:`~crappy.blocks.camera_processes.CameraProcess` as well 
-    as the :obj:`~multiprocessing.Manager` are stopped before exiting.
+    instantiated :class:`~crappy.blocks.camera_processes.CameraProcess` are
+    stopped before exiting.
     
     If they did not stop in time, just terminates them.
     """
 
-    if self.process_proc is not None and self.process_proc.is_alive():
-      self.process_proc.terminate()
+    for proc in self._process_procs:
+      if proc.is_alive():
+        proc.terminate()
 
     if self._save_proc is not None and self._save_proc.is_alive():
       self._save_proc.terminate()
@@ -335,9 +414,6 @@ class Camera(Block):
     if self._display_proc is not None and self._display_proc.is_alive():
       self._display_proc.terminate()
 
-    if self._manager is not None:
-      self._manager.shutdown()
-
   def prepare(self) -> None:
     """Preparing the save folder, opening the camera and displaying the
     configuration GUI.
@@ -349,13 +425,8 @@ class Camera(Block):
     # Instantiating the synchronization objects
     self.log(logging.DEBUG, "Instantiating the multiprocessing "
                             "synchronization objects")
-    self._manager = Manager()
-    self._metadata = self._manager.dict()
     self._stop_event_cam = Event()
     self._overlay_conn_in, self._overlay_conn_out = Pipe()
-    self._save_lock = RLock()
-    self._disp_lock = RLock()
-    self._proc_lock = RLock()
 
     # Instantiating the ImageSaver CameraProcess
     if self._save_images:
@@ -367,7 +438,12 @@ class Camera(Block):
                                    save_folder=self._save_folder,
                                    save_period=self._save_period,
                                    save_backend=self._save_backend,
-                                   send_msg=send_msg)
+                                   send_msg=send_msg,
+                                   n_workers=self._save_workers,
+                                   metadata_flush_period=(
+                                       self._save_metadata_period),
+                                   metadata_sidecar=(
+                                       self._save_metadata_sidecar))
 
     # instantiating the Displayer CameraProcess
     if self._display_images:
@@ -376,16 +452,6 @@ class Camera(Block):
                                      framerate=self._framerate,
                                      backend=self._displayer_backend)
 
-    # Creating the Barrier for the synchronization of the CameraProcesses
-    n_proc = sum(int(proc is not None) for proc in (self.process_proc,
-                                                    self._save_proc,
-                                                    self._display_proc))
-    if not n_proc:
-      self.log(logging.WARNING, "The Block acquires images but does not save "
-                                "them, nor display them, nor process them !")
-
-    self._cam_barrier = Barrier(n_proc + 1)
-
     # Case when the images are artificially generated and not acquired
     if self._image_generator is not None:
       self.log(logging.INFO, "Setting the image generator camera")
@@ -432,43 +498,78 @@ class Camera(Block):
                        f"wasn't specified.\n Please specify it in the args, or"
                        f" enable the configuration window.")
 
-    # Instantiating the Array for sharing the frames with the CameraProcesses
-    self.log(logging.DEBUG, "Instantiating the shared objects")
-    self._img_array = Array(np.ctypeslib.as_ctypes_type(self._img_dtype),
-                            int(np.prod(self._img_shape)))
-    self._img = np.frombuffer(self._img_array.get_obj(),
-                              dtype=self._img_dtype).reshape(self._img_shape)
-
-    # Starting the CameraProcess for image processing if it was instantiated
+    # Copying the processing CameraProcess if several workers are requested
+    # The copies are made once the configuration window has set the regions
+    # of interest of the original instance
     if self.process_proc is not None:
+      self._process_procs = [self.process_proc]
+      if self._process_workers > 1:
+        self.log(logging.INFO, f"Instantiating {self._process_workers} "
+                               f"image processing workers")
+        self._process_procs.extend(self.process_proc.clone() for _
+                                   in range(self._process_workers - 1))
+        for i, proc in enumerate(self._process_procs):
+          proc.name = f"{proc.name}.Worker-{i + 1}"
+        self._results = Queue()
+        self._processed = [-1] * self._process_workers
+
+    # Creating the Barrier for the synchronization of the CameraProcesses
+    n_proc = len(self._process_procs) + sum(
+        int(proc is not None) for proc in (self._save_proc,
+                                           self._display_proc))
+    if not n_proc:
+      self.log(logging.WARNING, "The Block acquires images but does not save "
+                                "them, nor display them, nor process them !")
+
+    self._cam_barrier = Barrier(n_proc + 1)
+
+    # Instantiating the ring for sharing the frames with the CameraProcesses
+    # The workers each need a few frames to be available in the ring
+    n_slots = self._ring_size
+    if self._results is not None:
+      n_slots = max(n_slots, 2 * self._process_workers)
+    self.log(logging.DEBUG, f"Instantiating the shared frame ring with "
+                            f"{n_slots} slot(s)")
+    # The CameraProcesses reading the frames without copying them each need
+    # to lease a slot of the ring
+    procs = (*self._process_procs, self._save_proc, self._display_proc)
+    lessees = {proc: i for i, proc in enumerate(
+        proc for proc in procs if proc is not None and proc.zero_copy)}
+    self._ring = FrameRing(self._img_shape, self._img_dtype, n_slots,
+                           len(lessees))
+
+    # Starting the CameraProcess(es) for image processing if instantiated
+    for i, proc in enumerate(self._process_procs):
       self.log(logging.DEBUG, "Sharing the synchronization objects with the "
                               "image processing process")
+      # Only the first worker sends the overlays to the Displayer
       overlay_conn = (self._overlay_conn_in if self._display_proc is not None
-                      else None)
+                      and not i else None)
       labels = self.labels if self.labels is not None else None
-      self.process_proc.set_shared(array=self._img_array,
-                                   data_dict=self._metadata,
-                                   lock=self._proc_lock,
-                                   barrier=self._cam_barrier,
-                                   event=self._stop_event_cam,
-                                   shape=self._img_shape,
-                                   dtype=self._img_dtype,
-                                   to_draw_conn=overlay_conn,
-                                   outputs=self.outputs,
-                                   labels=labels,
-                                   log_queue=self._log_queue,
-                                   log_level=self._log_level,
-                                   display_freq=self.display_freq)
-      self.log(logging.INFO, "Starting the image processing process")
-      self.process_proc.start()
+      proc.set_shared(ring=self._ring,
+                      barrier=self._cam_barrier,
+                      event=self._stop_event_cam,
+                      shape=self._img_shape,
+                      dtype=self._img_dtype,
+                      to_draw_conn=overlay_conn,
+                      outputs=self.outputs if self._results is None else [],
+                      labels=labels,
+                      log_queue=self._log_queue,
+                      log_level=self._log_level,
+                      display_freq=self.display_freq,
+                      lessee=lessees.get(proc),
+                      results=self._results,
+                      worker=i,
+                      n_workers=len(self._process_procs))
+      self.log(logging.INFO, f"Starting the image processing process "
+                             f"{proc.name}")
+      proc.start()
 
     # Starting the ImageSaver CameraProcess if it was instantiated
     if self._save_proc is not None:
       self.log(logging.DEBUG, "Sharing the synchronization objects with the "
                               "image saver process")
-      self._save_proc.set_shared(array=self._img_array,
-                                 data_dict=self._metadata,
-                                 lock=self._save_lock,
+      self._save_proc.set_shared(ring=self._ring,
                                  barrier=self._cam_barrier,
                                  event=self._stop_event_cam,
                                  shape=self._img_shape,
@@ -478,7 +579,8 @@ class Camera(Block):
                                  labels=list(),
                                  log_queue=self._log_queue,
                                  log_level=self._log_level,
-                                 display_freq=self.display_freq)
+                                 display_freq=self.display_freq,
+                                 lessee=lessees.get(self._save_proc))
       self.log(logging.INFO, "Starting the image saver process")
       self._save_proc.start()
 
@@ -486,9 +588,7 @@ class Camera(Block):
     if self._display_proc is not None:
       self.log(logging.DEBUG, "Sharing the synchronization objects with the "
                               "image displayer process")
-      self._display_proc.set_shared(array=self._img_array,
-                                    data_dict=self._metadata,
-                                    lock=self._disp_lock,
+      self._display_proc.set_shared(ring=self._ring,
                                     barrier=self._cam_barrier,
                                     event=self._stop_event_cam,
                                     shape=self._img_shape,
@@ -498,7 +598,8 @@ class Camera(Block):
                                     labels=list(),
                                     log_queue=self._log_queue,
                                     log_level=self._log_level,
-                                    display_freq=self.display_freq)
+                                    display_freq=self.display_freq,
+                                    lessee=lessees.get(self._display_proc))
       self.log(logging.INFO, "Starting the image displayer process")
       self._display_proc.start()
 
@@ -541,6 +642,10 @@ class Camera(Block):
     if self._stop_event_cam.is_set():
       raise CameraRuntimeError
 
+    # Sending the data output by the processing workers, if any
+    if self._results is not None:
+      self._send_results()
+
     # Receiving the data from upstream Blocks
     data = self.recv_last_data(fill_missing=False)
 
@@ -580,14 +685,16 @@ class Camera(Block):
     if self._transform is not None:
       img = self._transform(img)
 
-    # Copying the metadata and the acquired frame into the shared objects for 
+    # Copying the metadata and the acquired frame into the frame ring for 
     # transfer to the CameraProcesses
-    # This is done with all the Locks acquired to avoid any conflict
-    with self._save_lock, self._disp_lock, self._proc_lock:
-      self.log(logging.DEBUG, f"Writing metadata to shared dict: {metadata}")
-      self._metadata.update(metadata)
-      self.log(logging.DEBUG, "Writing image to shared array")
-      np.copyto(self._img, img)
+    # The ring is lock-free, so this never waits for the CameraProcesses
+    self.log(logging.DEBUG, f"Writing image with metadata {metadata} to the "
+                            f"frame ring")
+    if not self._ring.write(img, metadata) and not self._metadata_warned:
+      self._metadata_warned = True
+      self.log(logging.WARNING, "The metadata of the frames is too large to "
+                                "be shared with the CameraProcesses, some "
+                                "fields are dropped or truncated !")
 
     self._loop_count += 1
 
@@ -606,8 +713,7 @@ class Camera(Block):
     :class:`~crappy.camera.Camera`, as well as all the 
     :class:`~crappy.blocks.camera_processes.CameraProcess` that were started.
     
-    If the CameraProcesses do not gently stop, they are terminated. Also stops
-    the :obj:`~multiprocessing.Manager` in charge of handling the metadata.
+    If the CameraProcesses do not gently stop, they are terminated.
     
     For stopping the image acquisition, the :meth:`~crappy.camera.Camera.close`
     method is called.
@@ -625,11 +731,28 @@ class Camera(Block):
       self._stop_event_cam.set()
       sleep(0.2)
 
-    # If the processing CameraProcess is not done, terminating it
-    if self.process_proc is not None and self.process_proc.is_alive():
-      self.log(logging.WARNING, "Image processing process not stopped, "
-                                "killing it !")
-      self.process_proc.terminate()
+    # The ImageSaver might need more time for saving the frames left in the
+    # ring and the ones being saved by its workers
+    if self._save_proc is not None and self._save_proc.is_alive():
+      self.log(logging.INFO, "Waiting for the image saver process to save the "
+                             "remaining images")
+      self._save_proc.join(5)
+
+    # The processing workers might need more time for processing the frames
+    # left in the ring, and their data must be received for them to stop
+    if self._results is not None:
+      t0 = time()
+      while any(proc.is_alive() for proc in self._process_procs) and \
+          time() - t0 < 5:
+        self._send_results(timeout=0.1)
+      self._send_results(final=True)
+
+    # If the processing CameraProcess(es) are not done, terminating them
+    for proc in self._process_procs:
+      if proc.is_alive():
+        self.log(logging.WARNING, f"Image processing process {proc.name} not "
+                                  f"stopped, killing it !")
+        proc.terminate()
     # If the ImageSaver CameraProcess is not done, terminating it
     if self._save_proc is not None and self._save_proc.is_alive():
       self.log(logging.WARNING, "Image saver process not stopped, "
@@ -641,9 +764,44 @@ class Camera(Block):
                                 "killing it !")
       self._display_proc.terminate()
 
-    # Closing the Manager handling the metadata
-    if self._manager is not None:
-      self._manager.shutdown()
+  def _send_results(self, timeout: float = 0, final: bool = False) -> None:
+    """Receives the data output by the processing workers, and sends it to
+    the downstream Blocks in the order of the ``'ImageUniqueID'`` of the
+    frames.
+
+    The workers each process their frames in order, so the data of a frame can
+    be sent once all the workers processed a frame at least as recent.
+
+    Args:
+      timeout: The maximum time to wait for data from the workers, in seconds.
+        If ``0``, does not wait.
+      final: If :obj:`True`, sends all the received data regardless of the
+        progress of the workers.
+
+    .. versionadded:: 2.0.6
+    """
+
+    while True:
+      try:
+        if timeout:
+          worker, frame_id, results = self._results.get(timeout=timeout)
+          timeout = 0
+        else:
+          worker, frame_id, results = self._results.get_nowait()
+      except Empty:
+        break
+
+      self._processed[worker] = frame_id
+      # The counter keeps the data of a same frame in order
+      for data in results:
+        heappush(self._pending_results, (frame_id, self._n_results, data))
+        self._n_results += 1
+
+    # Sending the data that cannot be preceded by data still to come
+    while self._pending_results and (
+        final or self._pending_results[0][0] <= min(self._processed)):
+      *_, data = heappop(self._pending_results)
+      self.send(data)
 
   def _configure(self) -> None:
     """This method should instantiate and start the 
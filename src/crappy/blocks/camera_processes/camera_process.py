@@ -1,9 +1,8 @@
 # coding: utf-8
 
-from multiprocessing import Process, managers, get_start_method, \
-  current_process
-from multiprocessing.synchronize import Event, RLock, Barrier
-from multiprocessing.sharedctypes import SynchronizedArray
+from multiprocessing import Process, get_start_method, current_process
+from copy import deepcopy
+from multiprocessing.synchronize import Event, Barrier
 from multiprocessing.connection import Connection
 from multiprocessing.queues import Queue
 from threading import BrokenBarrierError
@@ -18,6 +17,8 @@ from platform import system
 from ...links import Link
 from ..._global import LinkDataError
 from ...tool.camera_config import Overlay
+from .frame_ring import FrameRing, read_policies
+from ...tool.scheduling import set_scheduling
 
 
 class CameraProcess(Process):
@@ -35,19 +36,63 @@ class CameraProcess(Process):
   display, processing and recording on multiple CPU cores, to increase the 
   achieved FPS.
   
-  The Camera Block performs the acquisition, and makes the latest captured
-  image available to all the CameraProcess :obj:`~multiprocessing.Process` 
-  through an :obj:`~multiprocessing.Array`. They are then free to run at their
-  own rhythm, but are sure to always grab the latest available frame.
+  The Camera Block performs the acquisition, and makes the captured images
+  available to all the CameraProcess :obj:`~multiprocessing.Process` through a
+  :class:`~crappy.blocks.camera_processes.frame_ring.FrameRing` in shared
+  memory. They are then free to run at their own rhythm. How they read the
+  frames is set by the ``read_policy`` class attribute. With the
+  ``'latest'`` policy, the default, they always grab the latest available
+  frame and skip the ones acquired in the meantime. With the ``'lossless'``
+  policy, they read all the frames in order, as long as they do not fall
+  behind by more frames than the ring can hold. The frames overwritten before
+  being read are counted as overruns, and reported along with the maximum
+  number of frames waiting to be read when the Process stops.
   
   The instantiation, startup and termination of the CameraProcesses is all
   managed by the parent :class:`~crappy.blocks.Camera` Block, depending on the
   provided arguments. Users should normally not need to call this class
   themselves.
-  
+
+  Note:
+    On Linux, this Process inherits the CPU affinity and the real-time
+    scheduling policy of the Camera Block. They can be overridden for all the
+    instances of a class by setting its ``cpu_affinity``, ``rt_priority`` and
+    ``rt_policy`` class attributes, see
+    :func:`~crappy.tool.scheduling.set_scheduling`.
+
+  If the ``zero_copy`` class attribute is :obj:`True`, the frames are not
+  copied out of the frame ring. Instead, the CameraProcess leases the slot
+  holding the frame, and *self.img* is a read-only view on it. The slot is
+  not overwritten until the next frame is grabbed, so the view remains valid
+  during the whole :meth:`loop`. This saves one copy of each frame, but
+  *self.img* cannot be modified in place and must be copied if it is needed
+  after the end of :meth:`loop`.
+
+  Several identical instances can also process the frames in parallel, each
+  of them being a worker handling one frame out of ``n_workers`` in turn. The
+  workers then always read the frames with the ``'lossless'`` policy. The
+  first frame is read by all the workers, as it usually serves as a reference
+  for the processing, but only the data sent by the first worker for this
+  frame is kept. Instead of being sent directly to the downstream Blocks, the
+  data is sent to the Camera Block along with the ``'ImageUniqueID'`` of the
+  frame, so that it can be put back in order.
+
   .. versionadded:: 2.0.0
+  .. versionchanged:: 2.0.6
+     added the *read_policy* and *zero_copy* class attributes
+  .. versionchanged:: 2.0.6 possibility to run several workers in parallel
   """
 
+  # How the frames are read from the frame ring, 'latest' or 'lossless'
+  read_policy: str = 'latest'
+  # If True, self.img is a read-only view on a leased slot of the frame ring
+  zero_copy: bool = False
+
+  # Scheduling settings overriding the ones inherited from the parent Process
+  cpu_affinity: Optional[Iterable[int]] = None
+  rt_priority: Optional[int] = None
+  rt_policy: str = 'fifo'
+
   def __init__(self) -> None:
     """Initializes the parent class and all the instance attributes."""
 
@@ -61,9 +106,7 @@ class CameraProcess(Process):
     self._log_level: Optional[int] = None
 
     # These objects will be shared later by the Camera Block
-    self._img_array: Optional[SynchronizedArray] = None
-    self._data_dict: Optional[managers.DictProxy] = None
-    self._lock: Optional[RLock] = None
+    self._ring: Optional[FrameRing] = None
     self._cam_barrier: Optional[Barrier] = None
     self._stop_event: Optional[Event] = None
     self._shape: Optional[Tuple[int, int]] = None
@@ -81,10 +124,45 @@ class CameraProcess(Process):
     self._display_freq: Optional[bool] = None
     self._last_fps = time()
 
+    # The number of the next frame to read in the frame ring, and the
+    # statistics of the lossless read policy
+    self._cursor = 0
+    self._lessee: Optional[int] = None
+    self.high_water = 0
+    self.overruns = 0
+    self._last_overrun_warn = time()
+
+    # The position of this worker among the ones processing the frames in
+    # parallel, the number of the last frame read, and the data to send to
+    # the Camera Block for the current frame
+    self._worker = 0
+    self._n_workers = 1
+    self._results: Optional[Queue] = None
+    self._number: Optional[int] = None
+    self._sent: List[Dict[str, Any]] = list()
+
+  def clone(self) -> 'CameraProcess':
+    """Returns a copy of this CameraProcess, that can be started as a
+    separate :obj:`~multiprocessing.Process`.
+
+    The attributes of the original instance are deep-copied, so the copy
+    should be made before the CameraProcess is started and before
+    :meth:`set_shared` is called.
+
+    .. versionadded:: 2.0.6
+    """
+
+    # Giving the copy its own identity as a Process, the attributes of the
+    # Process itself cannot be copied
+    clone = type(self).__new__(type(self))
+    Process.__init__(clone, name=self.name)
+    for key, value in self.__dict__.items():
+      if key not in clone.__dict__:
+        clone.__dict__[key] = deepcopy(value)
+    return clone
+
   def set_shared(self,
-                 array: SynchronizedArray,
-                 data_dict: managers.DictProxy,
-                 lock: RLock,
+                 ring: FrameRing,
                  barrier: Barrier,
                  event: Event,
                  shape: Union[Tuple[int, int], Tuple[int, int, int]],
@@ -94,28 +172,26 @@ class CameraProcess(Process):
                  labels: Optional[List[str]],
                  log_queue: Queue,
                  log_level: Optional[int] = 20,
-                 display_freq: bool = False) -> None:
+                 display_freq: bool = False,
+                 lessee: Optional[int] = None,
+                 results: Optional[Queue] = None,
+                 worker: int = 0,
+                 n_workers: int = 1) -> None:
     """Method allowing the :class:`~crappy.blocks.Camera` Block to share
     :mod:`multiprocessing` synchronization objects with this class.
     
     Args:
-      array: The :obj:`~multiprocessing.Array` containing the last frame
-        acquired by the Camera Block.
-      data_dict: A :obj:`dict` managed by a :obj:`~multiprocessing.Manager` and
-        containing the metadata of the last acquired frame.
-      lock: A :obj:`~multiprocessing.RLock` ensuring that the CameraProcess and
-        the Camera Block do not try to access the shared array at the same
-        time.
+      ring: The :class:`~crappy.blocks.camera_processes.frame_ring.FrameRing`
+        containing the last frames acquired by the Camera Block and their
+        metadata.
       barrier: A :obj:`~multiprocessing.Barrier` ensuring that all the
         CameraProcesses wait for a start signal from the Camera Block before
         starting to run.
       event: A :obj:`~multiprocessing.Event` indicating to the CameraProcess
         when to stop running. It is either set by the Camera Block, or by a
         CameraProcess.
-      shape: The expected shape of the image, as a :obj:`tuple`. It is 
-        necessary as the frames are shared as a one-dimensional array.
-      dtype: The expected dtype of the image. It is necessary for 
-        reconstructing the image from the one-dimensional shared array.
+      shape: The expected shape of the image, as a :obj:`tuple`.
+      dtype: The expected dtype of the image.
       to_draw_conn: A :obj:`~multiprocessing.Connection` for sending or
         receiving :class:`~crappy.tool.camera_config.config_tools.Overlay`
         objects to draw on top of the displayed image.
@@ -129,11 +205,35 @@ class CameraProcess(Process):
         :obj:`int`.
       display_freq: If :obj:`True`, the looping frequency of this class will be
         displayed while running.
+      lessee: The index of this CameraProcess among the lessees of the frame
+        ring, if ``zero_copy`` is :obj:`True`.
+      results: If several workers process the frames in parallel, a
+        :obj:`~multiprocessing.Queue` for sending the data to the Camera
+        Block instead of sending it to the ``outputs``.
+      worker: The index of this CameraProcess among the workers processing
+        the frames in parallel.
+      n_workers: The number of workers processing the frames in parallel.
+
+    .. versionchanged:: 2.0.6 *array* and *data_dict* arguments replaced by
+       *ring*
+    .. versionadded:: 2.0.6 *lessee*, *results*, *worker* and *n_workers*
+       arguments
+    .. versionremoved:: 2.0.6 *lock* argument
     """
 
-    self._img_array = array
-    self._data_dict = data_dict
-    self._lock = lock
+    if self.read_policy not in read_policies:
+      raise ValueError(f"The read policy of {type(self).__name__} should be "
+                       f"one of {read_policies}, got {self.read_policy} "
+                       f"instead !")
+
+    self._ring = ring
+    self._lessee = lessee
+    self._results = results
+    self._worker = worker
+    self._n_workers = n_workers
+    # The workers must not miss any of the frames they are assigned
+    if n_workers > 1:
+      self.read_policy = 'lossless'
     self._cam_barrier = barrier
     self._stop_event = event
     self._shape = shape
@@ -166,6 +266,8 @@ class CameraProcess(Process):
       # First thing, setting the Logger
       self._set_logger()
       self.log(logging.INFO, "Logger configured")
+      set_scheduling(self.log, self.cpu_affinity, self.rt_priority,
+                     self.rt_policy)
 
       # Initializing the CameraProcess, and breaking the Barrier to warn the
       # other CameraProcesses in case something goes wrong
@@ -190,7 +292,7 @@ class CameraProcess(Process):
         # Only looping if a new image is available
         if self._get_data():
           self.log(logging.DEBUG, "Running the loop method")
-          self.loop()
+          self._process_frame()
           self.fps_count += 1
 
         # Displaying the looping frequency is required
@@ -203,6 +305,14 @@ class CameraProcess(Process):
             self.fps_count = 0
 
       self.log(logging.INFO, "Stop event set, stopping the processing")
+      if self.read_policy == 'lossless':
+        # Handling the frames left in the ring, so that none is lost
+        while self._get_data():
+          self._process_frame()
+        self.log(logging.INFO,
+                 f"Frame ring high-water mark: {self.high_water}/"
+                 f"{self._ring.n_slots} slots, {self.overruns} frame(s) "
+                 f"overwritten before being read")
 
     # Case when CTRL+C was pressed
     except KeyboardInterrupt:
@@ -300,6 +410,14 @@ class CameraProcess(Process):
                                         f"ensure that the data is given as an "
                                         f"iterable, as well as the labels.")
 
+    # With several workers, the data is sent to the Camera Block once the
+    # frame is processed, except for the first frame if it is not assigned
+    # to this worker
+    if self._results is not None:
+      if self._worker == 0 or self._number != 0:
+        self._sent.append(data)
+      return
+
     # Sending the data to the downstream Blocks
     for link in self._outputs:
       self._logger.log(logging.DEBUG, f"Sending {data} to Link {link.name}")
@@ -345,43 +463,155 @@ class CameraProcess(Process):
       return
     self._logger.log(level, msg)
 
+  def _process_frame(self) -> None:
+    """Calls :meth:`loop` on the frame that was just read.
+
+    If several workers process the frames in parallel, then sends the data to
+    the Camera Block along with the ``'ImageUniqueID'`` of the frame. This is
+    done even if there's no data, so that the Camera Block knows the frame was
+    processed.
+
+    .. versionadded:: 2.0.6
+    """
+
+    self.loop()
+
+    if self._results is not None:
+      self._results.put((self._worker, self.metadata['ImageUniqueID'],
+                         self._sent))
+      self._sent = list()
+
   def _get_data(self) -> bool:
-    """This method allows to grab the latest available frame.
+    """This method allows to grab the next frame to process.
 
-    It first acquired the :obj:`~multiprocessing.RLock` protecting the shared
-    :obj:`~multiprocessing.Array` containing the image, then copies the image
-    locally and releases the Lock. It also copies the metadata associated to
-    the image.
+    It looks for the next frame to read in the shared
+    :class:`~crappy.blocks.camera_processes.frame_ring.FrameRing` according to
+    the read policy. If there is one, it copies the frame and its metadata
+    locally. No lock is involved, if the frame is overwritten by the
+    :class:`~crappy.blocks.Camera` Block during the copy, the copy is
+    discarded and the next frame is looked for.
 
     Returns:
       :obj:`True` in case a frame was acquired and needs to be handled, or
       :obj:`False` if no frame was grabbed and nothing should be done.
     """
 
-    # Acquiring the Lock to avoid conflicts with other CameraProcesses
-    with self._lock:
-
-      # In case there's no frame grabbed yet
-      if 'ImageUniqueID' not in self._data_dict:
+    # Looking for a new frame until one is read without being overwritten
+    while True:
+      number = self._next_frame()
+      if number is None:
         return False
 
-      # In case the frame in buffer was already handled during a previous loop
-      if self._data_dict['ImageUniqueID'] == self.metadata['ImageUniqueID']:
-        return False
+      if self._read_frame(number):
+        return True
+
+  def _next_frame(self) -> Optional[int]:
+    """Returns the number of the next frame to read in the frame ring
+    according to the read policy, or :obj:`None` if there is no new frame.
+
+    With the ``'latest'`` policy, the frames acquired since the last read are
+    skipped. With the ``'lossless'`` policy, all the frames are returned in
+    order, except those that were already overwritten in the ring. If several
+    workers process the frames in parallel, only the frames assigned to this
+    worker are returned.
 
-      # Copying the metadata
-      self.metadata = self._data_dict.copy()
+    .. versionadded:: 2.0.6
+    """
+
+    head = self._ring.head
+
+    # In case there's no new frame since the last read
+    if head <= self._cursor:
+      return None
+
+    if self.read_policy == 'latest':
+      self._cursor = head
+      return head - 1
+
+    # Skipping the frames assigned to the other workers
+    self._cursor = self._assigned(self._cursor)
+    if head <= self._cursor:
+      return None
+
+    # Keeping track of the number of slots holding frames waiting to be read
+    backlog = head - self._cursor
+    self.high_water = max(self.high_water, min(backlog, self._ring.n_slots))
+
+    # Skipping the frames that were already overwritten
+    if backlog > self._ring.n_slots:
+      oldest = self._assigned(head - self._ring.n_slots)
+      self._count_overruns(len(range(self._cursor, oldest, self._n_workers)))
+      self._cursor = oldest
+      if head <= self._cursor:
+        return None
+
+    number = self._cursor
+    self._cursor += 1
+    return number
+
+  def _assigned(self, number: int) -> int:
+    """Returns the number of the first frame starting from the given one that
+    is assigned to this worker.
+
+    The first frame is assigned to all the workers, and the next ones are
+    assigned to each worker in turn.
 
-      self.log(logging.DEBUG, f"Got new image to process with id "
-                              f"{self.metadata['ImageUniqueID']}")
+    .. versionadded:: 2.0.6
+    """
+
+    if self._n_workers == 1 or number == 0:
+      return number
+    return number + (self._worker - (number - 1)) % self._n_workers
+
+  def _read_frame(self, number: int) -> bool:
+    """Copies the frame with the given number from the frame ring to the
+    *self.img* attribute, and its metadata to *self.metadata*.
+
+    If ``zero_copy`` is :obj:`True`, *self.img* is instead set to a read-only
+    view on the slot holding the frame, that is leased until the next call.
+
+    Returns:
+      :obj:`True` if the frame was read, or :obj:`False` if it was overwritten
+      before or while being copied. In that case, *self.img* and
+      *self.metadata* might be left in an inconsistent state.
 
-      # Copying the frame
-      np.copyto(self.img,
-                np.frombuffer(self._img_array.get_obj(),
-                              dtype=self._dtype).reshape(self._shape))
+    .. versionadded:: 2.0.6
+    """
 
+    # Leasing the slot holding the frame instead of copying it
+    if self._lessee is not None:
+      leased = self._ring.lease(number, self._lessee)
+      if leased is not None:
+        self.img, metadata = leased
+      else:
+        metadata = None
+    else:
+      metadata = self._ring.read(number, self.img)
+
+    if metadata is None:
+      self.log(logging.DEBUG, f"Frame {number} was overwritten while being "
+                              f"read")
+      if self.read_policy == 'lossless':
+        self._count_overruns(1)
+      return False
+
+    self.metadata = metadata
+    self._number = number
+    self.log(logging.DEBUG, f"Got new image to process with id "
+                            f"{self.metadata['ImageUniqueID']}")
     return True
 
+  def _count_overruns(self, lost: int) -> None:
+    """Counts the frames that were overwritten before being read with the
+    ``'lossless'`` policy, and warns the user at most once per second."""
+
+    self.overruns += lost
+    if time() - self._last_overrun_warn > 1:
+      self._last_overrun_warn = time()
+      self.log(logging.WARNING, f"{self.overruns} frame(s) overwritten before "
+                                f"being read so far, consider increasing the "
+                                f"size of the frame ring")
+
   def _set_logger(self) -> None:
     """Initializes the :obj:`~logging.Logger` for the CameraProcess.
 
@@ -8,6 +8,8 @@ from time import sleep
 
 from .camera_process import CameraProcess
 from ...tool.image_processing import DICVETool
+from ...tool.image_processing.downscale import (downscale_image,
+                                                downscale_spots, upscale_spots)
 from ...tool.camera_config import SpotsBoxes
 
 
@@ -24,9 +26,22 @@ class DICVEProcess(CameraProcess):
   to the :class:`~crappy.blocks.camera_processes.Displayer` CameraProcess for
   display.
   
+  The patches are tracked directly on a read-only view of the frame ring of
+  the DICVE Block, so the frames are never copied.
+
+  For high-resolution cameras, the patches can also be tracked on downscaled
+  frames, and optionally at full resolution on one frame out of a given number
+  only. The positions and displacements sent to the downstream Blocks are
+  always expressed in full-resolution pixels.
+
   .. versionadded:: 2.0.0
+  .. versionchanged:: 2.0.6 reading the frames without copying them
+  .. versionadded:: 2.0.6 *downscale* and *full_res_period* arguments
+  .. versionadded:: 2.0.6 *patch_threads* argument
   """
 
+  zero_copy = True
+
   def __init__(self,
                patches: SpotsBoxes,
                method: str = 'Disflow',
@@ -41,7 +56,10 @@ class DICVEProcess(CameraProcess):
                border: float = 0.2,
                safe: bool = True,
                follow: bool = True,
-               raise_on_exit: bool = True) -> None:
+               raise_on_exit: bool = True,
+               downscale: int = 1,
+               full_res_period: Optional[int] = None,
+               patch_threads: int = 1) -> None:
     """Sets the arguments and initializes the parent class.
 
     Args:
@@ -111,8 +129,36 @@ class DICVEProcess(CameraProcess):
       raise_on_exit: If :obj:`True`, raises an exception and stops the test
         when losing the patches. Otherwise, simply stops processing but lets 
         the test go on.
+      downscale: If greater than ``1``, the frames are downscaled by this
+        integer factor by averaging blocks of pixels before tracking the
+        patches, and the positions and displacements are scaled back to
+        full-resolution pixels. This is much faster on large images, at the
+        cost of a lower accuracy.
+
+        .. versionadded:: 2.0.6
+      full_res_period: If given along with a *downscale* factor, the patches
+        are tracked at full resolution on one frame out of this number instead
+        of downscaled, to periodically get accurate values. If the patches
+        are followed, the downscaled ones are then moved to the positions
+        found at full resolution. If :obj:`None`, the default, all the frames
+        are downscaled.
+
+        .. versionadded:: 2.0.6
+      patch_threads: The number of threads calculating the displacements of
+        the patches in parallel. This argument is passed to the
+        :obj:`~crappy.tool.image_processing.DICVETool` and not used in this
+        class.
+
+        .. versionadded:: 2.0.6
     """
 
+    if downscale < 1:
+      raise ValueError(f"The downscale argument should be at least 1, got "
+                       f"{downscale} !")
+    if full_res_period is not None and full_res_period < 1:
+      raise ValueError(f"The full_res_period argument should be at least 1, "
+                       f"got {full_res_period} !")
+
     super().__init__()
 
     # Arguments to pass to the DICVETool
@@ -129,31 +175,41 @@ class DICVEProcess(CameraProcess):
     self._border = border
     self._safe = safe
     self._follow = follow
+    self._patch_threads = patch_threads
     
     # Other attributes
     self._raise_on_exit = raise_on_exit
+    self._downscale = downscale
+    self._full_res_period = full_res_period
     self._disve: Optional[DICVETool] = None
+    self._full_res: Optional[DICVETool] = None
+    self._n_frames = 0
     self._img0_set = False
     self._lost_patch = False
 
   def init(self) -> None:
     """Instantiates the :obj:`~crappy.tool.image_processing.DICVETool` that
-    will perform the image correlation."""
+    will perform the image correlation.
+
+    If the frames are downscaled, the DICVETool tracks downscaled patches, and
+    a second one is instantiated for the full-resolution frames if requested.
+    """
 
     self.log(logging.INFO, "Instantiating the Disve tool")
-    self._disve = DICVETool(patches=self._patches,
-                            method=self._method,
-                            alpha=self._alpha,
-                            delta=self._delta,
-                            gamma=self._gamma,
-                            finest_scale=self._finest_scale,
-                            iterations=self._iterations,
-                            gradient_iterations=self._gradient_iterations,
-                            patch_size=self._patch_size,
-                            patch_stride=self._patch_stride,
-                            border=self._border,
-                            safe=self._safe,
-                            follow=self._follow)
+
+    if self._downscale == 1:
+      self._disve = self._make_tool(self._patches)
+      return
+
+    self.log(logging.INFO, f"Tracking the patches on frames downscaled by a "
+                           f"factor {self._downscale}")
+    self._disve = self._make_tool(downscale_spots(self._patches,
+                                                  self._downscale))
+
+    if self._full_res_period is not None:
+      self.log(logging.INFO, f"Tracking the patches at full resolution on one "
+                             f"frame out of {self._full_res_period}")
+      self._full_res = self._make_tool(self._patches)
 
   def loop(self) -> None:
     """This method grabs the latest frame and gives it for processing to the
@@ -174,17 +230,37 @@ class DICVEProcess(CameraProcess):
         # On the first frame, initialize the correlation
         if not self._img0_set:
           self.log(logging.INFO, "Setting the reference image")
-          self._disve.set_img0(np.copy(self.img))
+          img0 = np.copy(self.img)
+          self._disve.set_img0(downscale_image(img0, self._downscale))
+          if self._full_res is not None:
+            self._full_res.set_img0(img0)
           self._img0_set = True
           return
 
         # Calculating the displacement and sending it to downstream Blocks
         self.log(logging.DEBUG, "Processing the received image")
-        data = self._disve.calculate_displacement(self.img)
+        self._n_frames += 1
+        if (self._full_res is not None
+            and not self._n_frames % self._full_res_period):
+          data = self._full_res.calculate_displacement(self.img)
+          patches = self._full_res.patches
+          if self._follow:
+            self._reseed()
+        elif self._downscale == 1:
+          data = self._disve.calculate_displacement(self.img)
+          patches = self._disve.patches
+        else:
+          centers, eyy, exx, disps = self._disve.calculate_displacement(
+            downscale_image(self.img, self._downscale))
+          # The strains are not affected by the downscaling
+          factor = self._downscale
+          data = ([(y * factor, x * factor) for y, x in centers], eyy, exx,
+                  [(y * factor, x * factor) for y, x in disps])
+          patches = upscale_spots(self._disve.patches, factor)
         self.send([self.metadata['t(s)'], self.metadata, *data])
 
         # Sending the patches to the Displayer for display
-        self.send_to_draw(self._disve.patches)
+        self.send_to_draw(patches)
 
       # If the patches are lost, deciding whether to raise exception or not
       except RuntimeError as exc:
@@ -199,3 +275,44 @@ class DICVEProcess(CameraProcess):
     else:
       self.fps_count -= 1
       sleep(0.1)
+
+  def finish(self) -> None:
+    """Stops the threads of the
+    :obj:`~crappy.tool.image_processing.DICVETool`, if any."""
+
+    for tool in (self._disve, self._full_res):
+      if tool is not None:
+        tool.close()
+
+  def _reseed(self) -> None:
+    """Moves the downscaled patches to the positions of the full-resolution
+    ones, so that the two DICVETools keep tracking the same patches instead of
+    drifting apart."""
+
+    factor = self._downscale
+    patches = downscale_spots(self._full_res.patches, factor)
+    for patch, full in zip(patches, self._full_res.patches):
+      if patch is not None:
+        patch.x_disp = full.x_disp / factor
+        patch.y_disp = full.y_disp / factor
+    self._disve.set_patches(patches)
+
+  def _make_tool(self, patches: SpotsBoxes) -> DICVETool:
+    """Instantiates and returns a
+    :obj:`~crappy.tool.image_processing.DICVETool` tracking the given
+    patches."""
+
+    return DICVETool(patches=patches,
+                     method=self._method,
+                     alpha=self._alpha,
+                     delta=self._delta,
+                     gamma=self._gamma,
+                     finest_scale=self._finest_scale,
+                     iterations=self._iterations,
+                     gradient_iterations=self._gradient_iterations,
+                     patch_size=self._patch_size,
+                     patch_stride=self._patch_stride,
+                     border=self._border,
+                     safe=self._safe,
+                     follow=self._follow,
+                     patch_threads=self._patch_threads)
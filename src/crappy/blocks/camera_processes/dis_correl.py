@@ -8,6 +8,9 @@ import logging.handlers
 from .camera_process import CameraProcess
 from ...tool.camera_config import Box, SpotsBoxes
 from ...tool.image_processing import DISCorrelTool
+from ...tool.image_processing.downscale import (downscale_image,
+                                                downscale_box,
+                                                downscale_fields)
 
 
 class DISCorrelProcess(CameraProcess):
@@ -23,9 +26,21 @@ class DISCorrelProcess(CameraProcess):
   to the :class:`~crappy.blocks.camera_processes.Displayer` CameraProcess for
   display.
 
+  The optical flow is computed directly on a read-only view of the frame ring
+  of the DISCorrel Block, so the frames are never copied.
+
+  For high-resolution cameras, the correlation can also be performed on
+  downscaled frames, and optionally at full resolution on one frame out of a
+  given number only. The values sent to the downstream Blocks are always
+  expressed in full-resolution pixels.
+
   .. versionadded:: 2.0.0
+  .. versionchanged:: 2.0.6 reading the frames without copying them
+  .. versionadded:: 2.0.6 *downscale* and *full_res_period* arguments
   """
 
+  zero_copy = True
+
   def __init__(self,
                patch: Box,
                fields: Optional[List[Union[str, np.ndarray]]] = None,
@@ -38,7 +53,11 @@ class DISCorrelProcess(CameraProcess):
                init: bool = True,
                patch_size: int = 8,
                patch_stride: int = 3,
-               residual: bool = False) -> None:
+               residual: bool = False,
+               roi_margin: Optional[int] = None,
+               residual_stride: int = 1,
+               downscale: int = 1,
+               full_res_period: Optional[int] = None) -> None:
     """Sets the arguments and initializes the parent class.
     
     Args:
@@ -107,8 +126,40 @@ class DISCorrelProcess(CameraProcess):
       residual: If :obj:`True`, the residuals will be computed at each new
         frame and sent to downstream Blocks, by default under the ``'res'``
         label.
+      roi_margin: If given, the optical flow is only calculated on the patch
+        extended by this number of pixels on each side. This argument is passed
+        to the :obj:`~crappy.tool.image_processing.DISCorrelTool` and not used
+        in this class.
+
+        .. versionadded:: 2.0.6
+      residual_stride: When computing the residuals, only one pixel out of this
+        number along each axis is considered. This argument is passed to the
+        :obj:`~crappy.tool.image_processing.DISCorrelTool` and not used in this
+        class.
+
+        .. versionadded:: 2.0.6
+      downscale: If greater than ``1``, the frames are downscaled by this
+        integer factor by averaging blocks of pixels before performing the
+        correlation, and the displacements are scaled back to full-resolution
+        pixels. This is much faster on large images, at the cost of a lower
+        accuracy. The *roi_margin* is also divided by this factor.
+
+        .. versionadded:: 2.0.6
+      full_res_period: If given along with a *downscale* factor, one frame out
+        of this number is correlated at full resolution instead of downscaled,
+        to periodically get accurate values. If :obj:`None`, the default, all
+        the frames are downscaled.
+
+        .. versionadded:: 2.0.6
     """
 
+    if downscale < 1:
+      raise ValueError(f"The downscale argument should be at least 1, got "
+                       f"{downscale} !")
+    if full_res_period is not None and full_res_period < 1:
+      raise ValueError(f"The full_res_period argument should be at least 1, "
+                       f"got {full_res_period} !")
+
     super().__init__()
 
     # Arguments to pass to the DISCorrelTool
@@ -123,30 +174,52 @@ class DISCorrelProcess(CameraProcess):
     self._gradient_iterations = gradient_iterations
     self._patch_size = patch_size
     self._patch_stride = patch_stride
+    self._roi_margin = roi_margin
+    self._residual_stride = residual_stride
     
     # Other attributes
     self._residual = residual
+    self._downscale = downscale
+    self._full_res_period = full_res_period
     self._dis_correl: Optional[DISCorrelTool] = None
+    self._full_res: Optional[DISCorrelTool] = None
+    self._n_values = 0
+    self._n_frames = 0
     self._img0_set = False
 
   def init(self) -> None:
     """Instantiates the :obj:`~crappy.tool.image_processing.DISCorrelTool` that
-    will perform the Dense Inverse Search."""
+    will perform the Dense Inverse Search.
+
+    If the frames are downscaled, the DISCorrelTool works on the downscaled
+    patch and fields, and a second one is instantiated for the full-resolution
+    frames if requested.
+    """
 
     self.log(logging.INFO, "Instantiating the Discorrel tool")
-    self._dis_correl = DISCorrelTool(
-        box=self._box,
-        fields=self._fields,
-        alpha=self._alpha,
-        delta=self._delta,
-        gamma=self._gamma,
-        finest_scale=self._finest_scale,
-        init=self._init,
-        iterations=self._iterations,
-        gradient_iterations=self._gradient_iterations,
-        patch_size=self._patch_size,
-        patch_stride=self._patch_stride)
-    self._dis_correl.set_box()
+
+    if self._downscale == 1:
+      self._dis_correl = self._make_tool(self._box, self._fields,
+                                         self._roi_margin)
+      return
+
+    self.log(logging.INFO, f"Correlating on frames downscaled by a factor "
+                           f"{self._downscale}")
+    # Same default fields as in the DISCorrelTool
+    fields = self._fields if self._fields is not None else ['x', 'y', 'exx',
+                                                            'eyy']
+    self._n_values = len(fields)
+    margin = (None if self._roi_margin is None
+              else -(-self._roi_margin // self._downscale))
+    self._dis_correl = self._make_tool(
+        downscale_box(self._box, self._downscale),
+        downscale_fields(fields, self._box, self._downscale), margin)
+
+    if self._full_res_period is not None:
+      self.log(logging.INFO, f"Correlating at full resolution one frame out "
+                             f"of {self._full_res_period}")
+      self._full_res = self._make_tool(self._box, self._fields,
+                                       self._roi_margin)
 
   def loop(self) -> None:
     """This method grabs the latest frame and gives it for processing to the
@@ -162,14 +235,51 @@ class DISCorrelProcess(CameraProcess):
     # On the first frame, initializes the dense inverse search
     if not self._img0_set:
       self.log(logging.INFO, "Setting the reference image")
-      self._dis_correl.set_img0(np.copy(self.img))
+      img0 = np.copy(self.img)
+      self._dis_correl.set_img0(downscale_image(img0, self._downscale))
+      if self._full_res is not None:
+        self._full_res.set_img0(img0)
       self._img0_set = True
       return
 
     # Calculating the fields and sending them to downstream Blocks
     self.log(logging.DEBUG, "Processing the received image")
-    data = self._dis_correl.get_data(self.img, self._residual)
+    self._n_frames += 1
+    if (self._full_res is not None
+        and not self._n_frames % self._full_res_period):
+      data = self._full_res.get_data(self.img, self._residual)
+    else:
+      data = self._dis_correl.get_data(
+          downscale_image(self.img, self._downscale), self._residual)
+      # The values are in downscaled pixels, but the residual is not affected
+      for i in range(self._n_values):
+        data[i] *= self._downscale
     self.send([self.metadata['t(s)'], self.metadata, *data])
 
     # Sending the ROI to the Displayer for display
-    self.send_to_draw(SpotsBoxes(self._dis_correl.box))
+    self.send_to_draw(SpotsBoxes(self._box))
+
+  def _make_tool(self,
+                 box: Box,
+                 fields: Optional[List[Union[str, np.ndarray]]],
+                 roi_margin: Optional[int]) -> DISCorrelTool:
+    """Instantiates and returns a
+    :obj:`~crappy.tool.image_processing.DISCorrelTool` working on the given
+    patch and fields."""
+
+    tool = DISCorrelTool(
+        box=box,
+        fields=fields,
+        alpha=self._alpha,
+        delta=self._delta,
+        gamma=self._gamma,
+        finest_scale=self._finest_scale,
+        init=self._init,
+        iterations=self._iterations,
+        gradient_iterations=self._gradient_iterations,
+        patch_size=self._patch_size,
+        patch_stride=self._patch_stride,
+        roi_margin=roi_margin,
+        residual_stride=self._residual_stride)
+    tool.set_box()
+    return tool
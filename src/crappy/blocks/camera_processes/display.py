@@ -37,9 +37,15 @@ class Displayer(CameraProcess):
   :mod:`cv2` (OpenCV), or using :mod:`matplotlib`. OpenCV is by far the fastest
   and most convenient.
 
+  The frames are displayed from a read-only view on the frame ring of the
+  Camera Block, without being copied first.
+
   .. versionadded:: 2.0.0
+  .. versionchanged:: 2.0.6 reading the frames without copying them
   """
 
+  zero_copy = True
+
   def __init__(self,
                title: str,
                framerate: float,
@@ -132,31 +138,15 @@ class Displayer(CameraProcess):
       :obj:`False` if no frame was grabbed and nothing should be done.
     """
 
-    # Acquiring the Lock to avoid conflicts with other CameraProcesses
-    with self._lock:
-
-      # In case there's no frame grabbed yet
-      if 'ImageUniqueID' not in self._data_dict:
-        return False
-
-      # In case the frame in buffer was already handled during a previous loop,
-      # or it's too early to grab a new frame because of the target framerate
-      if self._data_dict['ImageUniqueID'] == self.metadata['ImageUniqueID'] \
-          or time() - self._last_upd < 1 / self._framerate:
-        return False
+    # In case it's too early to grab a new frame because of the target 
+    # framerate
+    if time() - self._last_upd < 1 / self._framerate:
+      return False
 
-      # Copying the metadata
-      self.metadata = self._data_dict.copy()
-      self._last_upd = time()
-
-      self.log(logging.DEBUG, f"Got new image to process with id "
-                              f"{self.metadata['ImageUniqueID']}")
-
-      # Copying the frame
-      np.copyto(self.img,
-                np.frombuffer(self._img_array.get_obj(),
-                              dtype=self._dtype).reshape(self._shape))
+    if not super()._get_data():
+      return False
 
+    self._last_upd = time()
     return True
 
   def loop(self) -> None:
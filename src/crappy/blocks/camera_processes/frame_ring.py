@@ -0,0 +1,235 @@
+# coding: utf-8
+
+from multiprocessing import RawArray, RawValue
+from typing import Dict, Any, Tuple, Union, Optional
+import numpy as np
+
+from .shared_metadata import SharedMetadata
+
+# The possible policies for reading frames from the ring
+read_policies = ('latest', 'lossless')
+
+
+class FrameRing:
+  """Ring of frame slots in shared memory, through which the
+  :class:`~crappy.blocks.Camera` Block shares the acquired frames with its
+  :class:`~crappy.blocks.camera_processes.CameraProcess`.
+
+  Each slot holds one frame and its metadata, stored in a
+  :class:`~crappy.blocks.camera_processes.shared_metadata.SharedMetadata`
+  record. The frames are written in sequence, the frame number ``n`` being
+  written to the slot ``n % n_slots``. The number of frames written so far is
+  available in :attr:`head`, and each consumer keeps its own read cursor.
+
+  With a single slot, only the latest frame is available. With more slots, a
+  consumer that temporarily processes frames slower than they are acquired
+  can catch up later without missing any frame, as long as it does not fall
+  more than ``n_slots`` frames behind.
+
+  The ring is lock-free, so that the producer never waits for the consumers.
+  Each slot is protected by a sequence counter, that is odd while the slot is
+  being written and otherwise indicates the number of the frame it holds. A
+  consumer checks the counter before and after copying a frame, and discards
+  the copy if the slot was overwritten in the meantime. With at least two
+  slots, the latest frame can be read while the next one is being written.
+
+  Consumers can also lease a slot, and get a read-only view on the frame it
+  holds instead of copying it. The producer does not overwrite the leased
+  slots, it writes to extra slots instead so that the ring still holds
+  ``n_slots`` frames available for reading. Leasing a slot and choosing the
+  slot to write are both done by first publishing the choice and then
+  checking the other side's choice, so that either the consumer or the
+  producer backs off in case of conflict.
+
+  Note:
+    The counters are plain shared memory, and Python offers no memory fence.
+    The handshake between the producer and the consumers therefore assumes
+    that a store to shared memory is visible to the other Processes before any
+    later load from the same Process is performed, which holds on x86 but not
+    on weakly-ordered architectures like ARM. On the latter, a lease could be
+    granted on a slot the producer has just chosen. The consumers check the
+    sequence counter again after reading the metadata of a leased slot, which
+    makes such a conflict unlikely but not impossible.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self,
+               shape: Union[Tuple[int, int], Tuple[int, int, int]],
+               dtype,
+               n_slots: int = 1,
+               n_lessees: int = 0) -> None:
+    """Allocates the shared memory holding the frames and their metadata.
+
+    Args:
+      shape: The shape of the frames, as a :obj:`tuple`.
+      dtype: The dtype of the frames.
+      n_slots: The number of frames the ring can hold.
+      n_lessees: The number of consumers that can lease a slot, each of them
+        can hold at most one lease at a time. One extra slot is allocated for
+        each of them.
+    """
+
+    if n_slots < 1:
+      raise ValueError(f"The frame ring should contain at least one slot, got "
+                       f"{n_slots} !")
+
+    self.shape = tuple(shape)
+    self.dtype = np.dtype(dtype)
+    self.n_slots = n_slots
+    self._n_physical = n_slots + n_lessees
+
+    self.metadata = SharedMetadata(n_records=self._n_physical)
+    self._frames_array = RawArray(
+        'b', self._n_physical * int(np.prod(self.shape)) * self.dtype.itemsize)
+    # The sequence counter of each physical slot, the physical slot holding
+    # each of the last n_slots frames, and the slot leased by each lessee
+    self._seqs_array = RawArray('q', self._n_physical)
+    self._index_array = RawArray('q', n_slots)
+    self._leases_array = RawArray('q', [-1] * n_lessees)
+    self._head = RawValue('q', 0)
+    self._set_views()
+
+  def __getstate__(self) -> Dict[str, Any]:
+    """Excludes the :mod:`numpy` views from the pickled attributes, as they
+    would be pickled as copies of the shared memory."""
+
+    state = self.__dict__.copy()
+    for view in ('_frames', '_frames_ro', '_seqs', '_index', '_leases'):
+      del state[view]
+    return state
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    """Restores the :mod:`numpy` views after unpickling."""
+
+    self.__dict__.update(state)
+    self._set_views()
+
+  @property
+  def head(self) -> int:
+    """The number of frames written to the ring so far."""
+
+    return self._head.value
+
+  def write(self, img: np.ndarray, metadata: Dict[str, Any]) -> bool:
+    """Writes a frame and its metadata to the next slot of the ring, possibly
+    overwriting the oldest frame.
+
+    This method never waits, even if consumers are reading the slot.
+
+    Returns:
+      :obj:`True` if the metadata was stored entirely, :obj:`False` if it was
+      too large and had to be truncated.
+    """
+
+    head = self._head.value
+
+    while True:
+      # Choosing the slot holding the oldest frame among the non-leased ones
+      seqs = self._seqs.copy()
+      seqs[self._leases[self._leases >= 0]] = np.iinfo(seqs.dtype).max
+      slot = int(np.argmin(seqs))
+
+      # The sequence counter is odd while the slot is being written
+      previous = self._seqs[slot]
+      self._seqs[slot] = 2 * head + 1
+
+      # Backing off in case the slot was leased in the meantime
+      if slot not in self._leases:
+        break
+      self._seqs[slot] = previous
+
+    np.copyto(self._frames[slot], img)
+    complete = self.metadata.write(metadata, slot)
+    self._seqs[slot] = 2 * head + 2
+
+    self._index[head % self.n_slots] = slot
+    self._head.value = head + 1
+    return complete
+
+  def frame_id(self, number: int) -> Optional[int]:
+    """Returns the ``'ImageUniqueID'`` of the frame with the given number, or
+    :obj:`None` if the frame is not available in the ring."""
+
+    slot = self._index[number % self.n_slots]
+    seq = self._seqs[slot]
+    frame_id = self.metadata.frame_id(slot)
+    if seq != 2 * number + 2 or self._seqs[slot] != seq:
+      return None
+    return frame_id
+
+  def read(self, number: int, out: np.ndarray) -> Optional[Dict[str, Any]]:
+    """Copies the frame with the given number to ``out``, and returns its
+    metadata.
+
+    Returns :obj:`None` if the frame is not available in the ring, either
+    because it was already overwritten or because it was overwritten while
+    being copied. The content of ``out`` is then undefined.
+    """
+
+    slot = self._index[number % self.n_slots]
+    seq = self._seqs[slot]
+    if seq != 2 * number + 2:
+      return None
+
+    np.copyto(out, self._frames[slot])
+    metadata = self.metadata.read(slot)
+
+    # Checking that the slot was not overwritten during the copy
+    if self._seqs[slot] != seq:
+      return None
+    return metadata
+
+  def lease(self,
+            number: int,
+            lessee: int) -> Optional[Tuple[np.ndarray, Dict[str, Any]]]:
+    """Leases the slot holding the frame with the given number, and returns
+    a read-only view on the frame along with its metadata.
+
+    The frame is guaranteed not to be overwritten until :meth:`release` is
+    called. A lessee can only hold one lease at a time, any previous lease is
+    released.
+
+    Args:
+      number: The number of the frame to lease.
+      lessee: The index of the lessee, between 0 and ``n_lessees - 1``.
+
+    Returns:
+      The view on the frame and its metadata, or :obj:`None` if the frame is
+      not available in the ring.
+    """
+
+    slot = self._index[number % self.n_slots]
+    self._leases[lessee] = slot
+
+    # Checking that the producer did not choose the slot in the meantime
+    if self._seqs[slot] != 2 * number + 2:
+      self._leases[lessee] = -1
+      return None
+
+    metadata = self.metadata.read(slot)
+
+    # Checking again before handing out the view, in case the lease was not yet
+    # visible to the producer when it chose a slot, see the class docstring
+    if self._seqs[slot] != 2 * number + 2:
+      self._leases[lessee] = -1
+      return None
+
+    return self._frames_ro[slot], metadata
+
+  def release(self, lessee: int) -> None:
+    """Releases the slot leased by the given lessee, if any."""
+
+    self._leases[lessee] = -1
+
+  def _set_views(self) -> None:
+    """Creates the :mod:`numpy` arrays giving access to the slots and to the
+    counters."""
+
+    self._frames = np.frombuffer(self._frames_array, dtype=self.dtype).reshape(
+        (self._n_physical, *self.shape))
+    self._frames_ro = self._frames.view()
+    self._frames_ro.flags.writeable = False
+    self._seqs = np.frombuffer(self._seqs_array, dtype=np.int64)
+    self._index = np.frombuffer(self._index_array, dtype=np.int64)
+    self._leases = np.frombuffer(self._leases_array, dtype=np.int64)
@@ -82,10 +82,9 @@ class GPUVEProcess(CameraProcess):
 
     super().__init__()
 
-    # Making a CUDA context common to all the patches
-    pycuda.driver.init()
-    self._context = pycuda.tools.make_default_context()
-    
+    # The CUDA context is created in the Process using it, see init
+    self._context = None
+
     # Arguments to pass to the GPUCorrelTools
     self._verbose = verbose
     self._kernel_file = kernel_file
@@ -107,6 +106,12 @@ class GPUVEProcess(CameraProcess):
     """Initializes the GPUCorrelTool instances, and set their reference image
     if a ``img_ref`` argument was provided."""
 
+    # Making a CUDA context common to all the patches, it cannot be shared
+    # between Processes and is thus created by each worker
+    self.log(logging.INFO, "Creating the CUDA context")
+    pycuda.driver.init()
+    self._context = pycuda.tools.make_default_context()
+
     # Instantiating the GPUCorrelTool instances
     self.log(logging.INFO, "Instantiating the GPUCorrel tool instances")
     self._correls = [GPUCorrelTool(logger_name=self.name,
@@ -2,12 +2,19 @@
 
 from csv import DictWriter
 import numpy as np
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Any, Tuple
 from pathlib import Path
+from multiprocessing import Process, Queue, RawArray
+from multiprocessing.synchronize import Event
+from queue import Empty
+from collections import deque
+from time import time
 import logging
 import logging.handlers
 
 from .camera_process import CameraProcess
+from ...tool.metadata_file import MetadataWriter
+from ...tool.raw_container import RawFrameWriter
 from ..._global import OptionalModule
 
 try:
@@ -28,6 +35,69 @@ try:
 except (ModuleNotFoundError, ImportError):
   cv2 = OptionalModule("opencv-python")
 
+# The maximum size in bytes of a container file for the 'raw' backend
+_container_size = 2 ** 32
+
+
+def _save_image(backend: str,
+                path: str,
+                img: np.ndarray,
+                metadata: Dict[str, Any]) -> None:
+  """Saves an image at the given path using the given backend."""
+
+  if backend == 'sitk':
+    Sitk.WriteImage(Sitk.GetImageFromArray(img), path)
+
+  elif backend == 'cv2':
+    cv2.imwrite(path, img)
+
+  elif backend == 'pil':
+    PIL.Image.fromarray(img).save(
+      path, exif={TAGS_INV[key]: val for key, val in metadata.items()
+                  if key in TAGS_INV})
+
+  elif backend == 'npy':
+    np.save(path, img)
+
+
+def _save_worker(backend: str,
+                 buffers: RawArray,
+                 shape: Tuple[int, ...],
+                 dtype,
+                 tasks: Queue,
+                 done: Queue,
+                 stop_event: Event) -> None:
+  """Target of the worker Processes of the :class:`ImageSaver`, saving the
+  images placed in the shared buffers until told to stop.
+
+  Each task is made of the number of the frame, the index of the buffer
+  holding it, the path where to save it and its metadata. Once saved, the
+  number of the frame and the index of the buffer are put in the ``done``
+  queue, along with the error message if the image could not be saved.
+  """
+
+  images = np.frombuffer(buffers, dtype=dtype).reshape((-1, *shape))
+
+  while True:
+    try:
+      task = tasks.get(timeout=0.1)
+    except Empty:
+      # In case the ImageSaver was terminated without stopping the workers
+      if stop_event.is_set() and tasks.empty():
+        break
+      continue
+
+    # None is the signal to stop
+    if task is None:
+      break
+
+    number, index, path, metadata = task
+    try:
+      _save_image(backend, path, images[index], metadata)
+      done.put((number, index, None))
+    except (Exception,) as exc:
+      done.put((number, index, f"{type(exc).__name__}: {exc}"))
+
 
 class ImageSaver(CameraProcess):
   """This :class:`~crappy.blocks.camera_processes.CameraProcess` can record
@@ -38,15 +108,49 @@ class ImageSaver(CameraProcess):
   slower depending on the machine. It is possible to only save one out of a
   given number of images, if not all frames are needed.
 
+  The frames are read with the ``'lossless'`` policy, so that no frame is
+  missed as long as the frame ring of the Camera Block is large enough to
+  absorb the temporary slowdowns of the recording. They are also not copied
+  out of the ring, but saved directly from a read-only view on it.
+
+  Optionally, the images can be saved by a pool of worker Processes, so that
+  several images are encoded in parallel. The frames are then copied to
+  buffers in shared memory, from which the workers read them. The images are
+  still saved with the same names, and the metadata file is still written in
+  the order of the frames.
+
+  With the ``'raw'`` backend, the images are instead appended to large
+  preallocated container files, that can be read back through a
+  :class:`numpy.memmap` by the :class:`~crappy.camera.FileReader` Camera.
+
+  The metadata file is kept open while recording, and the metadata of the
+  saved images is written to it in batches. For very high framerates, the
+  metadata can also be written to a binary file, that is cheaper to write and
+  faster to load than the `.csv` file.
+
   .. versionadded:: 2.0.0
+  .. versionchanged:: 2.0.6
+     reading the frames with the lossless policy and without copying them
+  .. versionadded:: 2.0.6 *n_workers* argument
+  .. versionchanged:: 2.0.6 added the *'raw'* backend
+  .. versionadded:: 2.0.6
+     *metadata_flush_period*, *metadata_flush_rows* and *metadata_sidecar*
+     arguments
   """
 
+  read_policy = 'lossless'
+  zero_copy = True
+
   def __init__(self,
                img_extension: str = "tiff",
                save_folder: Optional[Union[str, Path]] = None,
                save_period: int = 1,
                save_backend: Optional[str] = None,
-               send_msg: bool = False) -> None:
+               send_msg: bool = False,
+               n_workers: int = 0,
+               metadata_flush_period: float = 1,
+               metadata_flush_rows: int = 100,
+               metadata_sidecar: bool = False) -> None:
     """Sets the arguments and initializes the parent class.
 
     Args:
@@ -63,18 +167,44 @@ class ImageSaver(CameraProcess):
       save_backend: The backend to use for saving the images. Should be one of:
         ::
 
-          'sitk', 'pil', 'cv2', 'npy'
+          'sitk', 'pil', 'cv2', 'npy', 'raw'
 
         They correspond to the modules :mod:`SimpleITK`, :mod:`PIL` (Pillow
         Fork), :mod:`cv2` (OpenCV), and :mod:`numpy`. Depending on the machine,
         some may be faster or slower. The ``img_extension`` is ignored for the
-        backend ``'npy'``, that saves the images as raw numpy arrays.
+        backend ``'npy'``, that saves the images as raw numpy arrays. It is
+        also ignored by the ``'raw'`` backend, that appends the images to
+        container files named `frames_00000.raw`, `frames_00001.raw`, etc.
+        A new container is started each time the previous one reaches 4GB.
+        See :mod:`crappy.tool.raw_container` for details.
+
+        .. versionchanged:: 2.0.6 added the *'raw'* backend
       send_msg: In case no processing is performed, and if output Links are
         present, this argument is set to :obj:`True`. In that case, a message
         containing the timestamp, the index, and the metadata of the image is
         sent to downstream Blocks each time an image is saved.
 
         .. versionadded:: 2.0.5
+      n_workers: The number of worker Processes saving the images in parallel.
+        If ``0``, the images are saved one at a time by this CameraProcess.
+        Ignored with the ``'raw'`` backend, as the images are not encoded.
+
+        .. versionadded:: 2.0.6
+      metadata_flush_period: The metadata of the saved images is buffered,
+        and written to the file at most this number of seconds after the
+        previous write. The check is performed each time an image is saved.
+        The buffered metadata is always written when the Process stops.
+
+        .. versionadded:: 2.0.6
+      metadata_flush_rows: The buffered metadata is also written to the file
+        as soon as it holds this number of images.
+
+        .. versionadded:: 2.0.6
+      metadata_sidecar: If :obj:`True`, the metadata is also written to a
+        binary file named `metadata.bin`, that can be loaded with
+        :func:`crappy.tool.metadata_file.read_metadata`.
+
+        .. versionadded:: 2.0.6
     """
 
     super().__init__()
@@ -90,14 +220,17 @@ class ImageSaver(CameraProcess):
         self._save_backend = 'cv2'
       else:
         self._save_backend = 'npy'
-    elif save_backend in ('sitk', 'pil', 'cv2', 'npy'):
+    elif save_backend in ('sitk', 'pil', 'cv2', 'npy', 'raw'):
       self._save_backend = save_backend
     else:
       raise ValueError("The save_backend argument should be either 'sitk', "
-                       "'pil', 'cv2' or 'npy' !")
+                       "'pil', 'cv2', 'npy' or 'raw' !")
 
     # In case the images are saved as arrays, don't include extension
-    self._img_extension = img_extension if self._save_backend != 'npy' else ''
+    if self._save_backend in ('npy', 'raw'):
+      self._img_extension = ''
+    else:
+      self._img_extension = img_extension
 
     # Setting a default save folder if not given
     if save_folder is None:
@@ -112,6 +245,33 @@ class ImageSaver(CameraProcess):
     self._csv_path = None
     self._metadata_name = 'metadata.csv'
 
+    # The metadata files, and the metadata waiting to be written to them
+    self._flush_period = metadata_flush_period
+    self._flush_rows = max(1, int(metadata_flush_rows))
+    self._use_sidecar = metadata_sidecar
+    self._csv_file = None
+    self._csv_writer: Optional[DictWriter] = None
+    self._sidecar: Optional[MetadataWriter] = None
+    self._rows = list()
+    self._last_flush = time()
+
+    # Attributes of the pool of workers, initialized later
+    self._n_workers = int(n_workers)
+    self._workers = list()
+    self._buffers: Optional[np.ndarray] = None
+    self._free = list()
+    self._tasks: Optional[Queue] = None
+    self._done: Optional[Queue] = None
+    # The metadata of the frames being saved, and the saved ones
+    self._pending = deque()
+    self._saved = set()
+    self._n_dispatched = 0
+    self._n_completed = 0
+
+    # The container the images are written to with the 'raw' backend
+    self._container: Optional[RawFrameWriter] = None
+    self._n_containers = 0
+
   def init(self) -> None:
     """Creates the folder for saving the images.
 
@@ -147,6 +307,33 @@ class ImageSaver(CameraProcess):
                              f"{self._save_folder}")
       Path.mkdir(self._save_folder, exist_ok=True, parents=True)
 
+    if self._save_backend == 'raw' and self._n_workers > 0:
+      self.log(logging.WARNING, "The images are not encoded with the 'raw' "
+                                "backend, ignoring the n_workers argument")
+      self._n_workers = 0
+
+    # Starting the workers, with two buffers each so that they never wait
+    if self._n_workers > 0:
+      self.log(logging.INFO, f"Starting {self._n_workers} workers for saving "
+                             f"the images")
+      n_buffers = 2 * self._n_workers
+      buffers = RawArray('b', n_buffers * int(np.prod(self._shape))
+                         * np.dtype(self._dtype).itemsize)
+      self._buffers = np.frombuffer(buffers, dtype=self._dtype).reshape(
+          (n_buffers, *self._shape))
+      self._free = list(range(n_buffers))
+      self._tasks = Queue()
+      self._done = Queue()
+
+      for i in range(self._n_workers):
+        worker = Process(target=_save_worker,
+                         name=f"{self.name}.Worker-{i + 1}",
+                         args=(self._save_backend, buffers, self._shape,
+                               self._dtype, self._tasks, self._done,
+                               self._stop_event))
+        worker.start()
+        self._workers.append(worker)
+
   def _get_data(self) -> bool:
     """Method similar to the one of the parent class, except it also ensures
     that at most only one out of ``save_period`` images is being saved.
@@ -156,35 +343,21 @@ class ImageSaver(CameraProcess):
       :obj:`False` if no frame was grabbed and nothing should be done.
     """
 
-    # Acquiring the Lock to avoid conflicts with other CameraProcesses
-    with self._lock:
-
-      # In case there's no frame grabbed yet
-      if 'ImageUniqueID' not in self._data_dict:
-        return False
-
-      # In case the frame in buffer was already handled during a previous loop,
-      if self._data_dict['ImageUniqueID'] == self.metadata['ImageUniqueID']:
-        return False
-
-     # In case it's too early to save the new frame
-      if self.metadata['ImageUniqueID'] is not None and \
-          self._data_dict['ImageUniqueID'] - self.metadata['ImageUniqueID'] \
-          < self._save_period:
+    # Looking for a new frame until one is read without being overwritten
+    while True:
+      number = self._next_frame()
+      if number is None:
         return False
 
-      # Copying the metadata
-      self.metadata = self._data_dict.copy()
-
-      self.log(logging.DEBUG, f"Got new image to process with id "
-                              f"{self.metadata['ImageUniqueID']}")
-
-      # Copying the frame
-      np.copyto(self.img,
-                np.frombuffer(self._img_array.get_obj(),
-                              dtype=self._dtype).reshape(self._shape))
+      # In case it's too early to save the new frame
+      frame_id = self._ring.frame_id(number)
+      last_id = self.metadata['ImageUniqueID']
+      if frame_id is not None and last_id is not None and \
+          frame_id - last_id < self._save_period:
+        continue
 
-    return True
+      if self._read_frame(number):
+        return True
 
   def loop(self) -> None:
     """This method grabs the latest frame, writes its metadata to a `.csv` file
@@ -192,6 +365,13 @@ class ImageSaver(CameraProcess):
 
     On the first frame, the metadata file is created and its header is
     populated using the metadata of the frame.
+
+    With the ``'raw'`` backend, the frame is appended to the current container
+    file, and a new container is created when it is full.
+
+    If workers are used, the frame is instead copied to a free buffer and sent
+    to the workers for saving. The metadata is written once the frame and all
+    the previous ones are saved.
     """
 
     # Creating the .csv containing the metadata on the first received frame
@@ -201,18 +381,26 @@ class ImageSaver(CameraProcess):
       self.log(logging.INFO, f"Creating file for saving the metadata: "
                              f"{self._csv_path}")
 
-      # Also writing the header of the .csv file when creating it
-      with open(self._csv_path, 'w') as csvfile:
-        writer = DictWriter(csvfile, fieldnames=self.metadata.keys())
-        writer.writeheader()
+      # Also writing the header of the .csv file when creating it, the file
+      # then remains open until the end
+      self._csv_file = open(self._csv_path, 'w')
+      self._csv_writer = DictWriter(self._csv_file,
+                                    fieldnames=self.metadata.keys(),
+                                    extrasaction='ignore')
+      self._csv_writer.writeheader()
+
+      if self._use_sidecar:
+        sidecar_path = self._save_folder / 'metadata.bin'
+        self.log(logging.INFO, f"Creating binary file for saving the "
+                               f"metadata: {sidecar_path}")
+        self._sidecar = MetadataWriter(sidecar_path)
 
       self._csv_created = True
 
-    # Saving the received metadata to the .csv file
-    self.log(logging.DEBUG, f"Saving metadata: {self.metadata}")
-    with open(self._csv_path, 'a') as csvfile:
-      writer = DictWriter(csvfile, fieldnames=self.metadata.keys())
-      writer.writerow({**self.metadata, 't(s)': self.metadata['t(s)']})
+    if self._save_backend == 'raw':
+      self._append_to_container()
+      self._image_saved(self.metadata)
+      return
 
     # Only include the extension for the image file if applicable
     if self._img_extension:
@@ -224,23 +412,163 @@ class ImageSaver(CameraProcess):
                                      f"{self.metadata['t(s)']:.3f}")
 
     # Saving the image at the destination path using the chosen backend
-    self.log(logging.DEBUG, "Saving image")
-    if self._save_backend == 'sitk':
-      Sitk.WriteImage(Sitk.GetImageFromArray(self.img), path)
+    if not self._workers:
+      self.log(logging.DEBUG, "Saving image")
+      _save_image(self._save_backend, path, self.img, self.metadata)
+      self._image_saved(self.metadata)
+      return
+
+    # Waiting for a buffer to be free, this can only take long if the
+    # workers are slower than the acquisition
+    while not self._free:
+      self._collect(timeout=0.1)
+
+    # Copying the frame to the buffer, and sending it to the workers
+    index = self._free.pop()
+    np.copyto(self._buffers[index], self.img)
+    self.log(logging.DEBUG, f"Sending image to the workers in buffer {index}")
+    self._tasks.put((self._n_dispatched, index, path, self.metadata))
+    self._pending.append(self.metadata)
+    self._n_dispatched += 1
+
+    self._collect(timeout=0)
+
+  def finish(self) -> None:
+    """Waits for the workers to save all the images they received, and stops
+    them. Then, writes the remaining metadata and closes the files.
+
+    With the ``'raw'`` backend, closes the current container file instead of
+    stopping the workers.
+    """
 
-    elif self._save_backend == 'cv2':
-      cv2.imwrite(path, self.img)
+    if self._container is not None:
+      self.log(logging.INFO, f"Closing the container {self._container.path}")
+      self._container.close()
+      self._container = None
+
+    try:
+      if self._workers:
+        self._stop_workers()
+    finally:
+      if self._csv_file is not None:
+        self.log(logging.INFO, "Writing the remaining metadata and closing "
+                               "the metadata file(s)")
+        self._flush_metadata()
+        self._csv_file.close()
+        self._csv_file = None
+        if self._sidecar is not None:
+          self._sidecar.close()
+          self._sidecar = None
+
+  def _stop_workers(self) -> None:
+    """Waits for the workers to save all the images they received, and stops
+    them."""
+
+    self.log(logging.INFO, "Waiting for the workers to save the remaining "
+                           "images")
+    for _ in self._workers:
+      self._tasks.put(None)
+
+    try:
+      while self._pending and any(worker.is_alive()
+                                  for worker in self._workers):
+        self._collect(timeout=0.1)
+      # Some results might arrive after the last worker stopped
+      self._collect(timeout=0)
+    finally:
+      for worker in self._workers:
+        worker.join(1)
+        if worker.is_alive():
+          self.log(logging.WARNING, f"Worker {worker.name} did not stop, "
+                                    f"terminating it")
+          worker.terminate()
+
+    if self._pending:
+      self.log(logging.WARNING, f"{len(self._pending)} image(s) were not "
+                                f"saved by the workers")
+
+  def _flush_metadata(self) -> None:
+    """Writes the buffered metadata to the metadata file(s)."""
+
+    self.log(logging.DEBUG, f"Writing the metadata of {len(self._rows)} "
+                            f"image(s)")
+    self._csv_writer.writerows(self._rows)
+    self._csv_file.flush()
+    if self._sidecar is not None:
+      self._sidecar.write(self._rows)
+      self._sidecar.flush()
+
+    self._rows.clear()
+    self._last_flush = time()
+
+  def _append_to_container(self) -> None:
+    """Appends the current frame to the container file, and creates a new
+    container first if there is none yet or if the current one is full."""
+
+    if self._container is not None and self._container.full:
+      self.log(logging.INFO, f"The container {self._container.path} is full, "
+                             f"closing it")
+      self._container.close()
+      self._container = None
+
+    if self._container is None:
+      path = self._save_folder / f'frames_{self._n_containers:05d}.raw'
+      frame_size = self.img.nbytes
+      self.log(logging.INFO, f"Creating the container for saving the images "
+                             f"at: {path}")
+      self._container = RawFrameWriter(
+          path, self.img.shape, self.img.dtype,
+          capacity=max(1, _container_size // frame_size))
+      self._n_containers += 1
+
+    self.log(logging.DEBUG, "Appending image to the container")
+    self._container.append(self.img, self.metadata['ImageUniqueID'],
+                           self.metadata['t(s)'])
+
+  def _collect(self, timeout: float) -> None:
+    """Collects the images saved by the workers, and writes the metadata of
+    the ones whose previous frames were all saved.
 
-    elif self._save_backend == 'pil':
-      PIL.Image.fromarray(self.img).save(
-        path, exif={TAGS_INV[key]: val for key, val in self.metadata.items()
-                    if key in TAGS_INV})
+    Args:
+      timeout: The maximum time to wait for a first image to be saved, in
+        seconds. If ``0``, does not wait.
+    """
 
-    elif self._save_backend == 'npy':
-      np.save(path, self.img)
+    while True:
+      try:
+        if timeout:
+          number, index, error = self._done.get(timeout=timeout)
+          timeout = 0
+        else:
+          number, index, error = self._done.get_nowait()
+      except Empty:
+        break
+
+      self._free.append(index)
+      if error is not None:
+        self.log(logging.ERROR, f"A worker could not save an image: {error}")
+        raise IOError(f"Could not save an image: {error}")
+      self._saved.add(number)
+
+    # Writing the metadata in the order of the frames
+    while self._n_completed in self._saved:
+      self._saved.remove(self._n_completed)
+      self._n_completed += 1
+      self._image_saved(self._pending.popleft())
+
+  def _image_saved(self, metadata: Dict[str, Any]) -> None:
+    """Buffers the metadata of a saved image for writing it to the metadata
+    file(s), and sends a message to the downstream Blocks if required."""
+
+    # Writing the buffered metadata if there is enough or it is old enough
+    self.log(logging.DEBUG, f"Buffering metadata: {metadata}")
+    self._rows.append(metadata)
+    if len(self._rows) >= self._flush_rows or \
+        time() - self._last_flush >= self._flush_period:
+      self._flush_metadata()
 
     # Sending the results to the downstream Blocks
     if self._send_msg:
-      self.send({'t(s)': self.metadata['t(s)'],
-                 'img_index': self.metadata['ImageUniqueID'],
-                 'meta': self.metadata})
+      self.send({'t(s)': metadata['t(s)'],
+                 'img_index': metadata['ImageUniqueID'],
+                 'meta': metadata})
@@ -0,0 +1,211 @@
+# coding: utf-8
+
+from multiprocessing import RawArray
+from typing import Dict, Any, Optional
+import pickle
+import numpy as np
+
+# Maximum number of fields in the metadata of a frame, and maximum length in
+# bytes of the names of the fields and of their string values
+max_fields = 32
+key_length = 32
+str_length = 64
+# Maximum size in bytes of the pickled metadata, for the metadata not fitting
+# in the typed fields
+overflow_length = 4096
+
+# The fields always kept in a record, as the CameraProcesses rely on them
+_required_keys = ('ImageUniqueID', 't(s)')
+
+# The types of values that can be stored in a record
+_unused, _int, _float, _str, _bool, _none = range(6)
+
+_record_dtype = np.dtype([('frame_id', 'i8'),
+                          ('n_fields', 'u1'),
+                          ('keys', f'S{key_length}', (max_fields,)),
+                          ('kinds', 'u1', (max_fields,)),
+                          ('ints', 'i8', (max_fields,)),
+                          ('floats', 'f8', (max_fields,)),
+                          ('strings', f'S{str_length}', (max_fields,)),
+                          ('overflow_size', 'u4'),
+                          ('overflow', 'u1', (overflow_length,))])
+
+
+class SharedMetadata:
+  """Fixed-layout records in shared memory, holding the metadata of the frames
+  acquired by the :class:`~crappy.blocks.Camera` Block.
+
+  Each record contains the ``'ImageUniqueID'`` of the frame, that can be read
+  on its own for checking whether a new frame is available, and up to
+  :obj:`max_fields` typed fields. The values of the fields can be integers,
+  floats, strings, booleans or :obj:`None`. The field names are limited to
+  :obj:`key_length` bytes and the string values to :obj:`str_length` bytes.
+
+  Metadata that does not fit in the typed fields is pickled instead, in an
+  area of :obj:`overflow_length` bytes. If it is still too large, only the
+  ``'ImageUniqueID'`` and ``'t(s)'`` fields followed by the first other
+  fields are kept, up to :obj:`max_fields` fields. The other values are then
+  converted to strings, and the longer strings are truncated.
+
+  Unlike a :obj:`dict` managed by a :obj:`~multiprocessing.Manager`, reading or
+  writing a record does not involve any server Process. The records are not
+  protected against concurrent accesses, this is the responsibility of the
+  caller.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self, n_records: int = 1) -> None:
+    """Allocates the shared memory holding the records.
+
+    Args:
+      n_records: The number of records to allocate.
+    """
+
+    self._n_records = n_records
+    self._array = RawArray('b', _record_dtype.itemsize * n_records)
+    self._set_views()
+    self._records['frame_id'] = -1
+
+  def __getstate__(self) -> Dict[str, Any]:
+    """Excludes the :mod:`numpy` views from the pickled attributes, as they
+    would be pickled as copies of the shared memory."""
+
+    state = self.__dict__.copy()
+    del state['_records']
+    return state
+
+  def __setstate__(self, state: Dict[str, Any]) -> None:
+    """Restores the :mod:`numpy` views after unpickling."""
+
+    self.__dict__.update(state)
+    self._set_views()
+
+  def frame_id(self, index: int = 0) -> Optional[int]:
+    """Returns the ``'ImageUniqueID'`` of the frame whose metadata is stored
+    in the given record, or :obj:`None` if no metadata was written yet."""
+
+    frame_id = int(self._records[index]['frame_id'])
+    return frame_id if frame_id >= 0 else None
+
+  def write(self, metadata: Dict[str, Any], index: int = 0) -> bool:
+    """Writes the metadata of a frame to the given record.
+
+    The metadata must contain an integer ``'ImageUniqueID'`` field.
+
+    Returns:
+      :obj:`True` if the metadata was stored entirely, :obj:`False` if fields
+      were dropped or values truncated because it was too large.
+    """
+
+    record = self._records[index]
+    complete = True
+
+    # Metadata not fitting in the typed fields is pickled if possible
+    if not self._fits(metadata):
+      payload = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+      if len(payload) <= overflow_length:
+        record['overflow'][:len(payload)] = np.frombuffer(payload,
+                                                          dtype=np.uint8)
+        record['overflow_size'] = len(payload)
+        record['n_fields'] = 0
+        record['frame_id'] = metadata['ImageUniqueID']
+        return True
+      complete = False
+
+    keys = record['keys']
+    kinds = record['kinds']
+
+    # When truncating, the required fields are kept first
+    fields = list(metadata.items())
+    if not complete:
+      required = [(key, metadata[key]) for key in _required_keys
+                  if key in metadata]
+      others = [(key, value) for key, value in fields
+                if key not in _required_keys]
+      fields = required + others[:max_fields - len(required)]
+    for i, (key, value) in enumerate(fields):
+      keys[i] = key.encode()
+      if value is None:
+        kinds[i] = _none
+      elif isinstance(value, (bool, np.bool_)):
+        kinds[i] = _bool
+        record['ints'][i] = value
+      elif (isinstance(value, (int, np.integer))
+            and -2 ** 63 <= value < 2 ** 63):
+        kinds[i] = _int
+        record['ints'][i] = value
+      elif isinstance(value, (float, np.floating)):
+        kinds[i] = _float
+        record['floats'][i] = value
+      else:
+        kinds[i] = _str
+        record['strings'][i] = str(value).encode()
+
+    record['n_fields'] = len(fields)
+    record['overflow_size'] = 0
+    record['frame_id'] = metadata['ImageUniqueID']
+    return complete
+
+  def read(self, index: int = 0) -> Dict[str, Any]:
+    """Returns the metadata stored in the given record as a :obj:`dict`, with
+    the fields in the same order as they were written."""
+
+    record = self._records[index]
+
+    overflow_size = int(record['overflow_size'])
+    if overflow_size:
+      return pickle.loads(record['overflow'][:overflow_size].tobytes())
+
+    n_fields = int(record['n_fields'])
+    keys = record['keys'][:n_fields].tolist()
+    kinds = record['kinds'][:n_fields].tolist()
+    ints = record['ints'][:n_fields].tolist()
+    floats = record['floats'][:n_fields].tolist()
+    strings = record['strings'][:n_fields].tolist()
+
+    metadata = dict()
+    for i, (key, kind) in enumerate(zip(keys, kinds)):
+      if kind == _int:
+        value = ints[i]
+      elif kind == _float:
+        value = floats[i]
+      elif kind == _bool:
+        value = bool(ints[i])
+      elif kind == _none:
+        value = None
+      else:
+        value = strings[i].decode(errors='ignore')
+      metadata[key.decode(errors='ignore')] = value
+
+    return metadata
+
+  @staticmethod
+  def _fits(metadata: Dict[str, Any]) -> bool:
+    """Returns :obj:`True` if the given metadata can be stored in the typed
+    fields without losing information."""
+
+    if len(metadata) > max_fields:
+      return False
+
+    for key, value in metadata.items():
+      if len(key.encode()) > key_length:
+        return False
+      if isinstance(value, str):
+        if len(value.encode()) > str_length:
+          return False
+      elif (isinstance(value, (int, np.integer))
+            and not -2 ** 63 <= value < 2 ** 63):
+        return False
+      elif not (value is None or isinstance(value, (int, float, np.integer,
+                                                    np.floating, np.bool_))):
+        return False
+
+    return True
+
+  def _set_views(self) -> None:
+    """Creates the :mod:`numpy` structured array giving access to the
+    records."""
+
+    self._records = np.frombuffer(self._array, dtype=_record_dtype,
+                                  count=self._n_records)
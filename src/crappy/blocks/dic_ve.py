@@ -85,6 +85,10 @@ class DICVE(Camera):
                safe: bool = True,
                follow: bool = True,
                raise_on_patch_exit: bool = True,
+               downscale: int = 1,
+               full_res_period: Optional[int] = None,
+               patch_threads: int = 1,
+               process_workers: int = 1,
                **kwargs) -> None:
     """Sets the arguments and initializes the parent class.
 
@@ -208,7 +212,7 @@ class DICVE(Camera):
         recording the images. It should be one of:
         ::
 
-          'sitk', 'cv2', 'pil', 'npy'
+          'sitk', 'cv2', 'pil', 'npy', 'raw'
 
         They correspond to the modules :mod:`SimpleITK`, :mod:`cv2` (OpenCV),
         :mod:`PIL` (Pillow Fork), and :mod:`numpy`. Note that the ``'npy'``
@@ -218,8 +222,14 @@ class DICVE(Camera):
         Python must of course be installed. If not provided and ``save_images``
         is :obj:`True`, the backends are tried in the same order as given above
         and the first available one is used. ``'npy'`` is always available.
+        The ``'raw'`` backend is never selected by default. It appends all the
+        images to a few large container files instead of creating one file
+        per image, which is much lighter on the filesystem at high framerates.
+        It also ignores ``img_extension``. The containers can be read back
+        with :class:`~crappy.camera.FileReader`.
 
         .. versionadded:: 1.5.10
+        .. versionchanged:: 2.0.6 added the *'raw'* backend
       image_generator: A callable taking two :obj:`float` as arguments and
         returning an image as a :obj:`numpy.array`. **This argument is intended
         for use in the examples of Crappy, to apply an artificial strain on a
@@ -333,7 +343,43 @@ class DICVE(Camera):
         stopped in another way.
 
         .. versionadded:: 2.0.0
-      **kwargs: Any additional argument will be passed to the
+      downscale: If greater than ``1``, the images are downscaled by this
+        integer factor by averaging blocks of pixels before tracking the
+        patches. This is much faster on high-resolution images, at the cost of
+        a lower accuracy. The output positions and displacements are still
+        given in pixels of the full-resolution images. As the entire images
+        are downscaled, this is mostly worth it for large patches. The images
+        are still displayed and recorded at full resolution.
+
+        .. versionadded:: 2.0.6
+      full_res_period: If given along with a ``downscale`` factor, the patches
+        are tracked at full resolution on one image out of this number instead
+        of downscaled, for periodically getting accurate values. If the
+        patches are followed, the downscaled ones are then moved to the
+        positions found at full resolution. If :obj:`None`, the default, all
+        the images are downscaled.
+
+        .. versionadded:: 2.0.6
+      patch_threads: The number of threads calculating the displacements of
+        the patches in parallel, each patch having its own instance of DISFlow.
+        As OpenCV releases the GIL, this allows using several CPU cores for
+        tracking the patches. The default of ``1`` tracks the patches one after
+        the other.
+
+        .. versionadded:: 2.0.6
+      process_workers: The number of
+        :class:`~crappy.blocks.camera_processes.DICVEProcess` tracking the
+        patches in parallel, each of them on one frame out of
+        ``process_workers``. Helps keeping up with high framerates on
+        multicore machines. As each process only sees one frame out of
+        ``process_workers``, the patches move more between two of its frames.
+        The default is 1.
+
+        .. versionadded:: 2.0.6
+      **kwargs: The ``ring_size``, ``save_workers``, ``save_metadata_period``
+        and ``save_metadata_sidecar`` arguments are passed to the
+        :class:`~crappy.blocks.Camera` Block, see its documentation. Any other
+        additional argument will be passed to the
         :class:`~crappy.camera.Camera` object, and used as a kwarg to its
         :meth:`~crappy.camera.Camera.open` method.
 
@@ -363,6 +409,7 @@ class DICVE(Camera):
                      image_generator=image_generator,
                      img_shape=img_shape,
                      img_dtype=img_dtype,
+                     process_workers=process_workers,
                      **kwargs)
 
     # Forcing the labels into a list
@@ -397,6 +444,9 @@ class DICVE(Camera):
     self._border = border
     self._safe = safe
     self._follow = follow
+    self._downscale = downscale
+    self._full_res_period = full_res_period
+    self._patch_threads = patch_threads
 
   def prepare(self) -> None:
     """This method mostly calls the :meth:`~crappy.blocks.Camera.prepare` 
@@ -431,7 +481,10 @@ class DICVE(Camera):
         border=self._border,
         safe=self._safe,
         follow=self._follow,
-        raise_on_exit=self._raise_on_exit)
+        raise_on_exit=self._raise_on_exit,
+        downscale=self._downscale,
+        full_res_period=self._full_res_period,
+        patch_threads=self._patch_threads)
 
     super().prepare()
 
@@ -75,6 +75,11 @@ class DISCorrel(Camera):
                patch_size: int = 8,
                patch_stride: int = 3,
                residual: bool = False,
+               roi_margin: Optional[int] = None,
+               residual_stride: int = 1,
+               downscale: int = 1,
+               full_res_period: Optional[int] = None,
+               process_workers: int = 1,
                **kwargs) -> None:
     """Sets the arguments and initializes the parent class.
 
@@ -198,7 +203,7 @@ class DISCorrel(Camera):
         recording the images. It should be one of:
         ::
 
-          'sitk', 'cv2', 'pil', 'npy'
+          'sitk', 'cv2', 'pil', 'npy', 'raw'
 
         They correspond to the modules :mod:`SimpleITK`, :mod:`cv2` (OpenCV),
         :mod:`PIL` (Pillow Fork), and :mod:`numpy`. Note that the ``'npy'``
@@ -208,8 +213,14 @@ class DISCorrel(Camera):
         Python must of course be installed. If not provided and ``save_images``
         is :obj:`True`, the backends are tried in the same order as given above
         and the first available one is used. ``'npy'`` is always available.
+        The ``'raw'`` backend is never selected by default. It appends all the
+        images to a few large container files instead of creating one file
+        per image, which is much lighter on the filesystem at high framerates.
+        It also ignores ``img_extension``. The containers can be read back
+        with :class:`~crappy.camera.FileReader`.
 
         .. versionadded:: 1.5.10
+        .. versionchanged:: 2.0.6 added the *'raw'* backend
       image_generator: A callable taking two :obj:`float` as arguments and
         returning an image as a :obj:`numpy.array`. **This argument is intended
         for use in the examples of Crappy, to apply an artificial strain on a
@@ -293,7 +304,48 @@ class DISCorrel(Camera):
         label, that should not be included in the given labels. This option is
         mainly intended as a debug feature, to monitor the quality of the
         image correlation.
-      **kwargs: Any additional argument will be passed to the
+      roi_margin: If given, the optical flow is only computed on the patch
+        extended by this number of pixels on each side, instead of on the
+        entire image. This is much faster when the patch is small compared to
+        the image. The margin should be larger than the maximum expected
+        displacement of the patch. The residuals are then computed on this
+        extended patch only.
+
+        .. versionadded:: 2.0.6
+      residual_stride: When computing the residuals, only one pixel out of this
+        number along each axis is considered. Setting it to ``2`` or ``4``
+        makes the residuals much cheaper to compute, so that they can be
+        monitored during the entire test. The default of ``1`` considers all
+        the pixels.
+
+        .. versionadded:: 2.0.6
+      downscale: If greater than ``1``, the images are downscaled by this
+        integer factor by averaging blocks of pixels before performing the
+        image correlation. This is much faster on high-resolution images, at
+        the cost of a lower accuracy. The output displacements are still given
+        in pixels of the full-resolution images. The ``roi_margin`` is divided
+        by the same factor. The images are still displayed and recorded at full
+        resolution.
+
+        .. versionadded:: 2.0.6
+      full_res_period: If given along with a ``downscale`` factor, one image
+        out of this number is correlated at full resolution instead of
+        downscaled, for periodically getting accurate values. If :obj:`None`,
+        the default, all the images are downscaled.
+
+        .. versionadded:: 2.0.6
+      process_workers: The number of
+        :class:`~crappy.blocks.camera_processes.DISCorrelProcess` running in
+        parallel, each of them processing one frame out of
+        ``process_workers`` in turn. Allows processing more frames when the
+        correlation takes longer than the acquisition period. The data is sent
+        to downstream Blocks in the order of the frames. The default is 1.
+
+        .. versionadded:: 2.0.6
+      **kwargs: The ``ring_size``, ``save_workers``, ``save_metadata_period``
+        and ``save_metadata_sidecar`` arguments are passed to the
+        :class:`~crappy.blocks.Camera` Block, see its documentation. Any other
+        additional argument will be passed to the
         :class:`~crappy.camera.Camera` object, and used as a kwarg to its
         :meth:`~crappy.camera.Camera.open` method.
 
@@ -324,6 +376,7 @@ class DISCorrel(Camera):
                      image_generator=image_generator,
                      img_shape=img_shape,
                      img_dtype=img_dtype,
+                     process_workers=process_workers,
                      **kwargs)
 
     # Forcing the fields into a list
@@ -367,6 +420,10 @@ class DISCorrel(Camera):
     self._patch_size = patch_size
     self._patch_stride = patch_stride
     self._residual = residual
+    self._roi_margin = roi_margin
+    self._residual_stride = residual_stride
+    self._downscale = downscale
+    self._full_res_period = full_res_period
 
   def prepare(self) -> None:
     """This method mostly calls the :meth:`~crappy.blocks.Camera.prepare`
@@ -402,7 +459,11 @@ class DISCorrel(Camera):
         gradient_iterations=self._gradient_iterations,
         patch_size=self._patch_size,
         patch_stride=self._patch_stride,
-        residual=self._residual)
+        residual=self._residual,
+        roi_margin=self._roi_margin,
+        residual_stride=self._residual_stride,
+        downscale=self._downscale,
+        full_res_period=self._full_res_period)
 
     super().prepare()
 
@@ -84,6 +84,8 @@ class HDFRecorder(Block):
     self.freq = freq
     self.display_freq = display_freq
     self.debug = debug
+    # There's nothing to do between two incoming chunks of data
+    self.wake_on_data = True
 
     self._path = Path(filename)
     self._label = label
@@ -100,8 +100,9 @@ class MeanBlock(Block):
     """Receives all available data from the upstream Blocks, averages it and
     sends it if the time delay is reached."""
 
-    # Receiving data from each incoming link
-    data = self.recv_all_data(delay=self._delay, poll_delay=self._delay / 10)
+    # Receiving data from each incoming link, as arrays
+    data = self.recv_batch_data(delay=self._delay,
+                                poll_delay=self._delay / 10)
     to_send = dict()
 
     # Removing the time label from the received data
@@ -9,20 +9,27 @@ from threading import BrokenBarrierError, Thread
 from queue import Empty
 import logging
 import logging.handlers
-from time import sleep, time, time_ns
+from time import sleep, time, time_ns, perf_counter
 from weakref import WeakSet
 from typing import Union, Optional, List, Dict, Any, Iterable
 from collections import defaultdict
 import subprocess
+import json
 from sys import stdout, stderr, argv
 from pathlib import Path
+import numpy as np
 
 from .meta_block import MetaBlock
-from ...links import Link
+from ...links import Link, Batch
+from ...links.batch import concatenate
 from ..._global import LinkDataError, StartTimeout, PrepareError, \
   T0NotSetError, GeneratorStop, ReaderStop, CameraPrepareError, \
   CameraRuntimeError, CameraConfigError, CrappyFail
 from ...tool.ft232h import USBServer
+from ...tool.scheduling import set_scheduling
+
+# Number of loops over which the percentiles of the lateness are computed
+_n_lateness = 10000
 
 
 class Block(Process, metaclass=MetaBlock):
@@ -59,6 +66,8 @@ class Block(Process, metaclass=MetaBlock):
   log_thread: Optional[Thread] = None
   thread_stop: bool = False
   no_raise: bool = False
+  stats_period: Optional[float] = None
+  stats_file: Optional[Path] = None
 
   prepared_all: bool = False
   launched_all: bool = False
@@ -74,8 +83,14 @@ class Block(Process, metaclass=MetaBlock):
 
     # Various objects that should be set by child classes
     self.niceness: int = 0
+    self.cpu_affinity: Optional[Iterable[int]] = None
+    self.rt_priority: Optional[int] = None
+    self.rt_policy: str = 'fifo'
     self.labels: Optional[Iterable[str]] = None
     self.freq = None
+    self.wake_on_data: bool = False
+    self.spin_budget: float = 2e-3
+    self.catch_up: bool = False
     self.display_freq = False
     self.name = self.get_name(type(self).__name__)
 
@@ -98,8 +113,20 @@ class Block(Process, metaclass=MetaBlock):
     self._last_fps: Optional[float] = None
     self._n_loops: int = 0
 
+    # Objects for scheduling the loops and measuring their lateness
+    self._deadline: Optional[float] = None
+    self._lateness: Optional[np.ndarray] = None
+    self._n_deadlines: int = 0
+    self._n_missed: int = 0
+    self._lateness_sum: float = 0
+    self._lateness_max: float = 0
+
     self._last_values = None
 
+    # The Blocks running in the same Process as this one, see the group method
+    self._group: List[Block] = [self]
+    self._leader: Optional[Block] = None
+
   def __new__(cls, *args, **kwargs):
     """Called when instantiating a new instance of a Block.
 
@@ -126,11 +153,64 @@ class Block(Process, metaclass=MetaBlock):
     cls.names.append(f"crappy.{name}-{i}")
     return f"crappy.{name}-{i}"
 
+  @classmethod
+  def group(cls, *blocks: 'Block') -> None:
+    """Runs several Blocks in a single :obj:`~multiprocessing.Process`.
+
+    By default, each Block runs in its own Process. For lightweight Blocks,
+    like Generators, PIDs or Blocks only processing data at a low rate, it is
+    more efficient to run them together. It reduces the startup time and the
+    memory usage, and the :class:`~crappy.links.Link` between Blocks of a same
+    group become in-process queues that do not need to serialize the data.
+
+    The Blocks of a group are looped cooperatively, each one at its own
+    ``freq``. Their :meth:`prepare`, :meth:`begin` and :meth:`finish` methods
+    are called in the order in which the Blocks are given. As a Block that
+    takes long to loop delays all the other Blocks of its group, Blocks
+    performing blocking or heavy operations (displaying graphs, acquiring
+    images, etc.) should not be grouped.
+
+    This method must be called before :meth:`prepare_all`.
+
+    Args:
+      *blocks: The Blocks to run in a same Process. Each Block can only be
+        part of one group.
+
+    .. versionadded:: 2.0.6
+    """
+
+    if cls.prepared_all:
+      raise RuntimeError("Cannot group Blocks after prepare_all was called !")
+    if len(blocks) < 2:
+      raise ValueError("At least two Blocks are needed for creating a group !")
+    if len(set(blocks)) < len(blocks):
+      raise ValueError("The same Block cannot be given twice in a group !")
+    for block in blocks:
+      if block._leader is not None or len(block._group) > 1:
+        raise ValueError(f"The Block {block.name} is already part of a "
+                         f"group !")
+
+    # The first Block runs all the other ones in its Process
+    leader, *others = blocks
+    leader._group = list(blocks)
+    for block in others:
+      block._leader = leader
+
+  @classmethod
+  def _process_instances(cls) -> List['Block']:
+    """Returns the Blocks that actually run in their own
+    :obj:`~multiprocessing.Process`, i.e. all the Blocks except those grouped
+    with another Block."""
+
+    return [inst for inst in cls.instances if inst._leader is None]
+
   @classmethod
   def start_all(cls,
                 allow_root: bool = False,
                 log_level: Optional[int] = logging.DEBUG,
-                no_raise: bool = False) -> None:
+                no_raise: bool = False,
+                stats_period: Optional[float] = None,
+                stats_file: Optional[Union[str, Path]] = None) -> None:
     """Method for starting a script with Crappy.
 
     It sets the synchronization objects for all the Blocks, renices the
@@ -166,13 +246,26 @@ class Block(Process, metaclass=MetaBlock):
         argument to :obj:`True`.
 
         .. versionadded:: 2.0.0
+      stats_period: If given, the counters of all the Links are collected
+        every ``stats_period`` seconds while the Blocks are running, and
+        logged by the main Process. Refer to :meth:`~crappy.links.Link.stats`
+        for more information.
+
+        .. versionadded:: 2.0.6
+      stats_file: If given, the counters of all the Links are also appended to
+        this file each time they are collected, as one line of JSON per
+        collection. The counters are always collected once more after all the
+        Blocks have stopped if either this argument or ``stats_period`` is
+        given.
+
+        .. versionadded:: 2.0.6
 
     .. versionremoved:: 2.0.0 *t0*, *verbose*, *bg* arguments
     """
 
     cls.prepare_all(log_level)
     cls.renice_all(allow_root)
-    cls.launch_all(no_raise)
+    cls.launch_all(no_raise, stats_period, stats_file)
 
   @classmethod
   def prepare_all(cls, log_level: Optional[int] = logging.DEBUG) -> None:
@@ -233,7 +326,7 @@ class Block(Process, metaclass=MetaBlock):
       cls.cls_log(logging.INFO, 'Logger configured')
 
       # Setting all the synchronization objects at the class level
-      cls.ready_barrier = Barrier(len(cls.instances) + 1)
+      cls.ready_barrier = Barrier(len(cls._process_instances()) + 1)
       cls.shared_t0 = Value('d', -1.0)
       cls.start_event = Event()
       cls.stop_event = Event()
@@ -279,8 +372,16 @@ class Block(Process, metaclass=MetaBlock):
         cls.cls_log(logging.INFO, f"Log level set for the {instance.name} "
                                   f"Block")
 
-      # Starting all the Blocks
-      for instance in cls.instances:
+      # The Links inside a group of Blocks don't need to cross Processes
+      for instance in cls._process_instances():
+        if len(instance._group) > 1:
+          instance._make_local_links()
+          names = ', '.join(block.name for block in instance._group)
+          cls.cls_log(logging.INFO, f"The Blocks {names} will run in the "
+                                    f"same Process")
+
+      # Starting all the Blocks, the grouped ones are run by their leader
+      for instance in cls._process_instances():
         instance.start()
         cls.cls_log(logging.INFO, f'Started the {instance.name} Block')
 
@@ -363,9 +464,11 @@ class Block(Process, metaclass=MetaBlock):
 
       # Renicing all the Blocks
       cls.cls_log(logging.INFO, 'Renicing processes')
-      for inst in cls.instances:
+      for inst in cls._process_instances():
         # If root is not allowed then the minimum niceness is 0
-        niceness = max(inst.niceness, 0 if not allow_root else -20)
+        # A group of Blocks gets the lowest niceness among its Blocks
+        niceness = max(min(block.niceness for block in inst._group),
+                       0 if not allow_root else -20)
 
         # System call for setting the niceness
         if niceness < 0:
@@ -413,7 +516,10 @@ class Block(Process, metaclass=MetaBlock):
       cls._cleanup()
 
   @classmethod
-  def launch_all(cls, no_raise: bool = False) -> None:
+  def launch_all(cls,
+                 no_raise: bool = False,
+                 stats_period: Optional[float] = None,
+                 stats_file: Optional[Union[str, Path]] = None) -> None:
     """The final method being called by the main
     :obj:`~multiprocessing.Process` running a script with Crappy.
 
@@ -432,6 +538,19 @@ class Block(Process, metaclass=MetaBlock):
         execution of code that would come after Crappy, in case Crappy does not
         terminate as expected. This behavior can be disabled by setting this
         argument to :obj:`True`.
+      stats_period: If given, the counters of all the Links are collected
+        every ``stats_period`` seconds while the Blocks are running, and
+        logged by the main Process. Refer to :meth:`~crappy.links.Link.stats`
+        for more information.
+
+        .. versionadded:: 2.0.6
+      stats_file: If given, the counters of all the Links are also appended to
+        this file each time they are collected, as one line of JSON per
+        collection. The counters are always collected once more after all the
+        Blocks have stopped if either this argument or ``stats_period`` is
+        given.
+
+        .. versionadded:: 2.0.6
     
     .. versionremoved:: 2.0.0 *t0*, *verbose* and *bg* arguments
     """
@@ -439,6 +558,10 @@ class Block(Process, metaclass=MetaBlock):
     # Setting the no_raise flag
     cls.no_raise = no_raise
 
+    # Setting the Link statistics options
+    cls.stats_period = stats_period
+    cls.stats_file = Path(stats_file) if stats_file is not None else None
+
     # Flag indicating whether to perform the cleanup action or not
     cleanup = True
 
@@ -475,7 +598,13 @@ class Block(Process, metaclass=MetaBlock):
       # The main Process mustn't finish before all the Blocks are stopped
       cls.cls_log(logging.INFO, 'Main Process done, waiting for all Blocks to '
                                 'finish')
-      for _ in wait([inst.sentinel for inst in cls.instances]):
+      # Periodically collecting the Link statistics if requested
+      sentinels = [inst.sentinel for inst in cls._process_instances()]
+      finished = wait(sentinels, timeout=cls.stats_period)
+      while not finished:
+        cls._report_link_stats()
+        finished = wait(sentinels, timeout=cls.stats_period)
+      for _ in finished:
         cls.cls_log(logging.INFO, "A Block has finished, waiting for the "
                                   "other ones to follow")
 
@@ -562,6 +691,17 @@ class Block(Process, metaclass=MetaBlock):
         cls.cls_log(logging.INFO, "Stopping the USB server")
         USBServer.stop_server()
 
+      # Collecting the Link statistics a last time now that all Blocks stopped
+      if cls.stats_period is not None or cls.stats_file is not None:
+        cls._report_link_stats()
+
+      # Releasing the resources held by the Links, each Link being the output
+      # of exactly one Block
+      for inst in cls.instances:
+        for link in inst.outputs:
+          link._close()
+      cls.cls_log(logging.INFO, "Released the resources held by the Links")
+
       # Stopping the log thread if required
       if get_start_method() == 'spawn' and cls.log_thread is not None:
         cls.thread_stop = True
@@ -629,6 +769,47 @@ class Block(Process, metaclass=MetaBlock):
         # won't come in use anymore
         cls.reset()
 
+  @classmethod
+  def link_stats(cls) -> List[Dict[str, Any]]:
+    """Returns the counters of all the Links between the instantiated Blocks.
+
+    It can be called from the main Process at any time, including while the
+    Blocks are running.
+
+    Returns:
+      A :obj:`list` containing for each Link the :obj:`dict` returned by
+      :meth:`~crappy.links.Link.stats`.
+
+    .. versionadded:: 2.0.6
+    """
+
+    # Each Link is the output of exactly one Block
+    return [link.stats() for inst in cls.instances for link in inst.outputs]
+
+  @classmethod
+  def _report_link_stats(cls) -> None:
+    """Collects the counters of all the Links, logs a summary of them and
+    writes them to the statistics file if one was given."""
+
+    stats = cls.link_stats()
+
+    for stat in stats:
+      if stat['latency_mean'] is not None:
+        latency = (f"latency mean {stat['latency_mean'] * 1e3:.3f}ms, "
+                   f"p99 {stat['latency_p99'] * 1e3:.3f}ms, "
+                   f"max {stat['latency_max'] * 1e3:.3f}ms")
+      else:
+        latency = "no latency measured"
+      cls.cls_log(logging.INFO, f"{stat['name']}: {stat['sent']} sent "
+                                f"({stat['bytes_sent']} bytes), "
+                                f"{stat['received']} received, "
+                                f"{stat['dropped']} dropped, "
+                                f"{stat['backlog']} waiting, {latency}")
+
+    if cls.stats_file is not None:
+      with open(cls.stats_file, 'a') as file:
+        file.write(json.dumps({'t': time(), 'links': stats}) + '\n')
+
   @classmethod
   def _set_logger(cls) -> None:
     """Initializes the logging for the main Process.
@@ -729,6 +910,8 @@ class Block(Process, metaclass=MetaBlock):
     cls.prepared_all = False
     cls.launched_all = False
     cls.no_raise = False
+    cls.stats_period = None
+    cls.stats_file = None
 
     cls.shared_t0 = None
     cls.ready_barrier = None
@@ -785,21 +968,37 @@ class Block(Process, metaclass=MetaBlock):
     It first calls :meth:`prepare`, then waits at the
     :obj:`~multiprocessing.Barrier` for all Blocks to be ready, then calls
     :meth:`begin`, then :meth:`main`, and finally :meth:`finish`.
+
+    Before calling :meth:`prepare`, it sets the CPU affinity and the real-time
+    scheduling policy of the Process if the ``cpu_affinity`` and
+    ``rt_priority`` attributes of the Block are set, see
+    :func:`~crappy.tool.scheduling.set_scheduling`. The helper Processes
+    started afterward by the Block inherit these settings. For a group of
+    Blocks, only the attributes of the first Block of the group are used.
     
     If an exception is raised, sets the shared stop 
     :obj:`~multiprocessing.Event` to warn all the other Blocks.
+
+    .. versionchanged:: 2.0.6 setting the CPU affinity and real-time priority
     """
 
     try:
       # Any Exception caught at the beginning should break the Barrier
       try:
-        # Initializes the Logger for the Block
-        self._set_block_logger()
-        self.log(logging.INFO, "Block launched")
+        # Initializes the Logger for the Block and the ones of its group
+        for block in self._group:
+          block._set_block_logger()
+          block.log(logging.INFO, "Block launched")
+
+        # Setting the CPU affinity and priority before any helper Process is
+        # started, so that they inherit them
+        set_scheduling(self.log, self.cpu_affinity, self.rt_priority,
+                       self.rt_policy)
 
         # Running the preliminary actions before the test starts
-        self.log(logging.INFO, "Block preparing")
-        self.prepare()
+        for block in self._group:
+          block.log(logging.INFO, "Block preparing")
+          block.prepare()
 
       # If an Exception is raised, warning the other Blocks by breaking the
       # Barrier
@@ -826,19 +1025,29 @@ class Block(Process, metaclass=MetaBlock):
         self.log(logging.INFO, "Start time set, Block starting")
 
       # Running the first loop
-      self.log(logging.INFO, "Calling begin method")
-      self.begin()
+      for block in self._group:
+        block.log(logging.INFO, "Calling begin method")
+        block.begin()
 
-      # Setting the attributes for counting the performance
-      self._last_t = time_ns() / 1e9
-      self._last_fps = self._last_t
-      self._n_loops = 0
+        # Setting the attributes for counting the performance
+        block._last_t = time_ns() / 1e9
+        block._last_fps = block._last_t
+        block._n_loops = 0
+        block._deadline = perf_counter()
 
       # Running the main loop until told to stop
       self.log(logging.INFO, "Entering main loop")
-      self.main()
+      if len(self._group) > 1:
+        self._main_group()
+      else:
+        self.main()
       self.log(logging.INFO, "Exiting main loop after stop Event was set")
 
+      # Displaying how well the Blocks kept up with their target frequency
+      for block in self._group:
+        if block._n_deadlines:
+          block._log_jitter()
+
     # A wrong data type was sent through a Link
     except LinkDataError:
       self.log(logging.ERROR, "Tried to send a wrong data type through a Link,"
@@ -914,39 +1123,104 @@ class Block(Process, metaclass=MetaBlock):
       self.log(logging.WARNING, 'Set the raise Event after catching an '
                                 'unexpected Exception while running')
 
-    # In all cases, trying to properly close the Block
+    # In all cases, trying to properly close the Block and its group
     finally:
-      try:
-        self.log(logging.INFO, "Setting the stop Event")
-        self._stop_event.set()
-        self.log(logging.INFO, "Calling the finish method")
-        self.finish()
-      except KeyboardInterrupt:
-        self.log(logging.WARNING, "Caught KeyboardInterrupt while finishing, "
-                                  "ignoring it")
-        # A KeyboardInterrupt should stop the script and be raised as is
-        self._kbi_event.set()
-        self.log(logging.WARNING, 'Set the KbI Event after catching a '
-                                  'KeyboardInterrupt while finishing')
-      except (Exception,) as exc:
-        self._logger.exception("Caught Exception while finishing !",
-                               exc_info=exc)
-        # Any unexpected Exception should stop the script
-        self._raise_event.set()
-        self.log(logging.WARNING, 'Set the raise Event after catching an '
-                                  'unexpected Exception while finishing')
+      for block in self._group:
+        try:
+          block.log(logging.INFO, "Setting the stop Event")
+          block._stop_event.set()
+          block.log(logging.INFO, "Calling the finish method")
+          block.finish()
+        except KeyboardInterrupt:
+          block.log(logging.WARNING, "Caught KeyboardInterrupt while "
+                                     "finishing, ignoring it")
+          # A KeyboardInterrupt should stop the script and be raised as is
+          block._kbi_event.set()
+          block.log(logging.WARNING, 'Set the KbI Event after catching a '
+                                     'KeyboardInterrupt while finishing')
+        except (Exception,) as exc:
+          block._logger.exception("Caught Exception while finishing !",
+                                  exc_info=exc)
+          # Any unexpected Exception should stop the script
+          block._raise_event.set()
+          block.log(logging.WARNING, 'Set the raise Event after catching an '
+                                     'unexpected Exception while finishing')
 
   def main(self) -> None:
     """The main loop of the :meth:`run` method. Repeatedly calls the
-    :meth:`loop` method and manages the looping frequency."""
+    :meth:`loop` method and manages the looping frequency.
+
+    If the ``wake_on_data`` attribute is :obj:`True`, the :meth:`loop` method
+    is only called when data is available in at least one of the input
+    :class:`~crappy.links.Link`, and the Block sleeps the rest of the time.
+    The looping frequency is then at most ``freq``, if it is set.
+
+    Otherwise, if ``freq`` is set, the loops are scheduled on absolute
+    deadlines. The ``spin_budget`` attribute sets how long before each deadline
+    the Block stops sleeping and starts actively waiting, which improves the
+    timing accuracy at the cost of CPU usage. The ``catch_up`` attribute
+    selects whether the missed loops are caught up or skipped. The lateness of
+    the loops is available through :meth:`jitter_stats`.
+
+    .. versionchanged:: 2.0.6 added the *wake_on_data* mode
+    .. versionchanged:: 2.0.6 scheduling on absolute deadlines
+    """
 
     # Looping until told to stop or an error occurs
     while not self._stop_event.is_set():
+
+      # In wake on data mode, only looping when there's data to process
+      # The timeout ensures the stop Event is regularly checked
+      if self.wake_on_data and self.inputs:
+        if not self.wait_for_data(timeout=0.1):
+          continue
+
       self.log(logging.DEBUG, "Looping")
       self.loop()
       self.log(logging.DEBUG, "Handling freq")
       self._handle_freq()
 
+  def _main_group(self) -> None:
+    """The main loop of a Block running a group of Blocks in its Process, see
+    :meth:`group`.
+
+    The Blocks of the group are looped in turn, each one only if its looping
+    period is elapsed and, in wake on data mode, if data is available in one
+    of its input Links. In between, the Process sleeps until the next Block is
+    due.
+    """
+
+    while not self._stop_event.is_set():
+
+      for block in self._group:
+        if block.freq is not None:
+          deadline = block._next_deadline()
+          if perf_counter() < deadline:
+            continue
+        if block.wake_on_data and block.inputs and not block.data_available():
+          continue
+        if block.freq is not None:
+          block._record_deadline(deadline, perf_counter())
+
+        block.log(logging.DEBUG, "Looping")
+        block.loop()
+        block._count_loop(time_ns() / 1e9)
+
+        if self._stop_event.is_set():
+          return
+
+      # Finding when the next Block will be due, the Blocks waiting for data
+      # are checked every millisecond and the stop Event at least every 0.1s
+      t = perf_counter()
+      next_t = t + 0.1
+      for block in self._group:
+        due = block._next_deadline() if block.freq is not None else t
+        if block.wake_on_data and block.inputs:
+          due = max(due, t + 1e-3)
+        next_t = min(next_t, due)
+
+      sleep(max(0., next_t - t))
+
   def prepare(self) -> None:
     """This method should perform any action required for initializing the
     Block before the test starts.
@@ -1022,25 +1296,117 @@ class Block(Process, metaclass=MetaBlock):
     """This method ensures that the Block loops at the desired frequency, or as
     fast as possible if the requested frequency cannot be achieved.
 
+    The loops are scheduled on absolute deadlines, so that the lateness of one
+    loop does not delay the next ones and the Block does not drift from the
+    target frequency. The Block sleeps until ``spin_budget`` seconds before
+    the deadline, and then actively waits for it to compensate for the
+    inaccuracy of :func:`time.sleep`. When a deadline is missed by more than
+    one period, the Block either loops as fast as possible until it catches up
+    if ``catch_up`` is :obj:`True`, or otherwise skips the missed loops.
+
     It also displays the looping frequency of the Block if requested by the
     user. If no looping frequency is specified, the Block will loop as fast as
     possible.
-    """
 
-    self._n_loops += 1
-    t = time_ns() / 1e9
+    .. versionchanged:: 2.0.6 scheduling on absolute deadlines
+    """
 
     # Only handling frequency if requested
     if self.freq is not None:
+      deadline = self._next_deadline()
+
+      # Sleeping until shortly before the deadline, then actively waiting
+      remaining = deadline - perf_counter()
+      if remaining > self.spin_budget:
+        sleep(remaining - self.spin_budget)
+      while perf_counter() < deadline:
+        pass
+
+      self._record_deadline(deadline, perf_counter())
 
-      # Correcting the error of the sleep function through a recursive approach
-      # The last 2 milliseconds are in free loop
-      remaining = self._last_t + 1 / self.freq - t
-      while remaining > 0:
-        t = time_ns() / 1e9
-        remaining = self._last_t + 1 / self.freq - t
-        sleep(max(0., remaining / 2 - 2e-3))
+    self._count_loop(time_ns() / 1e9)
+
+  def _next_deadline(self) -> float:
+    """Returns the time at which the next loop should start, in the time
+    base of :func:`time.perf_counter`."""
+
+    if self._deadline is None:
+      self._deadline = perf_counter()
+    return self._deadline + 1 / self.freq
+
+  def _record_deadline(self, deadline: float, t: float) -> None:
+    """Records the lateness of a loop starting at ``t`` instead of
+    ``deadline``, and sets the reference for the next deadline.
+
+    In wake on data mode, the Block loops at most at the target frequency and
+    its lateness is not relevant, so the next deadline is simply one period
+    after the current loop.
+    """
+
+    if self.wake_on_data and self.inputs:
+      self._deadline = max(deadline, t)
+      return
+
+    lateness = t - deadline
+    if self._lateness is None:
+      self._lateness = np.zeros(_n_lateness)
+    self._lateness[self._n_deadlines % _n_lateness] = lateness
+    self._n_deadlines += 1
+    self._lateness_sum += lateness
+    self._lateness_max = max(self._lateness_max, lateness)
+
+    # At least one loop was missed, deciding whether to catch up or to skip
+    period = 1 / self.freq
+    if lateness >= period:
+      self._n_missed += 1
+      if not self.catch_up:
+        deadline += int(lateness / period) * period
+
+    self._deadline = deadline
+
+  def jitter_stats(self) -> Dict[str, Optional[float]]:
+    """Returns statistics on the lateness of the loops of the Block with
+    respect to their deadlines.
+
+    The lateness is only measured when the ``freq`` attribute of the Block is
+    set, and not in wake on data mode. It should be called from the Process of
+    the Block, typically in :meth:`finish`.
+
+    Returns:
+      A :obj:`dict` containing the number of loops scheduled, the number of
+      missed deadlines, and the mean, 99th percentile and maximum lateness in
+      seconds. The 99th percentile is computed over the last 10000 loops. The
+      lateness values are :obj:`None` if no loop was scheduled yet.
 
+    .. versionadded:: 2.0.6
+    """
+
+    if not self._n_deadlines:
+      return {'loops': 0, 'missed': 0, 'mean': None, 'p99': None,
+              'max': None}
+
+    recent = self._lateness[:min(self._n_deadlines, _n_lateness)]
+    return {'loops': self._n_deadlines,
+            'missed': self._n_missed,
+            'mean': self._lateness_sum / self._n_deadlines,
+            'p99': float(np.percentile(recent, 99)),
+            'max': self._lateness_max}
+
+  def _log_jitter(self) -> None:
+    """Logs a summary of the lateness of the loops of the Block."""
+
+    stats = self.jitter_stats()
+    self.log(logging.INFO, f"Lateness over {stats['loops']} loops: mean "
+                           f"{stats['mean'] * 1e6:.1f}µs, p99 "
+                           f"{stats['p99'] * 1e6:.1f}µs, max "
+                           f"{stats['max'] * 1e6:.1f}µs, "
+                           f"{stats['missed']} missed deadline(s)")
+
+  def _count_loop(self, t: float) -> None:
+    """Counts the loops of the Block, sets the time of the last loop, and
+    displays the looping frequency if requested."""
+
+    self._n_loops += 1
     self._last_t = t
 
     # Displaying frequency every 2 seconds
@@ -1048,6 +1414,8 @@ class Block(Process, metaclass=MetaBlock):
       self.log(
         logging.INFO,
         f"loops/s: {self._n_loops / (self._last_t - self._last_fps)}")
+      if self._n_deadlines:
+        self._log_jitter()
 
       self._n_loops = 0
       self._last_fps = self._last_t
@@ -1075,6 +1443,15 @@ class Block(Process, metaclass=MetaBlock):
 
     self._logger = logger
 
+  def _make_local_links(self) -> None:
+    """Turns the Links between the Blocks of the group into in-process
+    queues."""
+
+    for block in self._group:
+      for link in block.outputs:
+        if any(link in other.inputs for other in self._group):
+          link._make_local()
+
   @property
   def debug(self) -> Optional[bool]:
     """Indicates whether the debug information should be displayed or not.
@@ -1187,9 +1564,65 @@ class Block(Process, metaclass=MetaBlock):
         raise
 
     # Sending the data to the downstream Blocks
+    self.log(logging.DEBUG, f"Sending {data} to the Links "
+                            f"{[link.name for link in self.outputs]}")
+    self._send_to_outputs(data)
+
+  def send_batch(self, data: Dict[str, Iterable[Any]]) -> None:
+    """Method for sending several data points at once to downstream Blocks.
+
+    The data is given in a columnar way, as a :obj:`dict` whose keys are the
+    labels and whose values are iterables (preferably :mod:`numpy` arrays) all
+    having the same length. It is sent as a single
+    :class:`~crappy.links.Batch` message, which is much more efficient than
+    calling :meth:`send` once for each data point.
+
+    The downstream Blocks can receive the data with any of the ``recv``
+    methods. It is however most efficiently received with
+    :meth:`recv_batch_data`.
+
+    .. versionadded:: 2.0.6
+    """
+
+    # Just in case, not handling non-existing data
+    if data is None:
+      return
+
+    try:
+      batch = Batch.from_columns(data)
+    except (ValueError, TypeError):
+      self.log(logging.ERROR, "Cannot send the data as a batch ! Please "
+                              "ensure that the data is given as a dict of "
+                              "one-dimensional iterables all having the same "
+                              "length.")
+      raise LinkDataError
+
+    # No need to send empty batches
+    if not batch.n_points:
+      return
+
+    # Sending the data to the downstream Blocks
+    self.log(logging.DEBUG, f"Sending batch of {batch.n_points} points to the "
+                            f"Links {[link.name for link in self.outputs]}")
+    self._send_to_outputs(batch)
+
+  def _send_to_outputs(self, data: Dict[str, Any]) -> None:
+    """Sends the given data to all the output :class:`~crappy.links.Link`.
+
+    The data is serialized only once, and the same serialized data is sent to
+    all the Links without Modifiers. The Links with Modifiers receive the
+    actual data, as the Modifiers need to work on it.
+    """
+
+    payload = None
+
     for link in self.outputs:
-      self.log(logging.DEBUG, f"Sending {data} to Link {link.name}")
-      link.send(data)
+      if link.needs_value():
+        link.send(data)
+      else:
+        if payload is None:
+          payload = Link.serialize(data)
+        link.send_serialized(payload)
 
   def data_available(self) -> bool:
     """Returns :obj:`True` if there's data available for reading in at least
@@ -1201,6 +1634,55 @@ class Block(Process, metaclass=MetaBlock):
     self.log(logging.DEBUG, "Data availability requested")
     return self.inputs and any(link.poll() for link in self.inputs)
 
+  def wait_for_data(self, timeout: Optional[float] = None) -> bool:
+    """Blocks until data is available in at least one of the input
+    :class:`~crappy.links.Link`, or until the timeout expires.
+
+    All the input Links are waited upon at once, and the Block consumes no CPU
+    while waiting. The Links using the ``'shm'`` transport cannot be waited
+    upon this way, so they are polled once every millisecond instead.
+
+    Args:
+      timeout: The maximum time to wait for data, in seconds. If :obj:`None`,
+        waits until data is available.
+
+    Returns:
+      :obj:`True` if data is available for reading, :obj:`False` if the
+      timeout expired.
+
+    .. versionadded:: 2.0.6
+    """
+
+    # Returning immediately if data is already available
+    if self.data_available():
+      return True
+
+    # Without input Links, there is no data to wait for
+    if not self.inputs:
+      if timeout is not None:
+        sleep(timeout)
+      return False
+
+    conns = [link._wait_object() for link in self.inputs]
+    waitable = [conn for conn in conns if conn is not None]
+
+    # If all the Links support it, simply waiting on all of them at once
+    if len(waitable) == len(conns):
+      return bool(wait(waitable, timeout))
+
+    # Otherwise, waiting on the supported ones and regularly polling the others
+    t_stop = None if timeout is None else time() + timeout
+    while True:
+      step = 1e-3 if t_stop is None else min(1e-3, t_stop - time())
+      if step <= 0:
+        return False
+      if waitable:
+        wait(waitable, step)
+      else:
+        sleep(step)
+      if self.data_available():
+        return True
+
   def recv_data(self) -> Dict[str, Any]:
     """Reads the first available values from each incoming
     :class:`~crappy.links.Link` and returns them all in a single dict.
@@ -1389,3 +1871,62 @@ class Block(Process, metaclass=MetaBlock):
     self.log(logging.DEBUG, f"Called recv_all_data_raw, got "
                             f"{[dict(dic) for dic in ret]}")
     return [dict(dic) for dic in ret]
+
+  def recv_batch_data(self,
+                      delay: Optional[float] = None,
+                      poll_delay: float = 0.1) -> Dict[str, np.ndarray]:
+    """Reads all the available values from each incoming
+    :class:`~crappy.links.Link`, and returns them all in a single dict of
+    :mod:`numpy` arrays.
+
+    This method is similar to :meth:`recv_all_data`, except the values are
+    returned as arrays. Data sent with :meth:`send_batch` is concatenated
+    array-wise, which avoids handling each data point separately.
+
+    Important:
+      If data is received over a same label from different Links, part of it
+      will be lost ! Always avoid using a same label twice in a Crappy script.
+
+    Args:
+      delay: If given specifies a delay, as a :obj:`float`, during which the
+        method acquired data before returning. All the data received during
+        this delay is saved and returned. Otherwise, just reads all the
+        available data and returns as soon as it is exhausted.
+      poll_delay: If the ``delay`` argument is given, the Links will be polled
+        once every this value seconds. It ensures that the method doesn't spam
+        the CPU in vain.
+
+    Returns:
+      A :obj:`dict` whose keys are the received labels and with a 1D
+      :obj:`numpy.ndarray` of received values for each key. The first item in
+      the array is the oldest one available in the Link, the last item is the
+      newest available.
+      Values that cannot be stacked together, like arrays of different
+      shapes, are returned in a 1D array of objects.
+
+    .. versionadded:: 2.0.6
+    """
+
+    ret = defaultdict(list)
+    t0 = time()
+
+    # If simple recv_all, just receiving from all input links
+    if delay is None:
+      for link in self.inputs:
+        for label, values in link.recv_batch().items():
+          ret[label] = [values]
+
+    # Otherwise, receiving during the given period
+    else:
+      while time() - t0 < delay:
+        last_t = time()
+        # Updating the list of received arrays
+        for link in self.inputs:
+          for label, values in link.recv_batch().items():
+            ret[label].append(values)
+        # Sleeping to avoid useless CPU usage
+        sleep(max(0., last_t + poll_delay - time()))
+
+    ret = {label: concatenate(values) for label, values in ret.items()}
+    self.log(logging.DEBUG, f"Called recv_batch_data, got {ret}")
+    return ret
@@ -186,7 +186,7 @@ class Multiplexer(Block):
 
     # Building the dict of values to send
     for label, values in self._data.items():
-      to_send[label] = list(np.interp(interp_times, values[0], values[1]))
+      to_send[label] = np.interp(interp_times, values[0], values[1])
       # Keeping the last data point before max_t to pass this information on
       last = values[:, values[0] <= max_t][:, -1]
       # Removing the used values from the buffer, except the last data point
@@ -194,11 +194,10 @@ class Multiplexer(Block):
 
     if to_send:
       # Adding the time values to the dict of values to send
-      to_send[self._time_label] = list(interp_times)
+      to_send[self._time_label] = interp_times
 
-      # Sending the values
-      for i, _ in enumerate(interp_times):
-        self.send({label: values[i] for label, values in to_send.items()})
+      # Sending all the interpolated values at once
+      self.send_batch(to_send)
 
   @staticmethod
   def _default_array() -> np.ndarray:
@@ -70,6 +70,7 @@ class VideoExtenso(Camera):
                border: int = 5,
                min_area: int = 150,
                blur: Optional[int] = 5,
+               process_workers: int = 1,
                **kwargs) -> None:
     """Sets the arguments and initializes the parent class.
 
@@ -193,7 +194,7 @@ class VideoExtenso(Camera):
         recording the images. It should be one of:
         ::
 
-          'sitk', 'cv2', 'pil', 'npy'
+          'sitk', 'cv2', 'pil', 'npy', 'raw'
 
         They correspond to the modules :mod:`SimpleITK`, :mod:`cv2` (OpenCV),
         :mod:`PIL` (Pillow Fork), and :mod:`numpy`. Note that the ``'npy'``
@@ -203,8 +204,14 @@ class VideoExtenso(Camera):
         Python must of course be installed. If not provided and ``save_images``
         is :obj:`True`, the backends are tried in the same order as given above
         and the first available one is used. ``'npy'`` is always available.
+        The ``'raw'`` backend is never selected by default. It appends all the
+        images to a few large container files instead of creating one file
+        per image, which is much lighter on the filesystem at high framerates.
+        It also ignores ``img_extension``. The containers can be read back
+        with :class:`~crappy.camera.FileReader`.
 
         .. versionadded:: 1.5.10
+        .. versionchanged:: 2.0.6 added the *'raw'* backend
       image_generator: A callable taking two :obj:`float` as arguments and
         returning an image as a :obj:`numpy.array`. **This argument is intended
         for use in the examples of Crappy, to apply an artificial strain on a
@@ -275,7 +282,19 @@ class VideoExtenso(Camera):
         the spot detection. If not given, no blurring is performed. A slight
         blur improves the spot detection by smoothening the noise, but also
         takes a bit more time compared to no blurring.
-      **kwargs: Any additional argument will be passed to the
+      process_workers: The number of
+        :class:`~crappy.blocks.camera_processes.VideoExtensoProcess` tracking
+        the spots in parallel, each of them on one frame out of
+        ``process_workers``. The spots then move more between two frames
+        processed by a same process, so ``safe_mode`` might be triggered more
+        easily. The data is sent downstream in the order of the frames. The
+        default is 1.
+
+        .. versionadded:: 2.0.6
+      **kwargs: The ``ring_size``, ``save_workers``, ``save_metadata_period``
+        and ``save_metadata_sidecar`` arguments are passed to the
+        :class:`~crappy.blocks.Camera` Block, see its documentation. Any other
+        additional argument will be passed to the
         :class:`~crappy.camera.Camera` object, and used as a kwarg to its
         :meth:`~crappy.camera.Camera.open` method.
 
@@ -302,6 +321,7 @@ class VideoExtenso(Camera):
                      image_generator=image_generator,
                      img_shape=img_shape,
                      img_dtype=img_dtype,
+                     process_workers=process_workers,
                      **kwargs)
 
     # Forcing the labels into a list
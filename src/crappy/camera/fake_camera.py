@@ -1,25 +1,37 @@
 # coding: utf-8
 
-from time import time
+from time import time, sleep, perf_counter
 from typing import Tuple, Optional
 import numpy as np
 import logging
 
 from .meta_camera import Camera
+from .._global import resources
 
 
 class FakeCamera(Camera):
   """This camera class generates images without requiring any actual camera or
   existing image file.
 
-  The generated images are just a gradient of grey levels, with a line moving
-  as a function of time. It is possible to tune the dimension of the image, the
-  frame rate and the speed of the moving line.
-  
+  The generated images are either a gradient of grey levels or a speckle
+  pattern, moving as a function of time. It is possible to tune the dimension
+  of the image, its bit depth, the frame rate and the speed of the motion.
+
+  The images are returned at the requested frame rate by sleeping until the
+  time of the next image, so that this Camera barely uses any CPU and can be
+  used as a realistic load generator. The returned images are read-only views
+  on a precomputed buffer, so no new image is allocated for each frame.
+
   .. versionadded:: 1.4.0
   .. versionchanged:: 2.0.0 renamed from *Fake_camera* to *FakeCamera*
+  .. versionchanged:: 2.0.6
+     sleeping between the images and returning views on a precomputed buffer
   """
 
+  # How long before the time of the next image to stop sleeping and start
+  # actively waiting, to compensate for the inaccuracy of sleep
+  spin_budget: float = 5e-4
+
   def __init__(self) -> None:
     """Initializes the parent class and instantiates the settings."""
 
@@ -28,17 +40,23 @@ class FakeCamera(Camera):
 
     self.add_scale_setting('width', 1, 4096, None, self._gen_image, 1280, 1)
     self.add_scale_setting('height', 1, 4096, None, self._gen_image, 720, 1)
+    self.add_scale_setting('bit_depth', 8, 16, None, self._gen_image, 8, 1)
+    self.add_choice_setting('pattern', ('gradient', 'speckle'), None,
+                            self._gen_image, 'gradient')
     self.add_scale_setting('speed', 0., 800., None, None, 400., 0.8)
     self.add_scale_setting('fps', 0.1, 100., None, None, 50., 0.1)
 
     self._t0 = time()
     self._t = self._t0
+    self._deadline: Optional[float] = None
 
   def open(self,
            width: int = 1280,
            height: int = 720,
            speed: float = 100.,
-           fps: float = 50.) -> None:
+           fps: float = 50.,
+           bit_depth: int = 8,
+           pattern: str = 'gradient') -> None:
     """Sets the settings, initializes the first image and starts the time
     counter.
 
@@ -47,37 +65,73 @@ class FakeCamera(Camera):
       height: The height of the image to generate in pixels.
       speed: The evolution speed of the image, in pixels per second.
       fps: The maximum update frequency of the generated images.
-    
+      bit_depth: The number of significant bits of the generated images,
+        between 8 and 16. The images are of type `uint8` for 8 bits, and of
+        type `uint16` otherwise.
+
+        .. versionadded:: 2.0.6
+      pattern: The image to generate, either ``'gradient'`` for a gradient of
+        grey levels or ``'speckle'`` for a speckle pattern. The speckle
+        pattern is the one from :attr:`crappy.resources.speckle`, tiled to
+        the dimension of the image, and requires :mod:`cv2`.
+
+        .. versionadded:: 2.0.6
+
     .. versionadded:: 2.0.0
        *width*, *height*, *speed* and *fps* arguments explicitly listed
     """
 
-    self.set_all(width=width, height=height, speed=speed, fps=fps)
+    self.set_all(width=width, height=height, speed=speed, fps=fps,
+                 bit_depth=bit_depth, pattern=pattern)
 
     self._gen_image()
 
   def get_image(self) -> Tuple[float, np.ndarray]:
     """Returns the updated image, depending only on the current timestamp.
 
-    Also includes a waiting loop in order to achieve the right frame rate.
+    Also waits until the time of the next image in order to achieve the right
+    frame rate.
     """
 
-    # Waiting in order to achieve the right frame rate
-    while time() - self._t < 1 / self.fps:
+    # Sleeping until shortly before the next image, then actively waiting
+    if self._deadline is None:
+      self._deadline = perf_counter()
+    self._deadline += 1 / self.fps
+    remaining = self._deadline - perf_counter()
+    if remaining > self.spin_budget:
+      sleep(remaining - self.spin_budget)
+    while perf_counter() < self._deadline:
       pass
 
+    # Not trying to catch up if a deadline was missed by more than one image
+    if perf_counter() - self._deadline > 1 / self.fps:
+      self._deadline = perf_counter()
+
     self._t = time()
     self._frame_nr += 1
 
-    # Splitting the image to make a moving line
+    # Taking a window in the doubled image to make a moving image
     row = int(self.speed * (self._t - self._t0)) % self.height
-    return self._t, np.concatenate((self._img[row:], self._img[:row]), axis=0)
+    return self._t, self._img[row:row + self.height]
 
   def _gen_image(self, _: Optional[float] = None) -> None:
-    """Generates the base gradient image, that will be split and returned
-    in the :meth:`get_image` method."""
+    """Generates the base image stacked twice vertically, in which a window
+    is taken in the :meth:`get_image` method."""
 
     self.log(logging.DEBUG, "Generating the image")
-    self._img = np.arange(self.height) * 255. / self.height
-    self._img = np.repeat(self._img.reshape(self.height, 1),
-                          self.width, axis=1).astype(np.uint8)
+
+    if self.pattern == 'speckle':
+      speckle = resources.speckle
+      img = np.tile(speckle, (-(-self.height // speckle.shape[0]),
+                              -(-self.width // speckle.shape[1])))
+      img = img[:self.height, :self.width] / 255.
+    else:
+      img = np.arange(self.height) / self.height
+      img = np.repeat(img.reshape(self.height, 1), self.width, axis=1)
+
+    # Scaling the image to the requested bit depth
+    dtype = np.uint8 if self.bit_depth <= 8 else np.uint16
+    img = (img * (2 ** self.bit_depth - 1)).astype(dtype)
+
+    self._img = np.concatenate((img, img), axis=0)
+    self._img.flags.writeable = False
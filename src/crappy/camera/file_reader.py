@@ -1,13 +1,16 @@
 # coding: utf-8
 
 from time import time, sleep
-from typing import Tuple, Union, Optional
+from typing import Tuple, Union, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import numpy as np
 from pathlib import Path
 from re import fullmatch
 import logging
 
 from .meta_camera import Camera
+from ..tool.raw_container import RawFrameReader, list_containers
 from .._global import OptionalModule, ReaderStop
 
 try:
@@ -30,15 +33,27 @@ class FileReader(Camera):
   :class:`~crappy.blocks.Camera` of Crappy, so images recorded via Crappy are
   readily readable and don't need to be re-named.
 
+  It can also read the container files recorded by the
+  :class:`~crappy.blocks.Camera` Block with the ``'raw'`` backend. In that
+  case, the images are not decoded but directly read from the containers
+  mapped in memory.
+
   This class tries to read the images at the same framerate as they were
   recorded, although the control of the framerate is not so precise. It might
   be that the images cannot be read fast enough to match the original
   framerate, in which case the images are read as fast as possible and the
-  delay keeps growing.
+  delay keeps growing. The framerate can also be ignored altogether, in which
+  case all the images are read as fast as possible.
+
+  The images are read and decoded ahead of time by a small pool of threads, so
+  that a few images are always ready to be returned. This allows to keep up
+  with higher framerates, especially for large compressed images.
   
   .. versionadded:: 1.4.0
   .. versionchanged:: 1.5.10 renamed from *Streamer* to *File_reader*
   .. versionchanged:: 2.0.0 renamed from *File_reader* to *FileReader*
+  .. versionchanged:: 2.0.6 can read the containers of the *'raw'* backend
+  .. versionchanged:: 2.0.6 reading the images ahead of time in threads
   """
 
   def __init__(self) -> None:
@@ -53,15 +68,26 @@ class FileReader(Camera):
     self._t0 = None
     self._stopped = False
 
+    # The pool of threads reading the images, and the images being read
+    self._pool: Optional[ThreadPoolExecutor] = None
+    self._pending = deque()
+    self._read_ahead = 1
+    self._realtime = True
+
   def open(self,
            reader_folder: Union[Path, str],
            reader_backend: Optional[str] = None,
-           stop_at_end: bool = True) -> None:
+           stop_at_end: bool = True,
+           realtime: bool = True,
+           read_ahead: int = 8,
+           n_threads: int = 2) -> None:
     """Sets the reader backend and retrieves the images to read, sorted by
-    their timestamp.
+    their timestamp. Then, starts reading the first images.
 
     Args:
       reader_folder: The path to the folder containing the images to read.
+        If it contains containers recorded with the ``'raw'`` backend, the
+        images are read from them and the other images are ignored.
       
         .. versionchanged:: 1.5.10 renamed from *path* to *reader_folder*
       reader_backend: The backend to use for reding the images. Should be one
@@ -70,7 +96,8 @@ class FileReader(Camera):
 
           'sitk' or 'cv2'
 
-        If not given, SimpleITK is preferred over OpenCV if available.
+        If not given, SimpleITK is preferred over OpenCV if available. Ignored
+        when reading from containers.
 
         .. versionadded:: 1.5.10
       stop_at_end: If :obj:`True` (the default), stops the Crappy script once
@@ -78,11 +105,62 @@ class FileReader(Camera):
         while waiting for the test to finish.
 
         .. versionadded:: 1.5.10
+      realtime: If :obj:`True` (the default), the images are returned at the
+        same framerate as they were recorded. Otherwise, they are returned as
+        fast as possible, which is useful for post-processing recorded images.
+
+        .. versionadded:: 2.0.6
+      read_ahead: The maximum number of images read in advance and waiting to
+        be returned. Each of them takes as much memory as one image.
+
+        .. versionadded:: 2.0.6
+      n_threads: The number of threads reading and decoding the images in
+        parallel. As the decoding mostly releases the GIL, using more threads
+        can help reaching higher framerates on multicore machines.
+
+        .. versionadded:: 2.0.6
 
     .. versionremoved::
        1.5.10 *pattern*, *start_delay* and *modifier* arguments
     """
 
+    if read_ahead < 1:
+      raise ValueError(f"The read_ahead argument should be at least 1, got "
+                       f"{read_ahead} !")
+    if n_threads < 1:
+      raise ValueError(f"The n_threads argument should be at least 1, got "
+                       f"{n_threads} !")
+
+    self._stop_at_end = stop_at_end
+    self._realtime = realtime
+    self._read_ahead = read_ahead
+    self._pool = ThreadPoolExecutor(max_workers=n_threads,
+                                    thread_name_prefix='FileReader')
+
+    # Making sure that the given folder is valid
+    folder = Path(reader_folder)
+    if not folder.exists() or not folder.is_dir():
+      raise FileNotFoundError(f"The {folder} folder does not exist or is not "
+                              f"a folder !")
+
+    # Reading from the containers if the images were recorded in raw format
+    containers = list_containers(folder)
+    if containers:
+      self._backend = 'raw'
+      readers = [RawFrameReader(path) for path in containers]
+      # The frames are stored in the order of acquisition in each container
+      images = [(reader, i) for reader in readers for i in range(len(reader))]
+      if not images:
+        raise FileNotFoundError(f"The containers in the {folder} folder do "
+                                f"not contain any image !")
+
+      self.log(logging.INFO, f"Detected {len(images)} images in "
+                             f"{len(containers)} container(s) in the "
+                             f"{folder} folder")
+      self._images = iter(images)
+      self._submit()
+      return
+
     # Selecting an  available backend between first sitk and then cv2
     if reader_backend is None:
       if not isinstance(Sitk, OptionalModule):
@@ -100,14 +178,6 @@ class FileReader(Camera):
       raise ValueError("The backend argument should be either 'sitk' or "
                        "'cv2' !")
 
-    self._stop_at_end = stop_at_end
-
-    # Making sure that the given folder is valid
-    folder = Path(reader_folder)
-    if not folder.exists() or not folder.is_dir():
-      raise FileNotFoundError(f"The {folder} folder does not exist or is not "
-                              f"a folder !")
-
     # Retrieving all the images in the given folder that match the name pattern
     images = (path for path in folder.glob('*') if
               fullmatch(r'\d+_\d+\.\d+\..+\Z', path.name) is not None)
@@ -127,13 +197,14 @@ class FileReader(Camera):
 
     # The images are stored as an iterator
     self._images = iter(images)
+    self._submit()
 
   def get_image(self) -> Optional[Tuple[float, np.ndarray]]:
-    """Reads the next image in the image folder, and returns it at the right
-    time so that the achieved framerate matches the original framerate.
+    """Returns the next image in the image folder, at the right time so that
+    the achieved framerate matches the original framerate.
 
-    If the original framerate cannot be achieved, just reads the image as fast
-    as possible.
+    If the original framerate cannot be achieved or if it should be ignored,
+    just returns the images as fast as possible.
 
     By default, stops the test when there's no image left to read. If specified
     otherwise, just remains idle until the test ends.
@@ -148,35 +219,71 @@ class FileReader(Camera):
       sleep(0.1)
       return
 
-    try:
-      # Getting the next image to read and its timestamp
-      img_path = next(self._images)
-      timestamp = float(fullmatch(r'\d+_(\d+\.\d+)', img_path.stem).group(1))
+    # Case when there's no more image to read
+    if not self._pending:
+      # Default behavior, stop the test
+      if self._stop_at_end:
+        raise ReaderStop
+      # Otherwise, nothing more gets done but the test goes on
+      self._stopped = True
+      self.log(logging.WARNING, "Exhausted all the images to read for the "
+                                "FileReader camera, staying idle until the "
+                                "script ends")
+      return
 
-      self.log(logging.DEBUG, f"Reading image {img_path} with timestamp "
-                              f"{timestamp}")
+    # Getting the next image, and starting to read another one
+    timestamp, img = self._pending.popleft().result()
+    self._submit()
 
-      # Reading the image data with the chosen backend
-      if self._backend == 'sitk':
-        img = Sitk.GetArrayFromImage(Sitk.ReadImage(img_path))
-      else:
-        img = cv2.imread(str(img_path), 0)
+    # Delaying the return of the image if we're ahead of time
+    t = time()
+    if self._realtime and t - self._t0 < timestamp:
+      sleep(timestamp - (t - self._t0))
 
-      # Delaying the return of the image if we're ahead of time
-      t = time()
-      if t - self._t0 < timestamp:
-        sleep(timestamp - (t - self._t0))
+    return t, img
 
-      return t, img
+  def close(self) -> None:
+    """Stops the threads reading the images."""
 
-    # Raised when there's no more image to read
-    except StopIteration:
-      # Default behavior, stop the test
-      if self._stop_at_end:
-        raise ReaderStop
-      else:
-        # Otherwise, nothing more gets done but the test goes on
-        self._stopped = True
-        self.log(logging.WARNING, "Exhausted all the images to read for the "
-                                  "FileReader camera, staying idle until the "
-                                  "script ends")
+    if self._pool is not None:
+      for future in self._pending:
+        future.cancel()
+      self._pending.clear()
+      self._pool.shutdown()
+      self._pool = None
+
+  def _submit(self) -> None:
+    """Sends images to read to the threads, until ``read_ahead`` images are
+    being read or waiting to be returned, or there's no image left."""
+
+    while len(self._pending) < self._read_ahead:
+      try:
+        item = next(self._images)
+      except StopIteration:
+        return
+      self._pending.append(self._pool.submit(self._read, item))
+
+  def _read(self, item: Any) -> Tuple[float, np.ndarray]:
+    """Reads an image with the chosen backend, and returns it along with its
+    timestamp.
+
+    This method is called by the threads of the pool.
+    """
+
+    # Reading the image from its container, it is copied as the mapped frames
+    # are read-only
+    if self._backend == 'raw':
+      reader, index = item
+      timestamp = float(reader.timestamps[index])
+      self.log(logging.DEBUG, f"Reading image {index} of {reader.path} with "
+                              f"timestamp {timestamp}")
+      return timestamp, np.array(reader[index])
+
+    timestamp = float(fullmatch(r'\d+_(\d+\.\d+)', item.stem).group(1))
+    self.log(logging.DEBUG, f"Reading image {item} with timestamp "
+                            f"{timestamp}")
+
+    # Reading the image data with the chosen backend
+    if self._backend == 'sitk':
+      return timestamp, Sitk.GetArrayFromImage(Sitk.ReadImage(item))
+    return timestamp, cv2.imread(str(item), 0)
@@ -1,3 +1,5 @@
 # coding: utf-8
 
+from .batch import Batch
 from .link import Link, link
+from .shm_ring import SharedMemoryRing
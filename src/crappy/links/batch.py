@@ -0,0 +1,84 @@
+# coding: utf-8
+
+from typing import Dict, Any, List, Iterable
+import numpy as np
+
+
+def concatenate(parts: Iterable[Any]) -> np.ndarray:
+  """Concatenates the given sequences of values of a same label into a single
+  1D :mod:`numpy` array.
+
+  If the values cannot be stacked in a regular array, for example because
+  they are arrays of different shapes, they are returned in an array of
+  objects holding one value per data point instead.
+
+  .. versionadded:: 2.0.6
+  """
+
+  parts = list(parts)
+  try:
+    return np.concatenate([np.asarray(part) for part in parts])
+  except (ValueError, TypeError):
+    values = [value for part in parts for value in part]
+    ret = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+      ret[i] = value
+    return ret
+
+
+class Batch(dict):
+  """Columnar message carrying several data points at once through a
+  :class:`~crappy.links.Link`.
+
+  It is a :obj:`dict` whose keys are the labels, and whose values are 1D
+  :mod:`numpy` arrays all having the same length. The i-th data point is made
+  of the i-th value of each array. Sending one Batch instead of one dict per
+  data point greatly reduces the overhead of the Links at high data rates.
+
+  Batches are normally created by :meth:`~crappy.blocks.Block.send_batch`, and
+  there is usually no need to instantiate them manually.
+
+  .. versionadded:: 2.0.6
+  """
+
+  @property
+  def n_points(self) -> int:
+    """The number of data points carried by the Batch."""
+
+    if not self:
+      return 0
+    return len(next(iter(self.values())))
+
+  def rows(self) -> List[Dict[str, Any]]:
+    """Returns the data points of the Batch as a :obj:`list` of :obj:`dict`,
+    with a single value per label like regular messages."""
+
+    labels = list(self.keys())
+    columns = (values.tolist() for values in self.values())
+    return [dict(zip(labels, row)) for row in zip(*columns)]
+
+  def last(self) -> Dict[str, Any]:
+    """Returns the newest data point of the Batch as a :obj:`dict`, with a
+    single value per label like regular messages."""
+
+    return {label: values[-1:].tolist()[0] for label, values in self.items()}
+
+  @classmethod
+  def from_columns(cls, data: Dict[str, Any]) -> 'Batch':
+    """Builds a Batch from a :obj:`dict` of iterables, converting them to 1D
+    :mod:`numpy` arrays.
+
+    Raises:
+      :exc:`ValueError`: If the given iterables do not all have the same length
+        or are not one-dimensional.
+    """
+
+    batch = cls((label, np.asarray(values)) for label, values in data.items())
+
+    if any(values.ndim != 1 for values in batch.values()):
+      raise ValueError("All the values of a Batch should be one-dimensional !")
+    if len(set(len(values) for values in batch.values())) > 1:
+      raise ValueError("All the values of a Batch should have the same "
+                       "length !")
+
+    return batch
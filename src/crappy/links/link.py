@@ -1,18 +1,65 @@
 # coding: utf-8
 
-from multiprocessing import Pipe
-from time import time
-from copy import deepcopy
+from multiprocessing import Pipe, Value, Array, Lock
+from time import time, sleep
+from io import BytesIO
+from math import frexp
+from struct import Struct
+from copy import copy, deepcopy
 from typing import Callable, Union, Any, Dict, Optional, List, Iterable
-from collections import defaultdict
+from collections import defaultdict, deque
 from select import select
 from platform import system
 from multiprocessing import current_process
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
 import logging
+import numpy as np
 
+from .batch import Batch, concatenate
+from .shm_ring import SharedMemoryRing
 from .._global import LinkDataError
 
 ModifierType = Callable[[Dict[str, Any]], Dict[str, Any]]
+overflow_policies = ('drop_newest', 'drop_oldest', 'block', 'latest_only')
+
+# Each message starts with the time at which it was sent
+_stamp = Struct('d')
+# Upper edges of the bins of the latency histogram, from 1µs to about 17s, the
+# last bin gathers all the greater latencies
+latency_bins = tuple(1e-6 * 2 ** i for i in range(25))
+
+
+class _LocalQueue(deque):
+  """Queue used as a transport object by the Links whose both ends run in the
+  same Process.
+
+  It stores the sent values as they are, along with the time at which they
+  were sent, and exposes the same methods as the other transport objects. Its
+  maximum length is the capacity of the Link, if any.
+  """
+
+  def poll(self) -> bool:
+    """Returns :obj:`True` if there's a value waiting in the queue."""
+
+    return bool(self)
+
+  def send_bytes(self, item: Any) -> bool:
+    """Adds an item to the queue, unless it is full.
+
+    Returns:
+      :obj:`True` if the item was added, :obj:`False` otherwise.
+    """
+
+    if self.maxlen is not None and len(self) >= self.maxlen:
+      return False
+    self.append(item)
+    return True
+
+  def recv_bytes(self) -> Any:
+    """Returns the oldest item of the queue."""
+
+    return self.popleft()
 
 
 class Link:
@@ -20,14 +67,42 @@ class Link:
   :class:`~crappy.blocks.Block`.
 
   The created Link is unidirectional, from the input Block to the output Block.
-  Under the hood, a Link is basically a :obj:`multiprocessing.Pipe` with
-  extra features.
+  Under the hood, a Link is by default a :obj:`multiprocessing.Pipe` with
+  extra features. Alternatively, the data can be transferred through a
+  :class:`~crappy.links.SharedMemoryRing`, that avoids the system calls
+  associated with the Pipe.
 
   Note:
     It is possible to add one or multiple :class:`~crappy.modifier.Modifier` to
     modify the transferred value. The Modifiers should be callables taking a
     :obj:`dict` as argument and returning a :obj:`dict`. They can be functions,
     or preferably children of :class:`~crappy.modifier.Modifier`.
+
+  Note:
+    The value to send is shared between all the Links of a Block, so it is
+    copied before being passed to a Modifier. This copy is skipped for the
+    Modifiers whose ``pure`` attribute is :obj:`True`, and is performed at most
+    once per value for the other Modifiers.
+
+  Note:
+    The behavior of the Link when it is full can be tuned using the
+    ``overflow`` and ``capacity`` arguments. A Link is full either when the
+    underlying Pipe or ring buffer has no more room, or when ``capacity``
+    messages are waiting in it. Messages dropped because of the selected policy
+    are counted, see :attr:`dropped`.
+
+  Note:
+    Each Link keeps track of the number of messages and bytes going through it,
+    as well as of the latency between the moment a message is sent and the
+    moment it is received. These counters are shared between the Processes,
+    and can be read from any of them using :meth:`stats`.
+
+  Note:
+    If both Blocks of the Link run in the same Process, see
+    :meth:`~crappy.blocks.Block.group`, the Link transfers the values through
+    a simple in-process queue. The values are then not serialized, only the
+    :obj:`dict` itself is copied, so that the receiving Block shares the
+    sent objects with the sending Block.
   
   .. versionadded:: 1.4.0
   """
@@ -38,7 +113,12 @@ class Link:
                input_block,
                output_block,
                modifiers: Optional[List[ModifierType]] = None,
-               name: Optional[str] = None) -> None:
+               name: Optional[str] = None,
+               transport: str = 'pipe',
+               shm_size: int = 2 ** 20,
+               overflow: str = 'drop_newest',
+               capacity: Optional[int] = None,
+               block_timeout: float = 1) -> None:
     """Sets the instance attributes.
 
     Args:
@@ -50,6 +130,42 @@ class Link:
       name: Name of the Link, to differentiate it from the others when
         debugging. If no specific name is given, the Links are numbered in the
         order in which they are instantiated in the script.
+      transport: The object used for transferring the data between the Blocks.
+        Can be either ``'pipe'`` (the default), for using a
+        :obj:`multiprocessing.Pipe`, or ``'shm'`` for using a
+        :class:`~crappy.links.SharedMemoryRing`. The latter is faster for Links
+        carrying data at a high rate, as it avoids system calls.
+
+        .. versionadded:: 2.0.6
+      shm_size: When ``transport`` is ``'shm'``, the size of the ring buffer in
+        bytes. It should be large enough to hold all the messages that can be
+        waiting in the Link at the same time. Sending a message larger than
+        the ring raises an error. Ignored otherwise.
+
+        .. versionadded:: 2.0.6
+      overflow: The policy to apply when the Link is full. With
+        ``'drop_newest'`` (the default), the new message is dropped. With
+        ``'drop_oldest'``, the sending Block drops the oldest messages waiting
+        in the Link to make room for the new one. With ``'block'``, the sending
+        Block waits for room to be made in the Link, for at most
+        ``block_timeout`` seconds, after which the new message is dropped. With
+        ``'latest_only'``, only the most recent message is kept in the Link,
+        which is well suited for control signals. For Links whose both Blocks
+        run in the same Process, ``'block'`` behaves like ``'drop_newest'`` as
+        waiting would also prevent the receiving Block from reading.
+
+        .. versionadded:: 2.0.6
+      capacity: The maximum number of messages that can be waiting in the Link.
+        If :obj:`None`, the capacity is only limited by the size of the
+        underlying Pipe or ring buffer, and is unlimited for Links whose both
+        Blocks run in the same Process. Ignored for the ``'latest_only'``
+        policy, for which it is always 1.
+
+        .. versionadded:: 2.0.6
+      block_timeout: For the ``'block'`` policy, the maximum time to wait for
+        room to be made in the Link, in seconds.
+
+        .. versionadded:: 2.0.6
     
     .. versionchanged:: 1.5.9 renamed *condition* argument to *conditions*
     .. versionchanged:: 1.5.9 renamed *modifier* argument to *modifiers*
@@ -66,9 +182,49 @@ class Link:
                       f"callable : {not_callable} !")
 
     self.name = name if name is not None else f'link{self._get_count()}'
-    self._in, self._out = Pipe()
     self._modifiers = modifiers
 
+    # Creating the object in charge of transferring the data
+    if transport == 'pipe':
+      self._in, self._out = Pipe()
+    elif transport == 'shm':
+      self._in = self._out = SharedMemoryRing(size=shm_size)
+    else:
+      raise ValueError(f"The transport argument should be either 'pipe' or "
+                       f"'shm', got {transport} instead !")
+    self._transport = transport
+
+    # Checking and setting the overflow policy
+    if overflow not in overflow_policies:
+      raise ValueError(f"The overflow argument should be one of "
+                       f"{overflow_policies}, got {overflow} instead !")
+    if capacity is not None and capacity < 1:
+      raise ValueError(f"The capacity argument should be at least 1, got "
+                       f"{capacity} instead !")
+    self._overflow = overflow
+    self._capacity = 1 if overflow == 'latest_only' else capacity
+    self._block_timeout = block_timeout
+
+    # For the policies dropping the oldest messages, the sending side also
+    # reads from the transport object so both sides have to take turns
+    self._read_lock = (Lock() if overflow in ('drop_oldest', 'latest_only')
+                       else None)
+
+    # Counters for the messages, each one only written by one side of the Link
+    # except for the dropped messages that can be counted by both sides, and
+    # for the received messages that are also counted by the sending side when
+    # it holds the read lock
+    self._n_sent = Value('Q', 0, lock=False)
+    self._n_recv = Value('Q', 0, lock=False)
+    self._n_dropped = Value('Q', 0)
+    self._n_bytes = Value('Q', 0, lock=False)
+    self._latency_hist = Array('Q', len(latency_bins) + 1, lock=False)
+    self._latency_sum = Value('d', 0, lock=False)
+    self._latency_max = Value('d', 0, lock=False)
+
+    # Data points left over after reading only part of a Batch
+    self._pending = deque()
+
     # Associating the link to the input and output blocks
     input_block.add_output(self)
     output_block.add_input(self)
@@ -111,18 +267,93 @@ class Link:
     .. versionadded:: 2.0.0
     """
 
-    return self._in.poll()
+    return bool(self._pending) or self._available()
+
+  @property
+  def dropped(self) -> int:
+    """The total number of messages that were dropped because the Link was
+    full, on either side of the Link.
+
+    .. versionadded:: 2.0.6
+    """
+
+    return self._n_dropped.value
+
+  def stats(self) -> Dict[str, Any]:
+    """Returns the values of the counters of the Link.
+
+    It can be called from any Process, including the main one while the Blocks
+    are running. The counters are read without locking, so the returned values
+    might be very slightly inconsistent with each other.
+
+    Returns:
+      A :obj:`dict` containing the name of the Link, the number of messages
+      sent and received, the number of bytes sent, the number of messages
+      dropped, the number of messages waiting in the Link, the mean, 99th
+      percentile and maximum latency in seconds, and the latency histogram as
+      a :obj:`list` of counts. The first bin counts the latencies below 1µs,
+      the i-th bin those between 2**(i-1) and 2**i µs, and the last bin all
+      the latencies greater than 2**24 µs. The latencies are :obj:`None` if no
+      message was received yet. A :class:`~crappy.links.Batch` counts as a
+      single message in the backlog, even while its rows are being received.
+
+    .. versionadded:: 2.0.6
+    """
+
+    sent = self._n_sent.value
+    received = self._n_recv.value
+    hist = list(self._latency_hist)
+    n_lat = sum(hist)
+
+    # The 99th percentile is approximated by the upper edge of its bin
+    p99 = None
+    if n_lat:
+      count = 0
+      for i, n in enumerate(hist):
+        count += n
+        if count >= 0.99 * n_lat:
+          break
+      p99 = (latency_bins[i] if i < len(latency_bins)
+             else self._latency_max.value)
+
+    return {'name': self.name,
+            'sent': sent,
+            'bytes_sent': self._n_bytes.value,
+            'received': received,
+            'dropped': self._n_dropped.value,
+            'backlog': max(0, sent - received),
+            'latency_mean': self._latency_sum.value / n_lat if n_lat else None,
+            'latency_p99': p99,
+            'latency_max': self._latency_max.value if n_lat else None,
+            'latency_hist': hist}
 
   def send(self, value: Dict[str, Any]) -> None:
     """Sends a value from the upstream Block to the downstream Block.
 
     Before sending, applies the given Modifiers and makes sure there's room in
     the Pipe for sending the data (Linux only).
+
+    The value can also be a :class:`~crappy.links.Batch` carrying several data
+    points at once. As Modifiers only handle one data point at a time, Batches
+    are split into individual data points on Links having Modifiers.
     """
 
+    # Modifiers expect a single data point
+    if isinstance(value, Batch) and self._modifiers:
+      for row in value.rows():
+        self.send(row)
+      return
+
     # Applying the modifiers to the value to send
+    # The value is shared with the other Links until a copy is made
+    owned = False
     for mod in self._modifiers:
-      value = mod(deepcopy(value))
+      # Pure Modifiers don't alter their input, no need to copy it for them
+      if getattr(mod, 'pure', False):
+        value = mod(value)
+      else:
+        value = mod(value if owned else deepcopy(value))
+        owned = True
       # No need to continue if there's no value to send anymore
       if value is None:
         return
@@ -133,17 +364,85 @@ class Link:
       raise LinkDataError
 
     # Finally, sending the dict to the link
-    if self._system == 'Linux':
-      # Can only check on Linux if a pipe is full
-      if select([], [self._out], [], 0)[1]:
-        self._out.send(value)
-      # Warning in case the pipe is full
-      elif time() - self._last_warn > 1:
-          self._last_warn = time()
-          self.log(logging.WARNING, f"Cannot send the values, the Link is "
-                                    f"full !")
+    if self._transport == 'local':
+      # Within a same Process, no need to serialize the value
+      self._send_payload((time(), copy(value)))
     else:
-      self._out.send(value)
+      self.send_serialized(self.serialize(value))
+
+  @staticmethod
+  def serialize(value: Dict[str, Any]) -> memoryview:
+    """Serializes a value in the format expected by the Links.
+
+    The result can be sent through several Links, so that a value sent to
+    several downstream Blocks only needs to be serialized once. It is stamped
+    with the current time, for measuring the latency of the Links.
+
+    .. versionadded:: 2.0.6
+    """
+
+    buf = BytesIO()
+    buf.write(_stamp.pack(time()))
+    ForkingPickler(buf).dump(value)
+    return buf.getbuffer()
+
+  def needs_value(self) -> bool:
+    """Returns :obj:`True` if the Link has Modifiers or if both its Blocks
+    run in the same Process, in which case it needs the actual value to send
+    and not its serialized form.
+
+    .. versionadded:: 2.0.6
+    """
+
+    return bool(self._modifiers) or self._transport == 'local'
+
+  def send_serialized(self, payload: Union[bytes, memoryview]) -> None:
+    """Sends an already serialized value from the upstream Block to the
+    downstream Block.
+
+    The payload must have been obtained from :meth:`serialize`. This method
+    cannot be used on Links having Modifiers, as they need to work on the
+    actual value. It also makes sure there's room in the Pipe for sending the
+    data (Linux only).
+
+    .. versionadded:: 2.0.6
+    """
+
+    self._send_payload(payload)
+
+  def _send_payload(self, payload: Any) -> None:
+    """Writes a payload to the transport object according to the overflow
+    policy, and counts it as either sent or dropped."""
+
+    # The oldest waiting messages are dropped to make room for the new one
+    if self._overflow in ('drop_oldest', 'latest_only'):
+      sent = self._write_drop_oldest(payload)
+
+    # Otherwise, the Link is full if there are too many waiting messages
+    # Within a same Process, waiting would only block the receiving Block
+    elif self._overflow == 'block' and self._transport != 'local':
+      t_stop = time() + self._block_timeout
+      sent = not self._over_capacity() and self._write(payload)
+      while not sent and time() < t_stop:
+        sleep(1e-4)
+        sent = not self._over_capacity() and self._write(payload)
+
+    else:
+      sent = not self._over_capacity() and self._write(payload)
+
+    if sent:
+      self._n_sent.value += 1
+      if self._transport != 'local':
+        self._n_bytes.value += len(payload)
+      return
+
+    # Counting the dropped message and warning at most once per second
+    with self._n_dropped.get_lock():
+      self._n_dropped.value += 1
+    if time() - self._last_warn > 1:
+      self._last_warn = time()
+      self.log(logging.WARNING, f"Cannot send the values, the Link is full ! "
+                                f"{self.dropped} message(s) dropped so far")
 
   def recv(self) -> Dict[str, Any]:
     """Reads a single value from the Link and returns it.
@@ -151,7 +450,9 @@ class Link:
     The read value is the oldest available in the Link, see :meth:`recv_last`
     for reading the newest available value.
 
-    If no data is available in the Link, returns an empty :obj:`dict`.
+    If no data is available in the Link, returns an empty :obj:`dict`. If the
+    oldest message is a :class:`~crappy.links.Batch`, only its first data point
+    is returned and the other ones are kept for the next calls.
 
     Returns:
       A :obj:`dict` whose keys are the labels being sent, and for each key a
@@ -160,8 +461,14 @@ class Link:
     .. versionremoved:: 2.0.0 *blocking* argument
     """
 
-    if self._in.poll():
-      return self._in.recv()
+    if self._pending:
+      return self._pending.popleft()
+    elif self._available():
+      data = self._read()
+      if isinstance(data, Batch):
+        self._pending.extend(data.rows())
+        return self._pending.popleft() if self._pending else dict()
+      return data if data is not None else dict()
     else:
       return dict()
 
@@ -180,8 +487,16 @@ class Link:
 
     data = dict()
 
-    while self._in.poll():
-      data = self._in.recv()
+    if self._pending:
+      data = self._pending[-1]
+      self._pending.clear()
+
+    while self._available():
+      message = self._read()
+      if isinstance(message, Batch):
+        data = message.last() if message.n_points else dict()
+      elif message is not None:
+        data = message
 
     return data
 
@@ -200,26 +515,235 @@ class Link:
 
     ret = defaultdict(list)
 
-    while self._in.poll():
-      data = self._in.recv()
-      for label, value in data.items():
+    while self._pending:
+      for label, value in self._pending.popleft().items():
         ret[label].append(value)
 
+    while self._available():
+      data = self._read()
+      # The values of a Batch are added all at once
+      if isinstance(data, Batch):
+        for label, values in data.items():
+          ret[label].extend(values.tolist())
+      elif data is not None:
+        for label, value in data.items():
+          ret[label].append(value)
+
     return dict(ret)
 
+  def recv_batch(self) -> Dict[str, np.ndarray]:
+    """Reads all the available values in the Link, and returns them all as
+    :mod:`numpy` arrays.
+
+    This method is similar to :meth:`recv_chunk`, except the values carried by
+    :class:`~crappy.links.Batch` messages are concatenated as arrays instead of
+    being appended one by one to a :obj:`list`. It is therefore much faster
+    when receiving data sent by :meth:`~crappy.blocks.Block.send_batch`.
+
+    Returns:
+      A :obj:`dict` whose keys are the labels being sent, and for each key a
+      1D :obj:`numpy.ndarray` of the received values. The first item in the
+      array is the oldest one available in the Link, the last item is the
+      newest available.
+      Values that cannot be stacked together, like arrays of different
+      shapes, are returned in a 1D array of objects.
+
+    .. versionadded:: 2.0.6
+    """
+
+    # For each label, the successive arrays and lists of single values
+    parts = defaultdict(list)
+
+    def add_value(lab: str, val: Any) -> None:
+      """Appends a single value to the last list of single values."""
+
+      if not parts[lab] or not isinstance(parts[lab][-1], list):
+        parts[lab].append(list())
+      parts[lab][-1].append(val)
+
+    while self._pending:
+      for label, value in self._pending.popleft().items():
+        add_value(label, value)
+
+    while self._available():
+      data = self._read()
+      if isinstance(data, Batch):
+        for label, values in data.items():
+          parts[label].append(values)
+      elif data is not None:
+        for label, value in data.items():
+          add_value(label, value)
+
+    return {label: concatenate(label_parts)
+            for label, label_parts in parts.items()}
+
+  def _wait_object(self) -> Optional[Connection]:
+    """Returns the object that can be passed to
+    :func:`multiprocessing.connection.wait` for waiting until data is
+    available in the Link, or :obj:`None` if the transport does not support
+    it."""
+
+    if self._transport == 'pipe':
+      return self._in
+    return None
+
+  def _over_capacity(self) -> bool:
+    """Returns :obj:`True` if the maximum number of messages waiting in the
+    Link is reached."""
+
+    return (self._capacity is not None and
+            self._n_sent.value - self._n_recv.value >= self._capacity)
+
+  def _available(self) -> bool:
+    """Returns :obj:`True` if a message can be read from the transport
+    object."""
+
+    return self._in.poll()
+
+  def _read(self) -> Optional[Dict[str, Any]]:
+    """Reads one message from the transport object, counts it and records
+    its latency.
+
+    Returns :obj:`None` if the message was dropped by the sending side since
+    :meth:`_available` was called.
+    """
+
+    if self._read_lock is not None:
+      with self._read_lock:
+        if not self._in.poll():
+          return None
+        payload = self._in.recv_bytes()
+        self._n_recv.value += 1
+    else:
+      payload = self._in.recv_bytes()
+      self._n_recv.value += 1
+
+    if self._transport == 'local':
+      t_sent, data = payload
+    else:
+      t_sent, = _stamp.unpack_from(payload)
+      data = None
+    latency = time() - t_sent
+
+    # The bin is given by the exponent of the latency in microseconds
+    _, exp = frexp(latency * 1e6)
+    self._latency_hist[min(max(exp, 0), len(latency_bins))] += 1
+    self._latency_sum.value += latency
+    if latency > self._latency_max.value:
+      self._latency_max.value = latency
+
+    if data is not None:
+      return data
+    return ForkingPickler.loads(memoryview(payload)[_stamp.size:])
+
+  def _write_drop_oldest(self, payload: Any) -> bool:
+    """Writes a payload to the transport object, after dropping as many of
+    the oldest waiting messages as needed for making room for it.
+
+    The read lock is not held while writing, as writing to a Pipe may only
+    complete once the receiving side has read part of the message.
+
+    Returns:
+      :obj:`True` if the payload was written, :obj:`False` if there was still
+      no room for it once all the waiting messages were dropped.
+    """
+
+    with self._read_lock:
+      while self._over_capacity() and self._in.poll():
+        self._drop_oldest()
+
+    while not self._write(payload):
+      with self._read_lock:
+        if not self._in.poll():
+          return False
+        self._drop_oldest()
+    return True
+
+  def _drop_oldest(self) -> None:
+    """Reads and discards the oldest message waiting in the transport object.
+
+    Should only be called while holding the read lock, on a transport object
+    having a message waiting.
+    """
+
+    self._in.recv_bytes()
+    self._n_recv.value += 1
+    with self._n_dropped.get_lock():
+      self._n_dropped.value += 1
+
+  def _write(self, payload: Union[bytes, memoryview]) -> bool:
+    """Writes the given serialized value to the underlying transport object.
+
+    Returns:
+      :obj:`True` if the value was written, :obj:`False` if there was no room
+      left for it in the Link.
+    """
+
+    # The SharedMemoryRing and the local queue know how much room is left
+    if self._transport == 'shm':
+      try:
+        return self._out.send_bytes(payload)
+      # The message would never fit in the ring, no point in retrying
+      except ValueError as exc:
+        self.log(logging.ERROR, str(exc))
+        raise LinkDataError
+    elif self._transport == 'local':
+      return self._out.send_bytes(payload)
+
+    # Can only check on Linux if a pipe is full
+    if self._system == 'Linux' and not select([], [self._out], [], 0)[1]:
+      return False
+
+    self._out.send_bytes(payload)
+    return True
+
+  def _make_local(self) -> None:
+    """Replaces the transport object by an in-process queue, for Links whose
+    both Blocks run in the same Process.
+
+    Should be called in the main Process before the Blocks are started.
+    """
+
+    if self._transport == 'local':
+      return
+    if self._transport == 'shm':
+      self._close()
+    else:
+      self._in.close()
+      self._out.close()
+
+    self._in = self._out = _LocalQueue(maxlen=self._capacity)
+    self._transport = 'local'
+
+  def _close(self) -> None:
+    """Releases the resources held by the transport object, if any.
+
+    Only has an effect for the ``'shm'`` transport. Should be called in the
+    main Process once all the Blocks are stopped.
+    """
+
+    if self._transport == 'shm':
+      self._out.close()
+      self._out.unlink()
+
 
 def link(in_block,
          out_block,
          modifier: Optional[Union[Iterable[ModifierType],
                                   ModifierType]] = None,
-         name: Optional[str] = None) -> None:
+         name: Optional[str] = None,
+         transport: str = 'pipe',
+         shm_size: int = 2 ** 20,
+         overflow: str = 'drop_newest',
+         capacity: Optional[int] = None,
+         block_timeout: float = 1) -> None:
   """Function linking two Blocks, allowing to send data from one to the other.
 
   It instantiates a :class:`~crappy.links.Link` between two children of
   :class:`~crappy.blocks.Block`.
 
   The created Link is unidirectional, from the input Block to the output Block.
-  Under the hood, a Link is basically a :obj:`multiprocessing.Pipe` with
+  Under the hood, a Link is by default a :obj:`multiprocessing.Pipe` with
   extra features.
 
   Args:
@@ -233,6 +757,30 @@ def link(in_block,
     name: Name of the Link, to differentiate it from the others when debugging.
       If no specific name is given, the Links are numbered in the order in
       which they are instantiated in the script.
+    transport: Either ``'pipe'`` (the default) for transferring the data
+      through a :obj:`multiprocessing.Pipe`, or ``'shm'`` for transferring it
+      through a lock-free ring buffer in shared memory.
+
+      .. versionadded:: 2.0.6
+    shm_size: When ``transport`` is ``'shm'``, the size of the ring buffer in
+      bytes.
+
+      .. versionadded:: 2.0.6
+    overflow: The policy to apply when the Link is full, either
+      ``'drop_newest'`` (the default), ``'drop_oldest'``, ``'block'`` or
+      ``'latest_only'``. Refer to :class:`~crappy.links.Link` for more
+      information.
+
+      .. versionadded:: 2.0.6
+    capacity: The maximum number of messages that can be waiting in the Link,
+      or :obj:`None` for no other limit than the size of the Pipe or ring
+      buffer.
+
+      .. versionadded:: 2.0.6
+    block_timeout: For the ``'block'`` policy, the maximum time to wait for
+      room to be made in the Link, in seconds.
+
+      .. versionadded:: 2.0.6
       
   .. versionadded:: 1.4.0
   .. versionchanged:: 1.5.9
@@ -253,4 +801,9 @@ def link(in_block,
   Link(input_block=in_block,
        output_block=out_block,
        modifiers=modifier,
-       name=name)
+       name=name,
+       transport=transport,
+       shm_size=shm_size,
+       overflow=overflow,
+       capacity=capacity,
+       block_timeout=block_timeout)
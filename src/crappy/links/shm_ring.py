@@ -0,0 +1,221 @@
+# coding: utf-8
+
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from struct import Struct
+from typing import Any, Optional
+import numpy as np
+
+from .._global import OptionalModule
+
+try:
+  from multiprocessing import shared_memory
+except (ModuleNotFoundError, ImportError):
+  shared_memory = OptionalModule('multiprocessing.shared_memory',
+                                 'Python 3.8 or higher is required for using '
+                                 'shared memory !')
+
+# Each message is stored in the ring as its length followed by its payload
+_header = Struct('I')
+# The write and read indexes are placed on separate cache lines
+_write_offset = 0
+_read_offset = 64
+_data_offset = 128
+
+
+class SharedMemoryRing:
+  """Lock-free single-producer single-consumer ring buffer living in
+  :mod:`multiprocessing.shared_memory`, used as an alternative transport for
+  the :class:`~crappy.links.Link`.
+
+  It exposes the same :meth:`poll`, :meth:`send` and :meth:`recv` methods as a
+  :obj:`multiprocessing.connection.Connection`, so that it can be used as a
+  drop-in replacement for the :obj:`multiprocessing.Pipe` in the Link. Unlike
+  the Pipe, no system call is performed when sending or receiving data.
+
+  The messages are pickled and copied in the ring, preceded by their length.
+  The write and read indexes are monotonic 64-bits counters, only ever
+  written by the producer for the first one and by the consumer for the
+  second one. The producer updates the write index only after the message has
+  been fully copied, so that the consumer never reads partial messages.
+
+  Important:
+    Only one Process should send data through the ring, and only one Process
+    should read data from it. This is always the case for Links.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self,
+               size: int = 2 ** 20,
+               name: Optional[str] = None) -> None:
+    """Creates the shared memory segment, or attaches to an existing one.
+
+    Args:
+      size: The size of the data region of the ring, in bytes. The largest
+        message that can be sent must fit in this size.
+      name: If given, the name of an existing shared memory segment to attach
+        to. Otherwise, a new segment is created.
+    """
+
+    if size <= _header.size:
+      raise ValueError(f"The size of the shared memory ring should be greater "
+                       f"than {_header.size} bytes, got {size} !")
+
+    self._size = size
+    self._owner = name is None
+    if name is None:
+      self._shm = shared_memory.SharedMemory(create=True,
+                                             size=_data_offset + size)
+    else:
+      self._shm = shared_memory.SharedMemory(name=name, create=False)
+
+    self._set_views()
+
+    if self._owner:
+      self._w_idx[0] = 0
+      self._r_idx[0] = 0
+
+  def __reduce__(self):
+    """When sent to another Process, only the name of the shared memory
+    segment is pickled and the new instance attaches to it."""
+
+    return self.__class__, (self._size, self._shm.name)
+
+  @property
+  def name(self) -> str:
+    """The name of the underlying shared memory segment."""
+
+    return self._shm.name
+
+  @property
+  def size(self) -> int:
+    """The size of the data region of the ring, in bytes."""
+
+    return self._size
+
+  def poll(self) -> bool:
+    """Returns :obj:`True` if there is at least one message waiting to be
+    read in the ring."""
+
+    return self._w_idx[0] != self._r_idx[0]
+
+  def free(self) -> int:
+    """Returns the number of bytes that can currently be written to the
+    ring."""
+
+    return self._size - int(self._w_idx[0] - self._r_idx[0])
+
+  def send(self, value: Any) -> bool:
+    """Pickles the given object and writes it to the ring.
+
+    Returns:
+      :obj:`True` if the object could be written, :obj:`False` if there was not
+      enough room left in the ring.
+
+    Raises:
+      ValueError: If the pickled object is larger than the ring itself.
+    """
+
+    return self.send_bytes(dumps(value, protocol=HIGHEST_PROTOCOL))
+
+  def send_bytes(self, payload: bytes) -> bool:
+    """Writes already serialized data to the ring.
+
+    Returns:
+      :obj:`True` if the data could be written, :obj:`False` if there was not
+      enough room left in the ring.
+
+    Raises:
+      ValueError: If the data is larger than the ring itself, in which case it
+        could never be written.
+    """
+
+    needed = _header.size + len(payload)
+    if needed > self._size:
+      raise ValueError(f"Cannot send a message of {len(payload)} bytes "
+                       f"through a shared memory ring of {self._size} bytes, "
+                       f"the size of the ring should be increased !")
+    write, read = int(self._w_idx[0]), int(self._r_idx[0])
+    if needed > self._size - (write - read):
+      return False
+
+    self._write(write, _header.pack(len(payload)))
+    self._write(write + _header.size, payload)
+
+    # Publishing the message only once it is entirely written
+    self._w_idx[0] = write + needed
+    return True
+
+  def recv(self) -> Any:
+    """Reads the oldest message in the ring and returns it unpickled.
+
+    Must only be called if :meth:`poll` returned :obj:`True`.
+    """
+
+    return loads(self.recv_bytes())
+
+  def recv_bytes(self) -> bytes:
+    """Reads the oldest message in the ring and returns it as :obj:`bytes`.
+
+    Must only be called if :meth:`poll` returned :obj:`True`.
+    """
+
+    read = int(self._r_idx[0])
+    length, = _header.unpack(self._read(read, _header.size))
+    payload = self._read(read + _header.size, length)
+
+    # Releasing the space only once the message is entirely read
+    self._r_idx[0] = read + _header.size + length
+    return payload
+
+  def close(self) -> None:
+    """Detaches from the shared memory segment."""
+
+    # The views on the buffer must be released before closing it
+    self._w_idx = None
+    self._r_idx = None
+    self._data = None
+    try:
+      self._shm.close()
+    except BufferError:
+      pass
+
+  def unlink(self) -> None:
+    """Destroys the shared memory segment, only if it was created by this
+    instance."""
+
+    if self._owner:
+      try:
+        self._shm.unlink()
+      except FileNotFoundError:
+        pass
+
+  def _set_views(self) -> None:
+    """Creates the views on the index and data regions of the segment."""
+
+    # Aligned 64-bits stores and loads are atomic on the supported platforms
+    self._w_idx = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf,
+                             offset=_write_offset)
+    self._r_idx = np.ndarray((1,), dtype=np.uint64, buffer=self._shm.buf,
+                             offset=_read_offset)
+    self._data = self._shm.buf[_data_offset:_data_offset + self._size]
+
+  def _write(self, pos: int, data: bytes) -> None:
+    """Copies data to the ring at the given absolute position, handling the
+    wrap-around."""
+
+    start = pos % self._size
+    first = min(len(data), self._size - start)
+    self._data[start:start + first] = data[:first]
+    if first < len(data):
+      self._data[:len(data) - first] = data[first:]
+
+  def _read(self, pos: int, length: int) -> bytes:
+    """Reads data from the ring at the given absolute position, handling the
+    wrap-around."""
+
+    start = pos % self._size
+    first = min(length, self._size - start)
+    if first == length:
+      return bytes(self._data[start:start + length])
+    return bytes(self._data[start:]) + bytes(self._data[:length - first])
@@ -30,6 +30,8 @@ class Demux(Modifier):
   .. versionadded:: 1.4.0
   """
 
+  pure = True
+
   def __init__(self,
                labels: Union[str, Iterable[str]],
                stream_label: str = "stream",
@@ -81,6 +83,10 @@ class Demux(Modifier):
     if 0 in data[self._stream_label].shape:
       return data
 
+    # The arrays are only read, so a shallow copy is enough for not altering
+    # the received data
+    data = dict(data)
+
     # Getting either the average or the first value for each label
     for i, label in enumerate(self._labels):
       # The data of a given label is on a same row
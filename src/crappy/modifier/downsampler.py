@@ -17,6 +17,8 @@ class DownSampler(Modifier):
   .. versionadded:: 2.0.4
   """
 
+  pure = True
+
   def __init__(self, n_points: int = 10) -> None:
     """Sets the args and initializes the parent class.
 
@@ -2,6 +2,7 @@
 
 from typing import Optional, Dict, Any
 import logging
+from copy import deepcopy
 
 from .meta_modifier import Modifier
 
@@ -13,6 +14,8 @@ class Integrate(Modifier):
   .. versionadded:: 1.4.0
   """
 
+  pure = True
+
   def __init__(self,
                label: str,
                time_label: str = 't(s)',
@@ -46,10 +49,13 @@ class Integrate(Modifier):
 
     self.log(logging.DEBUG, f"Received {data}")
 
+    # Working on a copy of the received dict, the original one is shared
+    data = dict(data)
+
     # For the first received data, storing it and returning 0
     if self._last_t is None or self._last_val is None:
       self._last_t = data[self._time_label]
-      self._last_val = data[self._label]
+      self._last_val = deepcopy(data[self._label])
       data[self._out_label] = self._integration
       return data
 
@@ -57,9 +63,10 @@ class Integrate(Modifier):
     t = data[self._time_label]
     val = data[self._label]
     self._integration += (t - self._last_t) * (val + self._last_val) / 2
-    # Updating the stored data
+    # Updating the stored data, the value is copied as it is kept after the
+    # caller gets its dict back
     self._last_t = t
-    self._last_val = val
+    self._last_val = deepcopy(val)
 
     # Returning the updated data
     data[self._out_label] = self._integration
@@ -3,6 +3,7 @@
 import numpy as np
 from typing import Dict, Any, Optional
 import logging
+from copy import deepcopy
 
 from .meta_modifier import Modifier
 
@@ -17,6 +18,8 @@ class Median(Modifier):
   .. versionadded:: 1.4.0
   """
 
+  pure = True
+
   def __init__(self, n_points: int = 100) -> None:
     """Sets the args and initializes the parent class.
 
@@ -44,12 +47,13 @@ class Median(Modifier):
 
     # Initializing the buffer
     if self._buf is None:
-      self._buf = {key: [value] for key, value in data.items()}
+      self._buf = {key: [deepcopy(value)] for key, value in data.items()}
 
     ret = {}
     for label in data:
-      # Updating the buffer with the newest data
-      self._buf[label].append(data[label])
+      # Updating the buffer with the newest data, copied as it is kept
+      # after the caller gets its dict back
+      self._buf[label].append(deepcopy(data[label]))
 
       # Once there's enough data in the buffer, calculating the median value
       if len(self._buf[label]) == self._n_points:
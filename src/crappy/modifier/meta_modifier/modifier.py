@@ -20,9 +20,21 @@ class Modifier(metaclass=MetaModifier):
   that is not mandatory. A Modifier only needs to be a callable, i.e. a class
   defining the :meth:`__call__` method or a function.
 
+  By default, the Link passes a copy of the data to the Modifier, so that it
+  can freely alter it. Modifiers that never alter the :obj:`dict` they receive
+  nor the values it contains should set the ``pure`` class attribute to
+  :obj:`True`, in which case the Link skips this copy. This is especially
+  beneficial when large arrays or images flow through the Link. Functions used
+  as Modifiers can also be given a ``pure`` attribute. As the sending Block may
+  modify its values once they are sent, pure Modifiers must copy the values
+  they keep from one call to the next.
+
   .. versionadded:: 1.4.0
+  .. versionchanged:: 2.0.6 added the *pure* class attribute
   """
 
+  pure: bool = False
+
   def __init__(self, *_, **__) -> None:
     """Sets the logger attribute.
 
@@ -3,6 +3,7 @@
 import numpy as np
 from typing import Dict, Any
 import logging
+from copy import deepcopy
 
 from .meta_modifier import Modifier
 
@@ -18,6 +19,8 @@ class MovingMed(Modifier):
   .. versionchanged:: 2.0.0 renamed from *Moving_med* to *MovingMed*
   """
 
+  pure = True
+
   def __init__(self, n_points: int = 100) -> None:
     """Sets the args and initializes the parent class.
 
@@ -42,12 +45,13 @@ class MovingMed(Modifier):
 
     # Initializing the buffer
     if self._buf is None:
-      self._buf = {key: [value] for key, value in data.items()}
+      self._buf = {key: [deepcopy(value)] for key, value in data.items()}
 
     ret = {}
     for label in data:
-      # Updating the buffer with the newest data
-      self._buf[label].append(data[label])
+      # Updating the buffer with the newest data, copied as it is kept
+      # after the caller gets its dict back
+      self._buf[label].append(deepcopy(data[label]))
 
       # Trimming the buffer if there's too much data
       if len(self._buf[label]) > self._n_points:
@@ -25,6 +25,8 @@ class Offset(Modifier):
   .. versionadded:: 1.5.10
   """
 
+  pure = True
+
   def __init__(self,
                labels: Union[str, Iterable[str]],
                offsets: Union[float, Iterable[float]]) -> None:
@@ -69,6 +71,9 @@ class Offset(Modifier):
 
     self.log(logging.DEBUG, f"Received {data}")
 
+    # A new value is computed for each label, so a shallow copy is enough
+    data = dict(data)
+
     # During the first loop, calculating the compensation values
     if not self._compensated:
       self._compensations = {label: -data[label] + offset for label, offset in
@@ -77,7 +82,7 @@ class Offset(Modifier):
 
     # Compensating the data to match the target offset value
     for label in self._offsets:
-      data[label] += self._compensations[label]
+      data[label] = data[label] + self._compensations[label]
 
     self.log(logging.DEBUG, f"Sending {data}")
     return data
@@ -2,6 +2,7 @@
 
 from typing import Optional, Dict, Any
 import logging
+from copy import deepcopy
 
 from .meta_modifier import Modifier
 
@@ -17,6 +18,8 @@ class TrigOnChange(Modifier):
   .. versionchanged:: 2.0.0 renamed from *Trig_on_change* to *TrigOnChange*
   """
 
+  pure = True
+
   def __init__(self, label: str) -> None:
     """Sets the args and initializes the parent class.
 
@@ -41,13 +44,13 @@ class TrigOnChange(Modifier):
 
     # Storing the first received value and returning the data
     if self._last is None:
-      self._last = data[self._label]
+      self._last = deepcopy(data[self._label])
       self.log(logging.DEBUG, f"Sending {data}")
       return data
 
     # Returning the data if the label value is different from the stored value
     if data[self._label] != self._last:
-      self._last = data[self._label]
+      self._last = deepcopy(data[self._label])
       self.log(logging.DEBUG, f"Sending {data}")
       return data
 
@@ -16,6 +16,8 @@ class TrigOnValue(Modifier):
   .. versionchanged:: 2.0.0 renamed from *Trig_on_value* to *TrigOnValue*
   """
 
+  pure = True
+
   def __init__(self,
                label: str,
                values: Union[Any, Iterable[Any]]) -> None:
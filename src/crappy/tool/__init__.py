@@ -4,4 +4,7 @@ from . import bindings
 from . import camera_config
 from . import ft232h
 from . import image_processing
+from . import metadata_file
+from . import raw_container
+from . import scheduling
 from .apply_strain_image import ApplyStrainToImage
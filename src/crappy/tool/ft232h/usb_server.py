@@ -8,13 +8,14 @@ from multiprocessing.sharedctypes import Synchronized
 import signal
 from _io import FileIO
 from tempfile import TemporaryFile
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
 import logging.handlers
 
 from ..._global import OptionalModule
+from ..scheduling import set_scheduling
 try:
   from usb.core import find, Device, USBTimeoutError
   from usb import util
@@ -56,7 +57,10 @@ class USBServer(Process):
   architecture for managing the requests and properly starting up and shutting
   down.
 
-  The server is a child of :obj:`multiprocessing.Process`.
+  The server is a child of :obj:`multiprocessing.Process`. It is started by the
+  main Process, and its CPU affinity and real-time scheduling policy can be
+  set using the ``cpu_affinity``, ``rt_priority`` and ``rt_policy`` class
+  attributes, see :func:`~crappy.tool.scheduling.set_scheduling`.
   
   .. versionadded:: 1.5.2
   .. versionchanged:: 2.0.0 renamed from *Usb_server* to *USBServer*
@@ -65,6 +69,11 @@ class USBServer(Process):
   initialized = False
   logger: Optional[logging.Logger] = None
 
+  # Scheduling settings for the server Process
+  cpu_affinity: Optional[Iterable[int]] = None
+  rt_priority: Optional[int] = None
+  rt_policy: str = 'fifo'
+
   process: Optional[multiprocessing.context.Process] = None
   block_nr: int = 0
   devices: Dict[str, Device] = dict()
@@ -326,6 +335,8 @@ class USBServer(Process):
 
     self._set_logger()
     self._log(logging.INFO, "Logger configured")
+    set_scheduling(self._log, self.cpu_affinity, self.rt_priority,
+                   self.rt_policy)
 
     # Disabling the KeyboardInterrupt exceptions, to avoid disruptions
     self._log(logging.WARNING, "Disabling KeyboardInterrupt for the server !")
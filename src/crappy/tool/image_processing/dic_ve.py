@@ -1,7 +1,8 @@
 # coding: utf-8
 
 import numpy as np
-from typing import List, Tuple
+from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 from ..._global import OptionalModule
 from ..camera_config import SpotsBoxes, Box
 
@@ -21,9 +22,14 @@ class DICVETool:
   Different algorithms are available depending on the needs. This tool is
   mainly used to perform video-extensometry on speckled surfaces, although it
   could as well be of use for other applications.
+
+  The displacements of the patches can be calculated in parallel by a pool of
+  threads, as OpenCV releases the GIL during the computation. For that
+  purpose, each patch has its own instance of DISFlow.
   
   .. versionadded:: 1.4.0
   .. versionchanged:: 2.0.0 renamed from *DISVE* to *DICVETool*
+  .. versionadded:: 2.0.6 *patch_threads* argument
   """
 
   def __init__(self,
@@ -39,7 +45,8 @@ class DICVETool:
                patch_stride: int = 3,
                border: float = 0.2,
                safe: bool = True,
-               follow: bool = True) -> None:
+               follow: bool = True,
+               patch_threads: int = 1) -> None:
     """Sets a few attributes and initializes DISFlow if this method was
     selected.
 
@@ -82,10 +89,20 @@ class DICVETool:
         image, and raises an error if that's the case.
       follow: It :obj:`True`, the patches will move to follow the displacement
         of the image.
+      patch_threads: The number of threads calculating the displacements of
+        the patches in parallel. The default of ``1`` calculates them one after
+        the other, without starting any thread. There is no point in using
+        more threads than there are patches.
+
+        .. versionadded:: 2.0.6
 
     .. versionremoved:: 1.5.10 *img0* and *show_image* arguments
     """
 
+    if patch_threads < 1:
+      raise ValueError(f"The patch_threads argument should be at least 1, got "
+                       f"{patch_threads} !")
+
     # These attributes are accessed by the parent class
     self.patches = patches
     self._offsets = [(0, 0) for _ in patches]
@@ -100,19 +117,27 @@ class DICVETool:
     self._img0 = None
     self._height, self._width = None, None
 
-    # Initialize DISFlow if it is the selected method
+    # The threads calculating the displacements of the patches, if any
+    self._pool: Optional[ThreadPoolExecutor] = None
+    if patch_threads > 1:
+      self._pool = ThreadPoolExecutor(max_workers=patch_threads,
+                                      thread_name_prefix='DICVETool')
+
+    # Initialize one DISFlow per slot of the patches container if it is the
+    # selected method, so that the patches can be processed in parallel
+    self._dis = list()
     if self._method == 'Disflow':
-      self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_FAST)
-      self._dis.setVariationalRefinementIterations(iterations)
-      self._dis.setVariationalRefinementAlpha(alpha)
-      self._dis.setVariationalRefinementDelta(delta)
-      self._dis.setVariationalRefinementGamma(gamma)
-      self._dis.setFinestScale(finest_scale)
-      self._dis.setGradientDescentIterations(gradient_iterations)
-      self._dis.setPatchSize(patch_size)
-      self._dis.setPatchStride(patch_stride)
-    else:
-      self._dis = None
+      for _ in patches:
+        dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_FAST)
+        dis.setVariationalRefinementIterations(iterations)
+        dis.setVariationalRefinementAlpha(alpha)
+        dis.setVariationalRefinementDelta(delta)
+        dis.setVariationalRefinementGamma(gamma)
+        dis.setFinestScale(finest_scale)
+        dis.setGradientDescentIterations(gradient_iterations)
+        dis.setPatchSize(patch_size)
+        dis.setPatchStride(patch_stride)
+        self._dis.append(dis)
 
   def set_img0(self, img0: np.ndarray) -> None:
     """Sets the reference image for the cross-correlation.
@@ -144,27 +169,14 @@ class DICVETool:
       raise ValueError("The method set_img0 must be called first for setting "
                        "the reference image !")
 
-    # Compute the displacement for each patch
-    displacements = []
-    for patch, offset in zip(self.patches, self._offsets):
-
-      if patch is None:
-        continue
-
-      if self._method == 'Disflow':
-        displacements.append(self._calc_disflow(patch, img, offset))
-
-      elif self._method == 'Pixel precision':
-        displacements.append(self._calc_pixel_precision(patch, img, offset))
-
-      elif self._method == 'Parabola':
-        displacements.append(self._calc_parabola(patch, img, offset))
-
-      elif self._method == 'Lucas Kanade':
-        displacements.append(self._calc_lucas_kanade(patch, img, offset))
-
-      else:
-        raise ValueError("Wrong method specified !")
+    # Compute the displacement for each patch, in the same order as the
+    # patches whether it is done in parallel or not
+    indexes = [i for i, patch in enumerate(self.patches) if patch is not None]
+    if self._pool is not None:
+      displacements = list(self._pool.map(self._calc_patch, indexes,
+                                          [img] * len(indexes)))
+    else:
+      displacements = [self._calc_patch(i, img) for i in indexes]
 
     # If required, updates the patch offsets
     if self._follow:
@@ -235,15 +247,72 @@ class DICVETool:
       y_disp = self.patches[0].y_disp
       return [(y, x)], 0, 0, [(y_disp, x_disp)]
 
+  def set_patches(self, patches: SpotsBoxes) -> None:
+    """Moves the tracked patches to the positions of the given ones, and sets
+    their displacements to those of the given ones.
+
+    The given patches should be in the same order and have the same sizes as
+    the tracked ones. If the patches are followed, the offsets used for
+    extracting the reference patches are updated accordingly. This allows
+    resuming the tracking from the results of another DICVETool, e.g. one
+    working on images of a different resolution.
+
+    .. versionadded:: 2.0.6
+    """
+
+    for patch, new in zip(self.patches, patches):
+      if patch is not None and new is not None:
+        patch.update(new)
+
+    if self._follow:
+      self._offsets = [(round(patch.y_disp), round(patch.x_disp))
+                       for patch in self.patches if patch is not None]
+
+  def close(self) -> None:
+    """Stops the threads calculating the displacements of the patches, if
+    any.
+
+    .. versionadded:: 2.0.6
+    """
+
+    if self._pool is not None:
+      self._pool.shutdown()
+      self._pool = None
+
+  def _calc_patch(self, index: int, img: np.ndarray) -> List[float]:
+    """Returns the displacement of the patch at the given index, calculated
+    according to the chosen method.
+
+    This method may be called by the threads of the pool.
+    """
+
+    patch, offset = self.patches[index], self._offsets[index]
+
+    if self._method == 'Disflow':
+      return self._calc_disflow(patch, img, offset, self._dis[index])
+
+    elif self._method == 'Pixel precision':
+      return self._calc_pixel_precision(patch, img, offset)
+
+    elif self._method == 'Parabola':
+      return self._calc_parabola(patch, img, offset)
+
+    elif self._method == 'Lucas Kanade':
+      return self._calc_lucas_kanade(patch, img, offset)
+
+    else:
+      raise ValueError("Wrong method specified !")
+
   def _calc_disflow(self,
                     patch: Box,
                     img: np.ndarray,
-                    offset: Tuple[int, int]) -> List[float]:
+                    offset: Tuple[int, int],
+                    dis: 'cv2.DISOpticalFlow') -> List[float]:
     """Returns the displacement between the original and the current image with
-    a sub-pixel precision, using DISFlow."""
+    a sub-pixel precision, using the given instance of DISFlow."""
 
-    disp_img = self._dis.calc(self._get_patch(self._img0, patch, offset),
-                              self._get_patch(img, patch), None)
+    disp_img = dis.calc(self._get_patch(self._img0, patch, offset),
+                        self._get_patch(img, patch), None)
     return np.average(self._trim_patch(disp_img), axis=(0, 1)).tolist()
 
   def _calc_pixel_precision(self,
@@ -5,7 +5,7 @@ import numpy as np
 
 from ..._global import OptionalModule
 from ..camera_config import Box
-from .fields import get_res, get_field, allowed_fields
+from .fields import Residuals, get_field, allowed_fields
 
 try:
   import cv2
@@ -20,9 +20,23 @@ class DISCorrelTool:
   Dense Inverse Search correlation on each new image to get fields of interest. 
   It relies on DISFlow for the image correlation, handles the projection of the 
   image on the chosen fields, and calculates the residuals.
+
+  By default, the optical flow is calculated on the entire images and then
+  cropped to the region of interest. It can also be calculated only on a
+  window containing the region of interest plus a margin, which is much faster
+  when the region of interest is small compared to the images.
+
+  The flow is projected on all the fields at once, by a least-squares fit using
+  the pseudo-inverse of the base of fields. The results are therefore correct
+  even if the fields are not orthogonal to each other.
   
   .. versionadded:: 1.4.0
   .. versionchanged:: 2.0.0 renamed from *DISCorrel* to *DISCorrelTool*
+  .. versionadded:: 2.0.6 *roi_margin* argument
+  .. versionadded:: 2.0.6 *residual_stride* argument
+  .. versionchanged:: 2.0.6
+     fitting the flow on all the fields at once instead of projecting it on
+     each field independently
   """
 
   def __init__(self,
@@ -36,7 +50,9 @@ class DISCorrelTool:
                iterations: int = 1,
                gradient_iterations: int = 10,
                patch_size: int = 8,
-               patch_stride: int = 3) -> None:
+               patch_stride: int = 3,
+               roi_margin: Optional[int] = None,
+               residual_stride: int = 1) -> None:
     """Sets the parameters of DISFlow.
 
     Args:
@@ -59,6 +75,10 @@ class DISCorrelTool:
 
           (patch_height, patch_width, 2)
 
+        The fields do not need to be orthogonal, but none of them should be a
+        linear combination of the others. Otherwise, the values returned for
+        these fields are only one of the possible solutions.
+
         .. versionchanged:: 2.0.5 provided fields can now be numpy arrays
       alpha: Weight of the smoothness term in DISFlow, as a :obj:`float`.
       delta: Weight of the color constancy term in DISFlow, as a :obj:`float`.
@@ -79,6 +99,21 @@ class DISCorrelTool:
         (in pixels).
       patch_stride: Stride between neighbor patches in DISFlow. Must be
         less than patch size.
+      roi_margin: If given, the optical flow is only calculated on the region
+        of interest extended by this number of pixels on each side, within the
+        limits of the image. The margin should be large enough to contain the
+        maximum expected displacement, and gives DISFlow some context around
+        the edges of the region of interest. The residuals are then also only
+        calculated on this window. If :obj:`None`, the default, the flow is
+        calculated on the entire images.
+
+        .. versionadded:: 2.0.6
+      residual_stride: When calculating the residuals, only one pixel out of
+        this number along each axis is considered. Increasing it makes the
+        calculation of the residuals much cheaper, at the cost of a slightly
+        less accurate value. The default of ``1`` considers all the pixels.
+
+        .. versionadded:: 2.0.6
     """
 
     if fields is not None:
@@ -101,15 +136,28 @@ class DISCorrelTool:
     else:
       self._fields: List[Union[str, np.ndarray]] = ["x", "y", "exx", "eyy"]
 
+    if roi_margin is not None and roi_margin < 0:
+      raise ValueError(f"The roi_margin argument should be positive, got "
+                       f"{roi_margin} !")
+    if residual_stride < 1:
+      raise ValueError(f"The residual_stride argument should be at least 1, "
+                       f"got {residual_stride} !")
+
     self._init = init
+    self._roi_margin = roi_margin
+    self._residual_stride = residual_stride
 
     # These attributes will be set later
     self._img0 = None
+    self._ref = None
+    self._window = None
     self._height, self._width = None, None
     self.box = box
     self._dis_flow = None
-    self._base = None
-    self._norm2 = None
+    self._projection = None
+    self._flow_roi = None
+    self._values = None
+    self._residuals = None
 
     # Setting the parameters of Disflow
     self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_FAST)
@@ -130,7 +178,7 @@ class DISCorrelTool:
 
     self._img0 = img0
     self._height, self._width, *_ = img0.shape
-    self._dis_flow = np.zeros((self._height, self._width, 2))
+    self._set_window()
 
   def set_box(self) -> None:
     """Sets the region of interest to use for the correlation, and initializes
@@ -155,9 +203,20 @@ class DISCorrelTool:
       elif isinstance(field, np.ndarray):
         fields[:, :, :, i] = field
 
-    # These attributes will be used later
-    self._base = [fields[:, :, :, i] for i in range(fields.shape[3])]
-    self._norm2 = [np.sum(base_field ** 2) for base_field in self._base]
+    # The projection matrix maps the flattened flow on the region of interest
+    # to the values of the fields, it is computed in double precision for
+    # accuracy but applied in single precision like the flow
+    basis = fields.reshape(-1, len(self._fields)).astype(np.float64)
+    self._projection = np.ascontiguousarray(np.linalg.pinv(basis),
+                                            dtype=np.float32)
+
+    # Buffers for the flow on the region of interest and the computed values
+    self._flow_roi = np.empty((box_height, box_width, 2), dtype=np.float32)
+    self._values = np.empty(len(self._fields), dtype=np.float32)
+
+    # The window on which to calculate the flow depends on the box
+    if self._img0 is not None:
+      self._set_window()
 
   def get_data(self,
                img: np.ndarray,
@@ -181,28 +240,62 @@ class DISCorrelTool:
     if self._img0 is None:
       raise ValueError("The method set_img0 must be called first for setting "
                        "the reference image !")
-    elif self._base is None:
+    elif self._projection is None:
       raise ValueError("The method set_box must be called first for setting "
                        "the region of interest !")
 
+    # Only considering the window on which the flow is calculated, DISFlow
+    # requires it to be contiguous
+    y_min, y_max, x_min, x_max = self._window
+    img = np.ascontiguousarray(img[y_min:y_max, x_min:x_max])
+
     # Updating the optical flow with the latest image
     if self._init:
-      self._dis_flow = self._dis.calc(self._img0, img, self._dis_flow)
+      self._dis_flow = self._dis.calc(self._ref, img, self._dis_flow)
     else:
-      self._dis_flow = self._dis.calc(self._img0, img, None)
+      self._dis_flow = self._dis.calc(self._ref, img, None)
 
-    # Getting the values to calculate as floats
-    ret = [np.sum(vec * self._crop(self._dis_flow)) / n2 for vec, n2 in
-           zip(self._base, self._norm2)]
+    # Projecting the flow on the region of interest on the fields in a single
+    # matrix-vector product
+    np.copyto(self._flow_roi, self._crop(self._dis_flow))
+    np.dot(self._projection, self._flow_roi.reshape(-1), out=self._values)
+    ret = self._values.tolist()
 
     # Adding the average residual value if requested
     if residuals:
-      ret.append(np.average(np.abs(get_res(self._img0, img, self._dis_flow))))
+      if self._residuals is None:
+        self._residuals = Residuals(self._ref, self._residual_stride)
+      ret.append(self._residuals.mean(img, self._dis_flow))
 
     return ret
 
+  def _set_window(self) -> None:
+    """Sets the window of the images on which to calculate the optical flow,
+    crops the reference image to it and allocates the flow.
+
+    The buffers for calculating the residuals depend on the window, so they
+    are allocated again at the next calculation of the residuals.
+    """
+
+    if self._roi_margin is None or self.box.no_points():
+      self._window = (0, self._height, 0, self._width)
+    else:
+      x_min, x_max, y_min, y_max = self.box.sorted()
+      self._window = (max(y_min - self._roi_margin, 0),
+                      min(y_max + self._roi_margin, self._height),
+                      max(x_min - self._roi_margin, 0),
+                      min(x_max + self._roi_margin, self._width))
+
+    y_min, y_max, x_min, x_max = self._window
+    self._ref = np.ascontiguousarray(self._img0[y_min:y_max, x_min:x_max])
+    self._dis_flow = np.zeros((y_max - y_min, x_max - x_min, 2))
+    self._residuals = None
+
   def _crop(self, img: np.ndarray) -> np.ndarray:
-    """Crops the image to the given region of interest."""
+    """Crops the flow calculated on the window to the given region of
+    interest."""
 
     x_min, x_max, y_min, y_max = self.box.sorted()
-    return img[y_min:y_max, x_min:x_max]
+    y_offset, _, x_offset, _ = self._window
+    return img[y_min - y_offset:y_max - y_offset,
+               x_min - x_offset:x_max - x_offset]
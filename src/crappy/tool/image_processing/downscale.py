@@ -0,0 +1,117 @@
+# coding: utf-8
+
+from typing import List, Union
+import numpy as np
+
+from ..._global import OptionalModule
+from ..camera_config import Box, SpotsBoxes
+from .fields import get_field
+
+try:
+  import cv2
+except (ModuleNotFoundError, ImportError):
+  cv2 = OptionalModule("opencv-python")
+
+
+def downscale_image(img: np.ndarray, factor: int) -> np.ndarray:
+  """Returns the image downscaled by the given integer factor.
+
+  Each pixel of the returned image is the average of a block of
+  ``factor x factor`` pixels of the given image. The last rows and columns of
+  the image are dropped if its dimensions are not multiples of the factor.
+
+  This function is used by the
+  :class:`~crappy.blocks.camera_processes.DISCorrelProcess` and
+  :class:`~crappy.blocks.camera_processes.DICVEProcess` for correlating on
+  downscaled images.
+
+  .. versionadded:: 2.0.6
+  """
+
+  if factor == 1:
+    return img
+
+  height, width = img.shape[0] // factor, img.shape[1] // factor
+  return cv2.resize(img[:height * factor, :width * factor], (width, height),
+                    interpolation=cv2.INTER_AREA)
+
+
+def downscale_box(box: Box, factor: int) -> Box:
+  """Returns a new :class:`~crappy.tool.camera_config.config_tools.Box`
+  corresponding to the given one on an image downscaled by the given integer
+  factor.
+
+  The dimensions of the returned Box are those of the given one divided by
+  the factor and rounded down, so that they match the shape of the fields
+  returned by :func:`downscale_fields`.
+
+  .. versionadded:: 2.0.6
+  """
+
+  x_min, x_max, y_min, y_max = box.sorted()
+  x_start, y_start = round(x_min / factor), round(y_min / factor)
+  return Box(x_start=x_start, x_end=x_start + (x_max - x_min) // factor,
+             y_start=y_start, y_end=y_start + (y_max - y_min) // factor)
+
+
+def downscale_spots(spots: SpotsBoxes, factor: int) -> SpotsBoxes:
+  """Returns a new :class:`~crappy.tool.camera_config.config_tools.SpotsBoxes`
+  containing the given Boxes downscaled by the given integer factor, with the
+  initial lengths between them set.
+
+  .. versionadded:: 2.0.6
+  """
+
+  downscaled = SpotsBoxes()
+  for i, spot in enumerate(spots):
+    if spot is not None:
+      downscaled[i] = downscale_box(spot, factor)
+  downscaled.save_length()
+  return downscaled
+
+
+def upscale_spots(spots: SpotsBoxes, factor: int) -> SpotsBoxes:
+  """Returns a new :class:`~crappy.tool.camera_config.config_tools.SpotsBoxes`
+  containing the given Boxes upscaled by the given integer factor.
+
+  It allows displaying on the full-resolution images the Boxes tracked on the
+  downscaled ones.
+
+  .. versionadded:: 2.0.6
+  """
+
+  upscaled = SpotsBoxes()
+  for i, spot in enumerate(spots):
+    if spot is not None:
+      x_min, x_max, y_min, y_max = spot.sorted()
+      upscaled[i] = Box(x_start=x_min * factor, x_end=x_max * factor,
+                        y_start=y_min * factor, y_end=y_max * factor)
+  return upscaled
+
+
+def downscale_fields(fields: List[Union[str, np.ndarray]],
+                     box: Box,
+                     factor: int) -> List[np.ndarray]:
+  """Returns the given fields of the
+  :class:`~crappy.tool.image_processing.DISCorrelTool`, sampled on the given
+  Box downscaled by the given integer factor.
+
+  The fields are first generated at full scale if given as strings, and then
+  averaged like the images in :func:`downscale_image`. They thus keep the
+  same values as at full scale, and the values obtained by projecting a flow
+  calculated on the downscaled images on them only need to be multiplied by
+  the factor to get the ones at full scale, whatever the fields.
+
+  .. versionadded:: 2.0.6
+  """
+
+  x_min, x_max, y_min, y_max = box.sorted()
+  height, width = y_max - y_min, x_max - x_min
+
+  downscaled = list()
+  for field in fields:
+    if isinstance(field, str):
+      field = np.stack(get_field(field, height, width), axis=-1)
+    downscaled.append(downscale_image(np.asarray(field, dtype=np.float32),
+                                      factor))
+  return downscaled
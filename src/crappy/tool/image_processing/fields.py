@@ -107,3 +107,90 @@ def get_res(ref: np.ndarray, img: np.ndarray, flow: np.ndarray) -> np.ndarray:
   return ref - cv2.remap(img.astype(np.float32),
                          (x + flow[:, :, 0]).astype(np.float32),
                          (y + flow[:, :, 1]).astype(np.float32), 1)
+
+
+class Residuals:
+  """Calculates the difference between the reference image and the one
+  reconstructed from the current image and the calculated flow, like
+  :func:`get_res`, but without allocating new arrays at each call.
+
+  The grids of pixel coordinates, the reference image converted to
+  :obj:`numpy.float32` and the buffers holding the intermediate results are
+  allocated only once for a given reference image. The residuals can also be
+  calculated only on one pixel out of ``stride`` along each axis, which divides
+  the cost of the calculation by about ``stride ** 2``.
+
+  This class is used by the
+  :class:`~crappy.tool.image_processing.DISCorrelTool` tool.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self, ref: np.ndarray, stride: int = 1) -> None:
+    """Allocates the grids and the buffers for the given reference image.
+
+    Args:
+      ref: The reference image for calculating the optical flow.
+      stride: Only one pixel out of this number along each axis is considered
+        for calculating the residuals. The default of ``1`` considers all the
+        pixels.
+    """
+
+    if stride < 1:
+      raise ValueError(f"The stride should be at least 1, got {stride} !")
+
+    self._stride = stride
+    self._shape = ref.shape[:2]
+
+    # The coordinates of the considered pixels, and the reference image on
+    # these pixels
+    y, x = np.mgrid[0:self._shape[0]:stride, 0:self._shape[1]:stride]
+    self._x = x.astype(np.float32)
+    self._y = y.astype(np.float32)
+    self._ref = np.ascontiguousarray(ref[::stride, ::stride],
+                                     dtype=np.float32)
+
+    # The buffers for the current image, the maps and the residuals
+    self._img = np.empty(self._shape, dtype=np.float32)
+    self._map_x = np.empty_like(self._x)
+    self._map_y = np.empty_like(self._y)
+    self._remapped = np.empty_like(self._ref)
+    self._res = np.empty_like(self._ref)
+
+  def get(self, img: np.ndarray, flow: np.ndarray) -> np.ndarray:
+    """Calculates and returns the residuals on the considered pixels.
+
+    The returned array is a buffer that is overwritten at the next call, it
+    should be copied if it needs to be kept.
+
+    Args:
+      img: The current image for calculating the optical flow, of the same
+        shape as the reference image.
+      flow: The calculated optical flow.
+    """
+
+    if img.shape[:2] != self._shape:
+      raise ValueError(f"The image should be of shape {self._shape}, got "
+                       f"{img.shape[:2]} !")
+
+    # The whole image is needed as the flow can point anywhere in it
+    np.copyto(self._img, img, casting='unsafe')
+    np.add(self._x, flow[::self._stride, ::self._stride, 0], out=self._map_x,
+           casting='unsafe')
+    np.add(self._y, flow[::self._stride, ::self._stride, 1], out=self._map_y,
+           casting='unsafe')
+    cv2.remap(self._img, self._map_x, self._map_y, cv2.INTER_LINEAR,
+              dst=self._remapped)
+    return np.subtract(self._ref, self._remapped, out=self._res)
+
+  def mean(self, img: np.ndarray, flow: np.ndarray) -> float:
+    """Calculates and returns the mean absolute residual on the considered
+    pixels.
+
+    Args:
+      img: The current image for calculating the optical flow, of the same
+        shape as the reference image.
+      flow: The calculated optical flow.
+    """
+
+    return float(np.abs(self.get(img, flow), out=self._res).mean())
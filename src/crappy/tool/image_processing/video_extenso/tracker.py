@@ -4,7 +4,7 @@ from multiprocessing import Process, get_start_method
 from multiprocessing.connection import Connection
 from multiprocessing.queues import Queue
 import numpy as np
-from typing import Optional, Union
+from typing import Optional, Union, Iterable
 from time import time
 from select import select
 import logging
@@ -12,6 +12,7 @@ import logging.handlers
 from platform import system
 
 from ...camera_config import Box
+from ...scheduling import set_scheduling
 from ...._global import OptionalModule
 
 try:
@@ -37,12 +38,24 @@ class Tracker(Process):
   returns the updated position of the detected spot. It is meant to be used in
   association with the 
   :class:`~crappy.tool.image_processing.video_extenso.VideoExtensoTool`.
+
+  Note:
+    On Linux, this Process inherits the CPU affinity and the real-time
+    scheduling policy of the Process that started it. They can be overridden
+    for all the Trackers by setting the ``cpu_affinity``, ``rt_priority`` and
+    ``rt_policy`` class attributes, see
+    :func:`~crappy.tool.scheduling.set_scheduling`.
   
   .. versionadded:: 2.0.0
   """
 
   names = list()
 
+  # Scheduling settings overriding the ones inherited from the parent Process
+  cpu_affinity: Optional[Iterable[int]] = None
+  rt_priority: Optional[int] = None
+  rt_policy: str = 'fifo'
+
   def __init__(self,
                pipe: Connection,
                logger_name: str,
@@ -124,6 +137,8 @@ class Tracker(Process):
     # Looping forever for receiving data
     try:
       self._set_logger()
+      set_scheduling(self._log, self.cpu_affinity, self.rt_priority,
+                     self.rt_policy)
 
       while True:
         # Making sure the call to recv is not blocking
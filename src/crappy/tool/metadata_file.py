@@ -0,0 +1,125 @@
+# coding: utf-8
+
+from pathlib import Path
+from struct import Struct
+from typing import Union, Optional, List, Dict, Any
+import json
+import numpy as np
+
+# Header of the file: magic bytes, version, and length of the description of
+# the fields that follows it
+_header = Struct('<8sII')
+_magic = b'CRAPPYMD'
+_version = 1
+# Maximum length in bytes of the string values, longer strings are truncated
+str_length = 64
+
+
+def _field_type(value: Any) -> str:
+  """Returns the dtype of the field used for storing the given value."""
+
+  if isinstance(value, (int, np.integer)):
+    return '<i8'
+  elif isinstance(value, (float, np.floating)):
+    return '<f8'
+  return f'S{str_length}'
+
+
+class MetadataWriter:
+  """Writes the metadata of the recorded frames to a binary file, as fixed-size
+  records.
+
+  The fields of the records and their types are determined from the first
+  written metadata. Integers and floats are stored as 64-bits values, other
+  values are stored as strings of at most :obj:`str_length` bytes. The fields
+  missing from the following metadata are set to ``0``, ``NaN`` or an empty
+  string, and the fields absent from the first metadata are ignored.
+
+  Compared to a `.csv` file, no value needs to be formatted as text when
+  writing, and the file can be loaded in one go as a structured
+  :class:`numpy.ndarray` using :func:`read_metadata`.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self, path: Union[str, Path]) -> None:
+    """Creates the file.
+
+    Args:
+      path: The path to the file to create.
+    """
+
+    self.path = Path(path)
+    self._dtype: Optional[np.dtype] = None
+    self._file = open(self.path, 'wb')
+
+  def write(self, rows: List[Dict[str, Any]]) -> None:
+    """Converts the given metadata to records and writes them to the file.
+
+    On the first call, also writes the description of the fields based on the
+    first metadata.
+    """
+
+    if not rows:
+      return
+
+    if self._dtype is None:
+      self._dtype = np.dtype([(key, _field_type(value))
+                              for key, value in rows[0].items()])
+      descr = json.dumps(self._dtype.descr).encode()
+      self._file.write(_header.pack(_magic, _version, len(descr)))
+      self._file.write(descr)
+
+    # Filling the records column by column
+    records = np.zeros(len(rows), dtype=self._dtype)
+    for key in self._dtype.names:
+      kind = self._dtype[key].kind
+      if kind == 'i':
+        records[key] = [row.get(key, 0) for row in rows]
+      elif kind == 'f':
+        records[key] = [row.get(key, np.nan) for row in rows]
+      else:
+        records[key] = [str(row.get(key, '')).encode()[:str_length]
+                        for row in rows]
+
+    self._file.write(records.tobytes())
+
+  def flush(self) -> None:
+    """Flushes the written records to the file."""
+
+    self._file.flush()
+
+  def close(self) -> None:
+    """Closes the file."""
+
+    self._file.close()
+
+
+def read_metadata(path: Union[str, Path]) -> np.ndarray:
+  """Reads a file written by a :class:`MetadataWriter`, and returns the
+  records as a structured :class:`numpy.ndarray`.
+
+  An incomplete record at the end of the file, in case the writing was
+  interrupted, is ignored.
+
+  .. versionadded:: 2.0.6
+  """
+
+  with open(path, 'rb') as file:
+    data = file.read()
+
+  if not data:
+    return np.empty(0)
+
+  magic, version, descr_length = _header.unpack_from(data)
+  if magic != _magic:
+    raise ValueError(f"The file {path} is not a metadata file !")
+  if version > _version:
+    raise ValueError(f"The version {version} of the metadata file {path} is "
+                     f"not supported !")
+
+  offset = _header.size + descr_length
+  dtype = np.dtype([tuple(field) for field
+                    in json.loads(data[_header.size:offset].decode())])
+  count = (len(data) - offset) // dtype.itemsize
+  return np.frombuffer(data, dtype=dtype, count=count, offset=offset)
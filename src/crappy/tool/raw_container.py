@@ -0,0 +1,200 @@
+# coding: utf-8
+
+from pathlib import Path
+from struct import Struct
+from typing import Union, Tuple, List
+import numpy as np
+
+# Header of the container: magic bytes, version, dtype, number of dimensions,
+# shape, capacity, number of frames, offset of the index, offset of the data,
+# size of a frame
+_header = Struct('<8sI16sI3QQQQQQ')
+_magic = b'CRAPPYRF'
+_version = 1
+# The header, the index and the data all start on a page boundary
+_align = 4096
+# One entry of the index, giving the offset, the id and the timestamp of a
+# frame
+index_dtype = np.dtype([('offset', '<u8'), ('id', '<i8'), ('t', '<f8')])
+
+
+def _align_up(size: int) -> int:
+  """Rounds a size in bytes up to the next multiple of the alignment."""
+
+  return -(-size // _align) * _align
+
+
+class RawFrameWriter:
+  """Writes frames of a fixed shape and dtype one after the other to a single
+  container file, along with an index giving their offset, ``ImageUniqueID``
+  and timestamp.
+
+  The file is preallocated to hold up to ``capacity`` frames, and the frames
+  are written sequentially with unbuffered writes to approach the bandwidth of
+  the disk. The header and the index are written periodically and when
+  closing, so that a container whose writing was interrupted remains readable
+  up to the last flush. When closed, the file is truncated to its actual size.
+
+  The containers can be read back using a :class:`RawFrameReader`.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self,
+               path: Union[str, Path],
+               shape: Union[Tuple[int, int], Tuple[int, int, int]],
+               dtype,
+               capacity: int,
+               flush_every: int = 64) -> None:
+    """Creates the container file and preallocates it.
+
+    Args:
+      path: The path to the container file to create.
+      shape: The shape of the frames, as a :obj:`tuple` of 2 or 3 :obj:`int`.
+      dtype: The dtype of the frames.
+      capacity: The maximum number of frames the container can hold.
+      flush_every: The header and the index are written to the file every
+        time this number of frames was appended.
+    """
+
+    if len(shape) not in (2, 3):
+      raise ValueError(f"The frames should have 2 or 3 dimensions, got shape "
+                       f"{shape} !")
+
+    self.path = Path(path)
+    self.shape = tuple(shape)
+    self.dtype = np.dtype(dtype)
+    self.capacity = capacity
+    self._flush_every = flush_every
+
+    self._frame_size = int(np.prod(self.shape)) * self.dtype.itemsize
+    self._index_offset = _align
+    self._data_offset = _align_up(self._index_offset
+                                  + capacity * index_dtype.itemsize)
+    self._index = np.zeros(capacity, dtype=index_dtype)
+    self.n_frames = 0
+
+    # Preallocating the file, without buffering as the frames are large
+    self._file = open(self.path, 'w+b', buffering=0)
+    self._file.truncate(self._data_offset + capacity * self._frame_size)
+    self._file.seek(self._data_offset)
+    self.flush()
+
+  @property
+  def full(self) -> bool:
+    """:obj:`True` if the container cannot hold any more frame."""
+
+    return self.n_frames >= self.capacity
+
+  def append(self, img: np.ndarray, frame_id: int, timestamp: float) -> None:
+    """Writes a frame at the end of the container, and adds it to the index.
+
+    Raises:
+      :exc:`IndexError`: If the container is full.
+    """
+
+    if self.full:
+      raise IndexError(f"The container {self.path} is full !")
+
+    self._index[self.n_frames] = (self._data_offset
+                                  + self.n_frames * self._frame_size,
+                                  frame_id, timestamp)
+    self._file.write(memoryview(np.ascontiguousarray(img,
+                                                     dtype=self.dtype)))
+    self.n_frames += 1
+
+    if not self.n_frames % self._flush_every:
+      self.flush()
+
+  def flush(self) -> None:
+    """Writes the header and the index of the container to the file."""
+
+    dtype = self.dtype.str.encode()
+    shape = self.shape + (0,) * (3 - len(self.shape))
+    header = _header.pack(_magic, _version, dtype, len(self.shape), *shape,
+                          self.capacity, self.n_frames, self._index_offset,
+                          self._data_offset, self._frame_size)
+    position = self._file.tell()
+    self._file.seek(0)
+    self._file.write(header)
+    self._file.seek(self._index_offset)
+    self._file.write(self._index[:self.n_frames].tobytes())
+    self._file.seek(position)
+
+  def close(self) -> None:
+    """Writes the header and the index, truncates the file to its actual size
+    and closes it."""
+
+    if self._file.closed:
+      return
+    self.flush()
+    self._file.truncate(self._data_offset + self.n_frames * self._frame_size)
+    self._file.close()
+
+
+class RawFrameReader:
+  """Gives random access to the frames stored in a container written by a
+  :class:`RawFrameWriter`.
+
+  The frames are not loaded in memory, they are accessed through a read-only
+  :class:`numpy.memmap` on the file.
+
+  .. versionadded:: 2.0.6
+  """
+
+  def __init__(self, path: Union[str, Path]) -> None:
+    """Reads the header and the index of the container, and maps the frames.
+
+    Args:
+      path: The path to the container file to read.
+    """
+
+    self.path = Path(path)
+
+    with open(self.path, 'rb') as file:
+      (magic, version, dtype, ndim, *shape, capacity, n_frames, index_offset,
+       data_offset, frame_size) = _header.unpack(file.read(_header.size))
+
+      if magic != _magic:
+        raise ValueError(f"The file {self.path} is not a frame container !")
+      if version > _version:
+        raise ValueError(f"The version {version} of the frame container "
+                         f"{self.path} is not supported !")
+
+      file.seek(index_offset)
+      index = np.frombuffer(file.read(n_frames * index_dtype.itemsize),
+                            dtype=index_dtype)
+
+    self.shape = tuple(shape[:ndim])
+    self.dtype = np.dtype(dtype.rstrip(b'\0').decode())
+    self.ids = index['id']
+    self.timestamps = index['t']
+
+    # The frames are written contiguously starting from the data offset
+    if n_frames:
+      self._frames = np.memmap(self.path, dtype=self.dtype, mode='r',
+                               offset=data_offset,
+                               shape=(n_frames, *self.shape))
+    else:
+      self._frames = np.empty((0, *self.shape), dtype=self.dtype)
+
+  def __len__(self) -> int:
+    """Returns the number of frames in the container."""
+
+    return len(self._frames)
+
+  def __getitem__(self, item: int) -> np.ndarray:
+    """Returns a read-only view on the frame with the given index."""
+
+    return self._frames[item]
+
+
+def list_containers(folder: Union[str, Path]) -> List[Path]:
+  """Returns the paths to the frame containers written by the
+  :class:`~crappy.blocks.camera_processes.ImageSaver` in the given folder, in
+  the order in which they were written.
+
+  .. versionadded:: 2.0.6
+  """
+
+  return sorted(Path(folder).glob('frames_*.raw'))
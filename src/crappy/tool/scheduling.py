@@ -0,0 +1,71 @@
+# coding: utf-8
+
+import os
+import logging
+from typing import Callable, Iterable, Optional
+
+# The supported real-time scheduling policies
+rt_policies = ('fifo', 'rr')
+
+
+def set_scheduling(log: Callable[[int, str], None],
+                   cpu_affinity: Optional[Iterable[int]] = None,
+                   rt_priority: Optional[int] = None,
+                   rt_policy: str = 'fifo') -> None:
+  """Sets the CPU affinity and the real-time scheduling policy of the calling
+  :obj:`~multiprocessing.Process`.
+
+  It relies on :func:`os.sched_setaffinity` and :func:`os.sched_setscheduler`,
+  that are only available on Linux. The Processes started afterward by the
+  calling Process inherit these settings.
+
+  Failures due to missing privileges or to an unsupported platform are only
+  logged, as the Process can still run normally without these settings.
+
+  Args:
+    log: The method to use for logging messages, taking the log level and the
+      message as arguments.
+    cpu_affinity: The indexes of the CPU cores on which the Process is allowed
+      to run, or :obj:`None` to leave the affinity unchanged.
+    rt_priority: The real-time priority of the Process, between 1 and 99 on
+      Linux, or :obj:`None` to leave the scheduling policy unchanged. Setting
+      it usually requires root privileges or the ``CAP_SYS_NICE`` capability.
+    rt_policy: The real-time scheduling policy to use if ``rt_priority`` is
+      given, either ``'fifo'`` for ``SCHED_FIFO`` or ``'rr'`` for
+      ``SCHED_RR``.
+
+  .. versionadded:: 2.0.6
+  """
+
+  if rt_policy not in rt_policies:
+    raise ValueError(f"The real-time scheduling policy should be one of "
+                     f"{rt_policies}, got {rt_policy} instead !")
+
+  if cpu_affinity is not None:
+    cpu_affinity = set(cpu_affinity)
+    if not hasattr(os, 'sched_setaffinity'):
+      log(logging.WARNING, "Setting the CPU affinity is not supported on this "
+                           "platform, ignoring it")
+    else:
+      try:
+        os.sched_setaffinity(0, cpu_affinity)
+        log(logging.INFO, f"CPU affinity set to the cores "
+                          f"{sorted(cpu_affinity)}")
+      except (OSError, ValueError) as exc:
+        log(logging.WARNING, f"Could not set the CPU affinity to the cores "
+                             f"{sorted(cpu_affinity)}, ignoring it : {exc}")
+
+  if rt_priority is not None:
+    if not hasattr(os, 'sched_setscheduler'):
+      log(logging.WARNING, "Real-time scheduling is not supported on this "
+                           "platform, ignoring it")
+    else:
+      policy = os.SCHED_FIFO if rt_policy == 'fifo' else os.SCHED_RR
+      try:
+        os.sched_setscheduler(0, policy, os.sched_param(rt_priority))
+        log(logging.INFO, f"Scheduling policy set to {rt_policy} with "
+                          f"priority {rt_priority}")
+      except (OSError, ValueError) as exc:
+        log(logging.WARNING, f"Could not set the scheduling policy to "
+                             f"{rt_policy} with priority {rt_priority}, "
+                             f"ignoring it : {exc}")
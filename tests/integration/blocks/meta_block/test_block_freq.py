@@ -0,0 +1,64 @@
+# coding: utf-8
+
+import unittest
+from time import perf_counter
+from crappy import Block
+
+
+class TestBlockFreq(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._block = Block()
+    self._block.freq = 500
+
+  def tearDown(self) -> None:
+    """"""
+
+    Block.reset()
+
+  def test_no_drift(self) -> None:
+    """"""
+
+    t0 = perf_counter()
+    self._block._deadline = t0
+    for _ in range(250):
+      self._block._handle_freq()
+
+    elapsed = perf_counter() - t0
+
+    # The loops are scheduled on absolute deadlines, no drift is expected
+    # except for the lateness of the last loop and the skipped deadlines
+    stats = self._block.jitter_stats()
+    self.assertGreaterEqual(elapsed, 0.495)
+    self.assertLessEqual(elapsed,
+                         0.505 + stats['max'] + 0.002 * stats['missed'])
+    self.assertEqual(stats['loops'], 250)
+    self.assertGreaterEqual(stats['mean'], 0)
+    self.assertGreaterEqual(stats['max'], stats['p99'])
+
+  def test_skip(self) -> None:
+    """"""
+
+    t = perf_counter()
+    self._block._deadline = t - 0.0105
+    self._block._record_deadline(self._block._next_deadline(), t)
+    self.assertEqual(self._block.jitter_stats()['missed'], 1)
+    self.assertGreater(self._block._next_deadline(), t)
+
+  def test_catch_up(self) -> None:
+    """"""
+
+    self._block.catch_up = True
+    t = perf_counter()
+    self._block._deadline = t - 0.0105
+    self._block._record_deadline(self._block._next_deadline(), t)
+    self.assertEqual(self._block.jitter_stats()['missed'], 1)
+    self.assertLess(self._block._next_deadline(), t)
+
+  def test_no_stats(self) -> None:
+    """"""
+
+    self.assertIsNone(self._block.jitter_stats()['mean'])
@@ -0,0 +1,104 @@
+# coding: utf-8
+
+import unittest
+from multiprocessing import Value, current_process
+from multiprocessing.sharedctypes import Synchronized
+import numpy as np
+from crappy import Block, link
+
+
+class FakeGroupSend(Block):
+  """"""
+
+  def __init__(self, freq: float) -> None:
+    """"""
+
+    super().__init__()
+
+    self.freq = freq
+    self._i = 0
+
+  def loop(self) -> None:
+    """"""
+
+    self.send({'i': self._i, 'array': np.full(3, self._i)})
+    self._i += 1
+
+
+class FakeGroupRecv(Block):
+  """"""
+
+  def __init__(self,
+               n_recv: Synchronized,
+               n_wrong: Synchronized,
+               same_process: Synchronized) -> None:
+    """"""
+
+    super().__init__()
+
+    self.wake_on_data = True
+    self._n_recv = n_recv
+    self._n_wrong = n_wrong
+    self._same_process = same_process
+
+  def prepare(self) -> None:
+    """"""
+
+    self._same_process.value = current_process().name == 'leader'
+
+  def loop(self) -> None:
+    """"""
+
+    data = self.recv_all_data()
+    for i, array in zip(data['i'], data['array']):
+      self._n_recv.value += 1
+      if not np.all(array == i) or i != self._n_recv.value - 1:
+        self._n_wrong.value += 1
+
+    if self._n_recv.value >= 20:
+      self.stop()
+
+
+class TestBlockGroup(unittest.TestCase):
+  """"""
+
+  def tearDown(self) -> None:
+    """"""
+
+    Block.reset()
+
+  def test_wrong_group(self) -> None:
+    """"""
+
+    block_1, block_2, block_3 = Block(), Block(), Block()
+
+    with self.assertRaises(ValueError):
+      Block.group(block_1)
+    with self.assertRaises(ValueError):
+      Block.group(block_1, block_1)
+
+    Block.group(block_1, block_2)
+    with self.assertRaises(ValueError):
+      Block.group(block_2, block_3)
+
+  def test_group(self) -> None:
+    """"""
+
+    n_recv, n_wrong = Value('i', 0), Value('i', 0)
+    same_process = Value('b', False)
+
+    block_send = FakeGroupSend(freq=200)
+    block_send.name = 'leader'
+    block_recv = FakeGroupRecv(n_recv, n_wrong, same_process)
+    link(block_send, block_recv, name='group_link')
+    Block.group(block_send, block_recv)
+
+    Block.prepare_all(log_level=None)
+    self.assertEqual(block_send.outputs[0]._transport, 'local')
+    self.assertIsNone(block_recv.pid)
+    Block.renice_all(allow_root=False)
+    Block.launch_all()
+
+    self.assertTrue(same_process.value)
+    self.assertGreaterEqual(n_recv.value, 20)
+    self.assertEqual(n_wrong.value, 0)
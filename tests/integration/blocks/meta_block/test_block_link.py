@@ -6,6 +6,9 @@ import unittest
 from multiprocessing import Value, Array
 from multiprocessing.sharedctypes import Synchronized, SynchronizedString
 from time import sleep, time
+from tempfile import TemporaryDirectory
+from pathlib import Path
+import json
 
 
 class FakeSendSimple(Block):
@@ -231,6 +234,17 @@ class FakeRecvAllRaw(Block):
     raise Exception
 
 
+class FakeRecvStop(Block):
+  """"""
+
+  def loop(self) -> None:
+    """"""
+
+    sleep(0.3)
+    self.recv_all_data()
+    self.stop()
+
+
 class TestBlockLink(unittest.TestCase):
   """"""
 
@@ -273,6 +287,53 @@ class TestBlockLink(unittest.TestCase):
 
     self.assertDictEqual(block_recv.recv_data(), {'a': 1, 'b': 2, 'c': 3})
 
+  def test_wait_for_data(self) -> None:
+    """"""
+
+    block_send = Block()
+    block_shm = Block()
+    block_recv = Block()
+    link(block_send, block_recv)
+    link(block_shm, block_recv, transport='shm')
+
+    block_send._log_level = None
+    block_send._set_block_logger()
+    block_recv._log_level = None
+    block_recv._set_block_logger()
+
+    t0 = time()
+    self.assertFalse(block_recv.wait_for_data(timeout=0.1))
+    self.assertGreaterEqual(time() - t0, 0.1)
+
+    block_send.send({'a': 1})
+    self.assertTrue(block_recv.wait_for_data(timeout=0.1))
+    self.assertDictEqual(block_recv.recv_data(), {'a': 1})
+
+    for block in (block_send, block_shm):
+      for output in block.outputs:
+        output._close()
+
+  def test_link_stats(self) -> None:
+    """"""
+
+    block_send = FakeSendSimple('label', 1)
+    block_recv = FakeRecvStop()
+    link(block_send, block_recv, name='stats_link')
+
+    with TemporaryDirectory() as folder:
+      path = Path(folder) / 'stats.json'
+      Block.start_all(log_level=None, stats_period=0.1, stats_file=path)
+      lines = path.read_text().splitlines()
+
+    # At least one periodic collection plus the final one
+    self.assertGreaterEqual(len(lines), 2)
+    stats, = json.loads(lines[-1])['links']
+    self.assertEqual(stats['name'], 'stats_link')
+    self.assertGreaterEqual(stats['received'], 1)
+    self.assertLessEqual(stats['received'], stats['sent'])
+    self.assertEqual(stats['dropped'], 0)
+    self.assertIsNotNone(stats['latency_mean'])
+
   def test_recv(self) -> None:
     """"""
 
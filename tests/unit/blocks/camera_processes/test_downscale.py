@@ -0,0 +1,120 @@
+# coding: utf-8
+
+import unittest
+import logging
+from queue import Queue
+import numpy as np
+import cv2
+from crappy import resources
+from crappy.blocks import Block
+from crappy.blocks.camera_processes import DISCorrelProcess, DICVEProcess
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+from crappy.tool.camera_config import Box, SpotsBoxes
+from crappy.tool.image_processing.downscale import downscale_box
+
+
+class TestDownscale(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    speckle = np.tile(resources.speckle, (1, 2))
+    self._ref = np.ascontiguousarray(speckle[:480, :640])
+    matrix = np.array([[1, 0, 3.], [0, 1, -2.]])
+    self._img = cv2.warpAffine(self._ref, matrix, (640, 480),
+                               flags=cv2.INTER_CUBIC)
+    self._ring = FrameRing((480, 640), 'uint8', n_slots=4)
+    self._results = Queue()
+
+  def tearDown(self) -> None:
+    """"""
+
+    Block.reset()
+
+  def _run(self, proc, labels: list, n: int) -> list:
+    """Processes the reference image followed by n times the translated one,
+    and returns the data sent for each image."""
+
+    proc.set_shared(ring=self._ring, barrier=None, event=None,
+                    shape=self._ring.shape, dtype=self._ring.dtype,
+                    to_draw_conn=None, outputs=list(), labels=labels,
+                    log_queue=None, results=self._results)
+    proc._logger = logging.getLogger(type(self).__name__)
+    proc.init()
+
+    sent = list()
+    for i in range(n + 1):
+      self._ring.write(self._ref if i == 0 else self._img,
+                       {'t(s)': i / 10, 'ImageUniqueID': i})
+      self.assertTrue(proc._get_data())
+      proc._process_frame()
+      *_, data = self._results.get_nowait()
+      sent.extend(data)
+    return sent
+
+  def test_dis_correl(self) -> None:
+    """"""
+
+    box = Box(x_start=200, x_end=440, y_start=160, y_end=320)
+    proc = DISCorrelProcess(patch=box, fields=['x', 'y', 'exx'], downscale=2,
+                            full_res_period=2)
+    sent = self._run(proc, ['t(s)', 'meta', 'x', 'y', 'exx'], 4)
+
+    self.assertEqual(len(sent), 4)
+    self.assertIsNotNone(proc._full_res)
+    for data in sent:
+      self.assertAlmostEqual(data['x'], 3, delta=0.2)
+      self.assertAlmostEqual(data['y'], -2, delta=0.2)
+      self.assertAlmostEqual(data['exx'], 0, delta=0.1)
+
+  def test_dic_ve(self) -> None:
+    """"""
+
+    patches = SpotsBoxes()
+    patches.set_spots([(200, 100, 64, 64), (200, 400, 64, 64)])
+    patches.save_length()
+    proc = DICVEProcess(patches=patches, downscale=2, full_res_period=3,
+                        follow=False)
+    sent = self._run(proc, ['t(s)', 'meta', 'coord', 'eyy', 'exx', 'disp'],
+                     3)
+
+    self.assertEqual(len(sent), 3)
+    for data in sent:
+      self.assertAlmostEqual(data['coord'][0][1], 132, delta=2)
+      for y_disp, x_disp in data['disp']:
+        self.assertAlmostEqual(x_disp, 3, delta=0.3)
+        self.assertAlmostEqual(y_disp, -2, delta=0.3)
+
+  def test_dic_ve_follow(self) -> None:
+    """"""
+
+    patches = SpotsBoxes()
+    patches.set_spots([(200, 100, 64, 64), (200, 400, 64, 64)])
+    patches.save_length()
+    proc = DICVEProcess(patches=patches, downscale=2, full_res_period=2)
+    sent = self._run(proc, ['t(s)', 'meta', 'coord', 'eyy', 'exx', 'disp'],
+                     4)
+
+    self.assertEqual(len(sent), 4)
+    for data in sent:
+      for y_disp, x_disp in data['disp']:
+        self.assertAlmostEqual(x_disp, 3, delta=0.3)
+        self.assertAlmostEqual(y_disp, -2, delta=0.3)
+
+    # After the last full-resolution frame, the downscaled patches are at the
+    # same position as the full-resolution ones
+    for low, full in zip(proc._disve.patches, proc._full_res.patches):
+      if full is None:
+        continue
+      self.assertEqual(low.sorted(), downscale_box(full, 2).sorted())
+      self.assertAlmostEqual(low.x_disp, full.x_disp / 2)
+      self.assertAlmostEqual(low.y_disp, full.y_disp / 2)
+
+  def test_invalid(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      DISCorrelProcess(patch=Box(), downscale=0)
+    with self.assertRaises(ValueError):
+      DICVEProcess(patches=SpotsBoxes(), downscale=2, full_res_period=0)
@@ -0,0 +1,210 @@
+# coding: utf-8
+
+import unittest
+from multiprocessing import get_context
+from typing import Optional
+import numpy as np
+from crappy.blocks.camera_processes import CameraProcess
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+
+
+def _produce(ring: FrameRing, n: int) -> None:
+  """"""
+
+  for i in range(n):
+    ring.write(np.full(ring.shape, i % 256, dtype=ring.dtype),
+               {'ImageUniqueID': i})
+
+
+class LosslessProcess(CameraProcess):
+  """"""
+
+  read_policy = 'lossless'
+
+
+class ZeroCopyProcess(CameraProcess):
+  """"""
+
+  zero_copy = True
+
+
+class TestFrameRing(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._ring = FrameRing((4, 6), 'uint16', n_slots=3)
+
+  def _write(self, n: int) -> None:
+    """"""
+
+    for _ in range(n):
+      i = self._ring.head
+      self._ring.write(np.full((4, 6), i, dtype='uint16'),
+                       {'t(s)': i / 10, 'ImageUniqueID': i})
+
+  def _consumer(self,
+                proc: CameraProcess,
+                lessee: Optional[int] = None) -> CameraProcess:
+    """"""
+
+    proc.set_shared(ring=self._ring, barrier=None, event=None,
+                    shape=self._ring.shape, dtype=self._ring.dtype,
+                    to_draw_conn=None, outputs=list(), labels=list(),
+                    log_queue=None, lessee=lessee)
+    return proc
+
+  def _read_all(self, proc: CameraProcess) -> list:
+    """"""
+
+    ids = list()
+    number = proc._next_frame()
+    while number is not None:
+      proc._read_frame(number)
+      self.assertTrue(np.all(proc.img == proc.metadata['ImageUniqueID']))
+      ids.append(proc.metadata['ImageUniqueID'])
+      number = proc._next_frame()
+    return ids
+
+  def test_write_read(self) -> None:
+    """"""
+
+    self.assertEqual(self._ring.head, 0)
+    self._write(5)
+    self.assertEqual(self._ring.head, 5)
+    self.assertEqual(self._ring.frame_id(4), 4)
+
+    out = np.empty((4, 6), dtype='uint16')
+    self.assertEqual(self._ring.read(3, out), {'t(s)': 0.3,
+                                               'ImageUniqueID': 3})
+    self.assertTrue(np.all(out == 3))
+
+    with self.assertRaises(ValueError):
+      FrameRing((4, 6), 'uint8', n_slots=0)
+
+  def test_overwritten(self) -> None:
+    """"""
+
+    out = np.empty((4, 6), dtype='uint16')
+    self.assertIsNone(self._ring.read(0, out))
+    self._write(4)
+    self.assertIsNone(self._ring.read(0, out))
+    self.assertIsNone(self._ring.frame_id(0))
+    self.assertEqual(self._ring.frame_id(1), 1)
+
+    # Slot being written
+    self._ring._seqs[1 % 3] += 1
+    self.assertIsNone(self._ring.read(1, out))
+
+  def test_concurrent(self) -> None:
+    """"""
+
+    ctx = get_context('spawn')
+    ring = FrameRing((256, 256), 'uint8', n_slots=2)
+    n = 2000
+    proc = ctx.Process(target=_produce, args=(ring, n))
+    proc.start()
+
+    out = np.empty(ring.shape, dtype=ring.dtype)
+    n_read = 0
+    while proc.is_alive() or ring.head < n:
+      number = ring.head - 1
+      if number < 0:
+        continue
+      metadata = ring.read(number, out)
+      if metadata is not None:
+        n_read += 1
+        self.assertEqual(metadata['ImageUniqueID'], number)
+        self.assertTrue(np.all(out == number % 256))
+    proc.join()
+    self.assertGreater(n_read, 0)
+
+  def test_latest(self) -> None:
+    """"""
+
+    proc = self._consumer(CameraProcess())
+    self.assertIsNone(proc._next_frame())
+    self._write(2)
+    self.assertEqual(self._read_all(proc), [1])
+    self._write(1)
+    self.assertEqual(self._read_all(proc), [2])
+
+  def test_lossless(self) -> None:
+    """"""
+
+    proc = self._consumer(LosslessProcess())
+    self._write(2)
+    self.assertEqual(self._read_all(proc), [0, 1])
+    self._write(3)
+    self.assertEqual(self._read_all(proc), [2, 3, 4])
+    self.assertEqual(proc.high_water, 3)
+    self.assertEqual(proc.overruns, 0)
+
+    # Falling behind by more frames than the ring can hold
+    self._write(5)
+    self.assertEqual(self._read_all(proc), [7, 8, 9])
+    self.assertEqual(proc.overruns, 2)
+
+  def test_lease(self) -> None:
+    """"""
+
+    self._ring = FrameRing((4, 6), 'uint16', n_slots=3, n_lessees=1)
+    self._write(2)
+
+    img, metadata = self._ring.lease(1, 0)
+    self.assertEqual(metadata['ImageUniqueID'], 1)
+    self.assertFalse(img.flags.writeable)
+
+    # The leased frame is not overwritten, and the ring still holds 3 frames
+    self._write(6)
+    self.assertTrue(np.all(img == 1))
+    out = np.empty((4, 6), dtype='uint16')
+    for number in (5, 6, 7):
+      self.assertEqual(self._ring.read(number, out)['ImageUniqueID'], number)
+    self.assertIsNone(self._ring.lease(4, 0))
+
+    # Once released, the slot can be reused
+    self._ring.release(0)
+    self._write(4)
+    self.assertFalse(np.all(img == 1))
+
+  def test_lease_conflict(self) -> None:
+    """"""
+
+    self._ring = FrameRing((4, 6), 'uint16', n_slots=1, n_lessees=1)
+    self._write(1)
+
+    # Simulating the producer choosing the slot right after the lease was
+    # checked, the lease is then given up
+    read = self._ring.metadata.read
+
+    def overwrite(slot: int) -> dict:
+      """"""
+
+      self._ring._seqs[slot] = 3
+      return read(slot)
+
+    self._ring.metadata.read = overwrite
+    self.assertIsNone(self._ring.lease(0, 0))
+    self.assertEqual(self._ring._leases[0], -1)
+
+  def test_zero_copy(self) -> None:
+    """"""
+
+    self._ring = FrameRing((4, 6), 'uint16', n_slots=3, n_lessees=1)
+    proc = self._consumer(ZeroCopyProcess(), lessee=0)
+    self._write(3)
+    self.assertEqual(self._read_all(proc), [2])
+    self.assertFalse(proc.img.flags.writeable)
+    self._write(5)
+    self.assertTrue(np.all(proc.img == 2))
+    self.assertEqual(self._read_all(proc), [7])
+
+  def test_invalid_policy(self) -> None:
+    """"""
+
+    proc = CameraProcess()
+    proc.read_policy = 'oldest'
+    with self.assertRaises(ValueError):
+      self._consumer(proc)
@@ -0,0 +1,137 @@
+# coding: utf-8
+
+import unittest
+from multiprocessing import Event
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from csv import DictReader
+import numpy as np
+from crappy._global import ReaderStop
+from crappy.blocks.camera_processes import ImageSaver
+from crappy.blocks.camera_processes import record
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+from crappy.camera import FileReader
+from crappy.tool.metadata_file import read_metadata
+
+
+class TestImageSaver(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._dir = TemporaryDirectory()
+    self._folder = Path(self._dir.name)
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._dir.cleanup()
+
+  def _save(self,
+            n_workers: int,
+            n_frames: int,
+            backend: str = 'npy') -> None:
+    """"""
+
+    saver = ImageSaver(save_folder=self._folder, save_backend=backend,
+                       n_workers=n_workers)
+    shape = (32, 48)
+    saver.set_shared(ring=FrameRing(shape, 'uint8', 2), barrier=None,
+                     event=Event(), shape=shape, dtype='uint8',
+                     to_draw_conn=None, outputs=list(), labels=list(),
+                     log_queue=None)
+    saver.init()
+    try:
+      for i in range(n_frames):
+        saver.img = np.full(shape, i, dtype='uint8')
+        saver.metadata = {'t(s)': i / 100, 'ImageUniqueID': i}
+        saver.loop()
+    finally:
+      saver.finish()
+
+  def _check(self, n_frames: int) -> None:
+    """"""
+
+    with open(self._folder / 'metadata.csv') as csvfile:
+      ids = [int(row['ImageUniqueID']) for row in DictReader(csvfile)]
+    self.assertEqual(ids, list(range(n_frames)))
+
+    files = sorted(self._folder.glob('*.npy'))
+    self.assertEqual(len(files), n_frames)
+    for i, path in enumerate(files):
+      self.assertTrue(path.name.startswith(f'{i:06d}_'))
+      self.assertTrue(np.all(np.load(path) == i))
+
+  def test_no_worker(self) -> None:
+    """"""
+
+    self._save(0, 10)
+    self._check(10)
+
+  def test_workers(self) -> None:
+    """"""
+
+    self._save(3, 50)
+    self._check(50)
+
+  def test_raw(self) -> None:
+    """"""
+
+    # Making the containers small enough to hold only 4 images each
+    container_size = record._container_size
+    record._container_size = 4 * 32 * 48
+    try:
+      self._save(0, 10, 'raw')
+    finally:
+      record._container_size = container_size
+
+    with open(self._folder / 'metadata.csv') as csvfile:
+      ids = [int(row['ImageUniqueID']) for row in DictReader(csvfile)]
+    self.assertEqual(ids, list(range(10)))
+    self.assertEqual(len(list(self._folder.glob('*.raw'))), 3)
+
+    # Replaying the images with the FileReader, without waiting
+    reader = FileReader()
+    reader.open(self._folder, realtime=False)
+    try:
+      for i in range(10):
+        _, img = reader.get_image()
+        self.assertEqual(img.shape, (32, 48))
+        self.assertTrue(np.all(img == i))
+      with self.assertRaises(ReaderStop):
+        reader.get_image()
+    finally:
+      reader.close()
+
+  def test_metadata_batches(self) -> None:
+    """"""
+
+    saver = ImageSaver(save_folder=self._folder, save_backend='npy',
+                       metadata_flush_period=60, metadata_flush_rows=4,
+                       metadata_sidecar=True)
+    shape = (8, 8)
+    saver.set_shared(ring=FrameRing(shape, 'uint8', 2), barrier=None,
+                     event=Event(), shape=shape, dtype='uint8',
+                     to_draw_conn=None, outputs=list(), labels=list(),
+                     log_queue=None)
+    saver.init()
+
+    def n_rows() -> int:
+      with open(self._folder / 'metadata.csv') as csvfile:
+        return len(list(DictReader(csvfile)))
+
+    try:
+      for i in range(6):
+        saver.img = np.full(shape, i, dtype='uint8')
+        saver.metadata = {'t(s)': i / 100, 'ImageUniqueID': i}
+        saver.loop()
+      # Only the first batch is written before finishing
+      self.assertEqual(n_rows(), 4)
+      self.assertEqual(len(read_metadata(self._folder / 'metadata.bin')), 4)
+    finally:
+      saver.finish()
+
+    self.assertEqual(n_rows(), 6)
+    records = read_metadata(self._folder / 'metadata.bin')
+    np.testing.assert_array_equal(records['ImageUniqueID'], np.arange(6))
@@ -0,0 +1,119 @@
+# coding: utf-8
+
+import unittest
+from multiprocessing import get_context
+import numpy as np
+from crappy.blocks.camera_processes.shared_metadata import SharedMetadata, \
+  max_fields, key_length, str_length, overflow_length
+
+
+def _read_in_child(metadata: SharedMetadata, conn) -> None:
+  """"""
+
+  conn.send(metadata.read())
+  conn.close()
+
+
+class TestSharedMetadata(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._metadata = {'t(s)': 1.5,
+                      'DateTimeOriginal': '2024:01:01 00:00:00',
+                      'SubsecTimeOriginal': '0.500000',
+                      'ImageUniqueID': 3,
+                      'ExposureTime': np.int64(1000),
+                      'Gain': np.float32(0.5)}
+
+  def test_empty(self) -> None:
+    """"""
+
+    shared = SharedMetadata()
+    self.assertIsNone(shared.frame_id())
+    self.assertEqual(shared.read(), dict())
+
+  def test_write_read(self) -> None:
+    """"""
+
+    shared = SharedMetadata()
+    shared.write(self._metadata)
+    self.assertEqual(shared.frame_id(), 3)
+
+    read = shared.read()
+    self.assertEqual(list(read), list(self._metadata))
+    self.assertEqual(read, self._metadata)
+    self.assertIsInstance(read['ExposureTime'], int)
+    self.assertIsInstance(read['Gain'], float)
+
+    # Overwriting with fewer fields
+    shared.write({'t(s)': 2.0, 'ImageUniqueID': 4})
+    self.assertEqual(shared.read(), {'t(s)': 2.0, 'ImageUniqueID': 4})
+
+  def test_several_records(self) -> None:
+    """"""
+
+    shared = SharedMetadata(n_records=3)
+    shared.write(self._metadata, index=2)
+    self.assertIsNone(shared.frame_id(0))
+    self.assertEqual(shared.frame_id(2), 3)
+    self.assertEqual(shared.read(2), self._metadata)
+
+  def test_limits(self) -> None:
+    """"""
+
+    shared = SharedMetadata()
+    metadata = {'ImageUniqueID': 0, 'None': None, 'Flag': True}
+    self.assertTrue(shared.write(metadata))
+    self.assertEqual(shared.read(), metadata)
+    self.assertIs(shared.read()['Flag'], True)
+
+    # The metadata not fitting in the typed fields is pickled
+    for metadata in ({'ImageUniqueID': 1, 'Model': 'a' * (2 * str_length)},
+                     {'ImageUniqueID': 2, 'k' * (2 * key_length): 0},
+                     {'ImageUniqueID': 3, 'Roi': (0, 0, 10, 10)},
+                     {'ImageUniqueID': 4,
+                      **{str(i): i for i in range(max_fields)}}):
+      self.assertTrue(shared.write(metadata))
+      self.assertEqual(shared.frame_id(), metadata['ImageUniqueID'])
+      self.assertEqual(shared.read(), metadata)
+
+    # Otherwise, the extra fields are dropped and the strings truncated
+    metadata = {'ImageUniqueID': 5, 'Model': 'a' * overflow_length,
+                **{str(i): i for i in range(max_fields)}}
+    self.assertFalse(shared.write(metadata))
+    self.assertEqual(shared.frame_id(), 5)
+    read = shared.read()
+    self.assertEqual(len(read), max_fields)
+    self.assertEqual(read['Model'], 'a' * str_length)
+
+  def test_required_fields(self) -> None:
+    """"""
+
+    shared = SharedMetadata()
+    metadata = {f'field_{i}': str(i) * 200 for i in range(40)}
+    metadata['t(s)'] = 1.5
+    metadata['ImageUniqueID'] = 7
+    self.assertFalse(shared.write(metadata))
+
+    # The fields needed by the CameraProcesses are kept even if they come last
+    read = shared.read()
+    self.assertEqual(len(read), max_fields)
+    self.assertEqual(list(read)[:2], ['ImageUniqueID', 't(s)'])
+    self.assertEqual(read['ImageUniqueID'], 7)
+    self.assertEqual(read['t(s)'], 1.5)
+    self.assertEqual(read['field_0'], '0' * str_length)
+    self.assertEqual(shared.frame_id(), 7)
+
+  def test_other_process(self) -> None:
+    """"""
+
+    ctx = get_context('spawn')
+    shared = SharedMetadata()
+    shared.write(self._metadata)
+    conn_in, conn_out = ctx.Pipe()
+    proc = ctx.Process(target=_read_in_child, args=(shared, conn_out))
+    proc.start()
+    self.assertEqual(conn_in.recv(), self._metadata)
+    proc.join()
@@ -0,0 +1,209 @@
+# coding: utf-8
+
+import unittest
+from unittest.mock import patch
+import logging
+from queue import Queue
+import numpy as np
+import cv2
+from crappy import resources
+from crappy.blocks import Block, Camera, DISCorrel
+from crappy.blocks.camera_processes import CameraProcess, DISCorrelProcess, \
+  DICVEProcess, VideoExtensoProcess, GPUCorrelProcess, GPUVEProcess
+from crappy.blocks.camera_processes.frame_ring import FrameRing
+from crappy.tool.camera_config import Box, SpotsBoxes, SpotsDetector
+
+
+class SendingProcess(CameraProcess):
+  """"""
+
+  def loop(self) -> None:
+    """"""
+
+    self.send({'id': self.metadata['ImageUniqueID']})
+
+
+class ConfiguredDISCorrel(DISCorrel):
+  """"""
+
+  def _configure(self) -> None:
+    """Sets the patch and the image format, like the configuration window."""
+
+    self._patch.update(Box(x_start=200, x_end=440, y_start=160, y_end=320))
+    self._img_shape = (480, 640)
+    self._img_dtype = 'uint8'
+
+
+class TestWorkers(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._ring = FrameRing((4, 6), 'uint8', n_slots=6)
+    self._results = Queue()
+
+  def tearDown(self) -> None:
+    """"""
+
+    Block.reset()
+
+  def _write(self, n: int) -> None:
+    """"""
+
+    for _ in range(n):
+      i = self._ring.head
+      self._ring.write(np.full((4, 6), i, dtype='uint8'),
+                       {'t(s)': i / 10, 'ImageUniqueID': i})
+
+  def _workers(self, n: int) -> list:
+    """"""
+
+    workers = [SendingProcess()]
+    workers.extend(workers[0].clone() for _ in range(n - 1))
+    for i, proc in enumerate(workers):
+      proc.set_shared(ring=self._ring, barrier=None, event=None,
+                      shape=self._ring.shape, dtype=self._ring.dtype,
+                      to_draw_conn=None, outputs=list(), labels=list(),
+                      log_queue=None, results=self._results, worker=i,
+                      n_workers=n)
+    return workers
+
+  def _process_all(self, proc: CameraProcess) -> list:
+    """"""
+
+    ids = list()
+    while proc._get_data():
+      self.assertTrue(np.all(proc.img == proc.metadata['ImageUniqueID']))
+      proc._process_frame()
+      ids.append(proc.metadata['ImageUniqueID'])
+    return ids
+
+  def test_clone(self) -> None:
+    """"""
+
+    proc = SendingProcess()
+    clone = proc.clone()
+    self.assertIsNot(clone, proc)
+    self.assertIsInstance(clone, SendingProcess)
+    self.assertNotEqual(clone._identity, proc._identity)
+    self.assertEqual(clone.name, proc.name)
+    self.assertIsNot(clone._sent, proc._sent)
+
+  def test_clone_processes(self) -> None:
+    """"""
+
+    # All the CameraProcesses of the Blocks accepting process_workers
+    procs = (DISCorrelProcess(patch=Box(x_start=0, x_end=8, y_start=0,
+                                        y_end=8)),
+             DICVEProcess(patches=SpotsBoxes()),
+             VideoExtensoProcess(detector=SpotsDetector()),
+             GPUCorrelProcess(),
+             GPUVEProcess(patches=[(0, 0, 8, 8)]))
+
+    for proc in procs:
+      with self.subTest(process=type(proc).__name__):
+        clone = proc.clone()
+        self.assertIsInstance(clone, type(proc))
+        self.assertNotEqual(clone._identity, proc._identity)
+        self.assertSetEqual(set(clone.__dict__), set(proc.__dict__))
+
+    # The CUDA context is only created by the Process using it
+    self.assertIsNone(procs[-1]._context)
+
+  def test_round_robin(self) -> None:
+    """"""
+
+    workers = self._workers(3)
+    self.assertTrue(all(proc.read_policy == 'lossless' for proc in workers))
+
+    self._write(5)
+    self.assertEqual(self._process_all(workers[0]), [0, 1, 4])
+    self.assertEqual(self._process_all(workers[1]), [0, 2])
+    self.assertEqual(self._process_all(workers[2]), [0, 3])
+    self._write(5)
+    self.assertEqual(self._process_all(workers[1]), [5, 8])
+    self.assertEqual(self._process_all(workers[2]), [6, 9])
+    self.assertEqual(self._process_all(workers[0]), [7])
+
+    # The first frame is processed by all the workers, but only the data of
+    # the first one is kept
+    results = dict()
+    while not self._results.empty():
+      worker, frame_id, data = self._results.get()
+      results[(worker, frame_id)] = data
+    self.assertEqual(len(results), 12)
+    self.assertEqual(results[(0, 0)], [{'id': 0}])
+    self.assertEqual(results[(1, 0)], [])
+    self.assertEqual(results[(2, 0)], [])
+    self.assertEqual(results[(2, 9)], [{'id': 9}])
+
+  def test_overruns(self) -> None:
+    """"""
+
+    workers = self._workers(2)
+    self._write(20)
+    # The frames assigned to the other worker are not counted
+    self.assertEqual(self._process_all(workers[1]), [14, 16, 18])
+    self.assertEqual(workers[1].overruns, 7)
+
+  def test_reorder(self) -> None:
+    """"""
+
+    camera = Camera('', image_generator=lambda *_: np.zeros((4, 6)),
+                    process_workers=2)
+    sent = list()
+    camera.send = sent.append
+    camera._results = self._results
+    camera._processed = [-1, -1]
+
+    self._results.put((1, 0, []))
+    self._results.put((1, 2, [{'id': 2}]))
+    camera._send_results()
+    # Waiting for the first worker to process the first frame
+    self.assertEqual(sent, [])
+
+    self._results.put((0, 0, [{'id': 0}]))
+    self._results.put((0, 1, [{'id': 1}, {'id': 1.5}]))
+    self._results.put((0, 3, [{'id': 3}]))
+    camera._send_results()
+    self.assertEqual(sent, [{'id': 0}, {'id': 1}, {'id': 1.5}, {'id': 2}])
+
+    camera._send_results(final=True)
+    self.assertEqual(sent[-1], {'id': 3})
+
+  def test_configured_workers(self) -> None:
+    """"""
+
+    speckle = np.tile(resources.speckle, (1, 2))
+    ref = np.ascontiguousarray(speckle[:480, :640])
+    img = cv2.warpAffine(ref, np.array([[1, 0, 3.], [0, 1, -2.]]), (640, 480),
+                         flags=cv2.INTER_CUBIC)
+
+    block = ConfiguredDISCorrel('', image_generator=lambda *_: ref,
+                                fields=['x', 'y'],
+                                labels=['t(s)', 'meta', 'x', 'y'],
+                                process_workers=2)
+    # The workers are not started, the second one is run here instead
+    with patch.object(DISCorrelProcess, 'start'):
+      block.prepare()
+    worker = block._process_procs[1]
+    self.assertEqual(worker._box.sorted(), (200, 440, 160, 320))
+
+    worker._logger = logging.getLogger(type(self).__name__)
+    worker.init()
+    for i in range(5):
+      block._ring.write(ref if i == 0 else img,
+                        {'t(s)': i / 10, 'ImageUniqueID': i})
+      while worker._get_data():
+        worker._process_frame()
+
+    results = dict()
+    while not block._results.empty():
+      _, frame_id, data = block._results.get()
+      results[frame_id] = data
+    self.assertEqual(sorted(results), [0, 2, 4])
+    for frame_id in (2, 4):
+      data, = results[frame_id]
+      self.assertAlmostEqual(data['x'], 3, delta=0.2)
+      self.assertAlmostEqual(data['y'], -2, delta=0.2)
@@ -0,0 +1,65 @@
+# coding: utf-8
+
+import unittest
+from multiprocessing import Value
+from time import time
+from typing import List
+import numpy as np
+from crappy.blocks import Block, MeanBlock
+from crappy.links import Link, Batch
+
+
+class FakeBlock:
+  """"""
+
+  def __init__(self) -> None:
+    """"""
+
+    self.inputs: List[Link] = list()
+    self.outputs: List[Link] = list()
+
+  def add_input(self, link: Link) -> None:
+    """"""
+
+    self.inputs.append(link)
+
+  def add_output(self, link: Link) -> None:
+    """"""
+
+    self.outputs.append(link)
+
+
+class TestMeanBlock(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._mean = MeanBlock(delay=0.05)
+    self._mean._instance_t0 = Value('d', time())
+    self._in = Link(FakeBlock(), self._mean)
+    self._out = Link(self._mean, FakeBlock())
+
+  def tearDown(self) -> None:
+    """"""
+
+    Block.reset()
+
+  def test_mean(self) -> None:
+    """"""
+
+    self._in.send(Batch.from_columns({'t(s)': [0., 0.1], 'a': [1., 2.]}))
+    self._in.send({'t(s)': 0.2, 'a': 6.})
+    self._mean.loop()
+    self.assertAlmostEqual(self._out.recv()['a'], 3)
+
+  def test_ragged(self) -> None:
+    """"""
+
+    # Arrays of different shapes cannot be averaged, the last one is sent
+    self._in.send({'t(s)': 0., 'a': 1., 'arr': np.zeros(3)})
+    self._in.send({'t(s)': 0.1, 'a': 3., 'arr': np.ones(4)})
+    self._mean.loop()
+    data = self._out.recv()
+    self.assertAlmostEqual(data['a'], 2)
+    np.testing.assert_array_equal(data['arr'], np.ones(4))
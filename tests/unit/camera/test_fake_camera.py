@@ -0,0 +1,52 @@
+# coding: utf-8
+
+import unittest
+from time import time, process_time
+import numpy as np
+from crappy.camera import FakeCamera
+
+
+class TestFakeCamera(unittest.TestCase):
+  """"""
+
+  def test_frame_rate(self) -> None:
+    """"""
+
+    camera = FakeCamera()
+    camera.open(width=64, height=48, fps=50)
+
+    t0, cpu0 = time(), process_time()
+    for _ in range(25):
+      camera.get_image()
+    elapsed, cpu = time() - t0, process_time() - cpu0
+
+    self.assertGreaterEqual(elapsed, 0.47)
+    self.assertLess(elapsed, 0.75)
+    # The camera should sleep most of the time instead of actively waiting
+    self.assertLess(cpu, 0.5 * elapsed)
+
+  def test_images(self) -> None:
+    """"""
+
+    camera = FakeCamera()
+    camera.open(width=64, height=48, fps=100, speed=0)
+
+    _, img = camera.get_image()
+    self.assertEqual(img.shape, (48, 64))
+    self.assertEqual(img.dtype, np.uint8)
+    self.assertFalse(img.flags.writeable)
+    np.testing.assert_array_equal(img[:, 0],
+                                  (np.arange(48) * 255 / 48).astype('uint8'))
+
+  def test_bit_depth_speckle(self) -> None:
+    """"""
+
+    camera = FakeCamera()
+    camera.open(width=1000, height=700, fps=100, bit_depth=12,
+                pattern='speckle')
+
+    _, img = camera.get_image()
+    self.assertEqual(img.shape, (700, 1000))
+    self.assertEqual(img.dtype, np.uint16)
+    self.assertLess(img.max(), 2 ** 12)
+    self.assertGreater(img.std(), 0)
@@ -0,0 +1,71 @@
+# coding: utf-8
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import time
+import numpy as np
+import cv2
+from crappy._global import ReaderStop
+from crappy.camera import FileReader
+
+
+class TestFileReader(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._dir = TemporaryDirectory()
+    self._folder = Path(self._dir.name)
+    for i in range(20):
+      cv2.imwrite(str(self._folder / f'{i:06d}_{i / 100:.3f}.png'),
+                  np.full((40, 60), i, dtype='uint8'))
+
+    self._reader = FileReader()
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._reader.close()
+    self._dir.cleanup()
+
+  def test_read_ahead(self) -> None:
+    """"""
+
+    self._reader.open(self._folder, reader_backend='cv2', realtime=False,
+                      read_ahead=4, n_threads=3)
+    for i in range(20):
+      _, img = self._reader.get_image()
+      self.assertEqual(img.shape, (40, 60))
+      self.assertTrue(np.all(img == i))
+    with self.assertRaises(ReaderStop):
+      self._reader.get_image()
+
+  def test_realtime(self) -> None:
+    """"""
+
+    self._reader.open(self._folder, reader_backend='cv2')
+    t0 = time()
+    for _ in range(20):
+      self._reader.get_image()
+    # The last image was recorded 0.19s after the first one
+    self.assertGreaterEqual(time() - t0, 0.18)
+
+  def test_stay_idle(self) -> None:
+    """"""
+
+    self._reader.open(self._folder, reader_backend='cv2', realtime=False,
+                      stop_at_end=False)
+    for _ in range(20):
+      self.assertIsNotNone(self._reader.get_image())
+    self.assertIsNone(self._reader.get_image())
+    self.assertIsNone(self._reader.get_image())
+
+  def test_invalid_args(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      self._reader.open(self._folder, read_ahead=0)
+    with self.assertRaises(ValueError):
+      self._reader.open(self._folder, n_threads=0)
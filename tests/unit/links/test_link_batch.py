@@ -0,0 +1,109 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+from typing import List, Dict, Any
+from crappy.links import Link, Batch
+
+
+class FakeBlock:
+  """"""
+
+  def __init__(self) -> None:
+    """"""
+
+    self.inputs: List[Link] = list()
+    self.outputs: List[Link] = list()
+
+  def add_input(self, link: Link) -> None:
+    """"""
+
+    self.inputs.append(link)
+
+  def add_output(self, link: Link) -> None:
+    """"""
+
+    self.outputs.append(link)
+
+
+def double(data: Dict[str, Any]) -> Dict[str, Any]:
+  """"""
+
+  return {label: 2 * value for label, value in data.items()}
+
+
+class TestLinkBatch(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._link = Link(FakeBlock(), FakeBlock())
+    self._batch = Batch.from_columns({'t': [1., 2., 3.], 'a': [4, 5, 6]})
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._link._close()
+
+  def test_from_columns(self) -> None:
+    """"""
+
+    self.assertEqual(self._batch.n_points, 3)
+    self.assertIsInstance(self._batch['t'], np.ndarray)
+    with self.assertRaises(ValueError):
+      Batch.from_columns({'t': [1, 2], 'a': [1, 2, 3]})
+
+  def test_recv(self) -> None:
+    """"""
+
+    self._link.send(self._batch)
+    self._link.send({'t': 4., 'a': 7})
+    self.assertDictEqual(self._link.recv(), {'t': 1., 'a': 4})
+    self.assertDictEqual(self._link.recv(), {'t': 2., 'a': 5})
+    self.assertTrue(self._link.poll())
+    self.assertDictEqual(self._link.recv_last(), {'t': 4., 'a': 7})
+    self.assertFalse(self._link.poll())
+
+  def test_recv_last(self) -> None:
+    """"""
+
+    self._link.send({'t': 0., 'a': 3})
+    self._link.send(self._batch)
+    self.assertDictEqual(self._link.recv_last(), {'t': 3., 'a': 6})
+
+  def test_recv_chunk(self) -> None:
+    """"""
+
+    self._link.send({'t': 0., 'a': 3})
+    self._link.send(self._batch)
+    self.assertDictEqual(self._link.recv_chunk(),
+                         {'t': [0., 1., 2., 3.], 'a': [3, 4, 5, 6]})
+
+  def test_recv_batch(self) -> None:
+    """"""
+
+    self._link.send({'t': 0., 'a': 3})
+    self._link.send(self._batch)
+    self._link.send({'t': 4., 'a': 7})
+    data = self._link.recv_batch()
+    np.testing.assert_array_equal(data['t'], [0., 1., 2., 3., 4.])
+    np.testing.assert_array_equal(data['a'], [3, 4, 5, 6, 7])
+
+  def test_modifiers(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock(), modifiers=[double])
+    link.send(self._batch)
+    self.assertDictEqual(link.recv_chunk(),
+                         {'t': [2., 4., 6.], 'a': [8, 10, 12]})
+
+  def test_recv_batch_ragged(self) -> None:
+    """"""
+
+    self._link.send({'t': 0., 'a': [1, 2]})
+    self._link.send({'t': 1., 'a': [3, 4, 5]})
+    data = self._link.recv_batch()
+    np.testing.assert_array_equal(data['t'], [0., 1.])
+    self.assertEqual(data['a'].dtype, object)
+    self.assertEqual(data['a'].tolist(), [[1, 2], [3, 4, 5]])
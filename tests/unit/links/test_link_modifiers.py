@@ -0,0 +1,107 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+from typing import List, Dict, Any
+from crappy.links import Link
+from crappy.modifier import Offset, Demux, Mean, Diff
+
+
+class FakeBlock:
+  """"""
+
+  def __init__(self) -> None:
+    """"""
+
+    self.inputs: List[Link] = list()
+    self.outputs: List[Link] = list()
+
+  def add_input(self, link: Link) -> None:
+    """"""
+
+    self.inputs.append(link)
+
+  def add_output(self, link: Link) -> None:
+    """"""
+
+    self.outputs.append(link)
+
+
+class Recorder:
+  """"""
+
+  def __init__(self, pure: bool) -> None:
+    """"""
+
+    self.pure = pure
+    self.received = list()
+
+  def __call__(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    """"""
+
+    self.received.append(data)
+    return data
+
+
+def mutate(data: Dict[str, Any]) -> Dict[str, Any]:
+  """"""
+
+  data['a'] += 1
+  return data
+
+
+class TestLinkModifiers(unittest.TestCase):
+  """"""
+
+  def test_pure_no_copy(self) -> None:
+    """"""
+
+    mod = Recorder(pure=True)
+    link = Link(FakeBlock(), FakeBlock(), modifiers=[mod])
+    data = {'a': 1}
+    link.send(data)
+    self.assertIs(mod.received[0], data)
+    self.assertDictEqual(link.recv(), {'a': 1})
+
+  def test_impure_copy_once(self) -> None:
+    """"""
+
+    first, second = Recorder(pure=False), Recorder(pure=False)
+    link = Link(FakeBlock(), FakeBlock(), modifiers=[first, mutate, second])
+    data = {'a': 1}
+    link.send(data)
+    self.assertIsNot(first.received[0], data)
+    self.assertIs(second.received[0], first.received[0])
+    self.assertDictEqual(data, {'a': 1})
+    self.assertDictEqual(link.recv(), {'a': 2})
+
+  def test_builtin_pure(self) -> None:
+    """"""
+
+    data = {'t(s)': np.arange(4.), 'stream': np.ones((4, 2)),
+            'x': np.zeros(3)}
+    link = Link(FakeBlock(), FakeBlock(),
+                modifiers=[Offset('x', 1), Demux(('a', 'b'))])
+    link.send(data)
+    self.assertSetEqual(set(data), {'t(s)', 'stream', 'x'})
+    np.testing.assert_array_equal(data['x'], np.zeros(3))
+    self.assertSetEqual(set(link.recv()), {'t(s)', 'x', 'a', 'b'})
+
+  def test_pure_keeps_copies(self) -> None:
+    """"""
+
+    mean = Link(FakeBlock(), FakeBlock(), modifiers=[Mean(2)])
+    diff = Link(FakeBlock(), FakeBlock(),
+                modifiers=[Diff('x', out_label='dx')])
+    data = {'t(s)': 0., 'x': np.zeros(2)}
+    for t in range(4):
+      mean.send(data)
+      diff.send(data)
+      # The sending Block updates its array in place after each send
+      data['x'] += 1
+      data['t(s)'] = t + 1.
+
+    first, second = mean.recv_chunk()['x']
+    self.assertEqual(first, 0)
+    self.assertEqual(second, 1.5)
+    np.testing.assert_array_equal(diff.recv_last()['dx'], np.ones(2))
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+import unittest
+from time import time
+from typing import List
+from crappy.links import Link
+from crappy._global import LinkDataError
+
+
+class FakeBlock:
+  """"""
+
+  def __init__(self) -> None:
+    """"""
+
+    self.inputs: List[Link] = list()
+    self.outputs: List[Link] = list()
+
+  def add_input(self, link: Link) -> None:
+    """"""
+
+    self.inputs.append(link)
+
+  def add_output(self, link: Link) -> None:
+    """"""
+
+    self.outputs.append(link)
+
+
+class TestLinkOverflow(unittest.TestCase):
+  """"""
+
+  def _fill(self, link: Link) -> None:
+    """"""
+
+    for i in range(5):
+      link.send({'i': i})
+
+  def test_wrong_args(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      Link(FakeBlock(), FakeBlock(), overflow='drop_all')
+    with self.assertRaises(ValueError):
+      Link(FakeBlock(), FakeBlock(), capacity=0)
+
+  def test_drop_newest(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock(), capacity=3)
+    self._fill(link)
+    self.assertEqual(link.dropped, 2)
+    self.assertDictEqual(link.recv_chunk(), {'i': [0, 1, 2]})
+
+  def test_drop_oldest(self) -> None:
+    """"""
+
+    for transport in ('pipe', 'shm'):
+      with self.subTest(transport=transport):
+        link = Link(FakeBlock(), FakeBlock(), overflow='drop_oldest',
+                    capacity=3, transport=transport)
+        self._fill(link)
+        self.assertDictEqual(link.recv(), {'i': 2})
+        self.assertDictEqual(link.recv_chunk(), {'i': [3, 4]})
+        self.assertEqual(link.dropped, 2)
+        link._close()
+
+  def test_latest_only(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock(), overflow='latest_only', capacity=3)
+    self._fill(link)
+    self.assertDictEqual(link.recv(), {'i': 4})
+    self.assertFalse(link.poll())
+    self.assertEqual(link.dropped, 4)
+
+  def test_full_transport(self) -> None:
+    """"""
+
+    # Sending many more messages than the Pipe or the ring can hold
+    for transport in ('pipe', 'shm'):
+      with self.subTest(transport=transport, overflow='latest_only'):
+        link = Link(FakeBlock(), FakeBlock(), overflow='latest_only',
+                    transport=transport, shm_size=2 ** 12)
+        for i in range(20000):
+          link.send({'i': i})
+        self.assertDictEqual(link.recv(), {'i': 19999})
+        self.assertFalse(link.poll())
+        link._close()
+
+      with self.subTest(transport=transport, overflow='drop_oldest'):
+        link = Link(FakeBlock(), FakeBlock(), overflow='drop_oldest',
+                    transport=transport, shm_size=2 ** 12)
+        for i in range(20000):
+          link.send({'i': i})
+        received = link.recv_chunk()['i']
+        self.assertGreater(received[0], 0)
+        self.assertListEqual(received, list(range(received[0], 20000)))
+        self.assertEqual(link.dropped, received[0])
+        link._close()
+
+  def test_local(self) -> None:
+    """"""
+
+    for overflow, expected in (('drop_newest', [0, 1, 2]),
+                               ('block', [0, 1, 2]),
+                               ('drop_oldest', [2, 3, 4]),
+                               ('latest_only', [4])):
+      with self.subTest(overflow=overflow):
+        link = Link(FakeBlock(), FakeBlock(), overflow=overflow, capacity=3)
+        link._make_local()
+        self._fill(link)
+        self.assertEqual(len(link._in), len(expected))
+        self.assertEqual(link.dropped, 5 - len(expected))
+        self.assertDictEqual(link.recv_chunk(), {'i': expected})
+
+  def test_block(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock(), overflow='block', capacity=1,
+                block_timeout=0.1)
+    link.send({'i': 0})
+    t0 = time()
+    link.send({'i': 1})
+    self.assertGreaterEqual(time() - t0, 0.1)
+    self.assertEqual(link.dropped, 1)
+    self.assertDictEqual(link.recv_chunk(), {'i': [0]})
+
+  def test_too_large(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock(), transport='shm', shm_size=256)
+    try:
+      with self.assertRaises(LinkDataError):
+        link.send({'pad': 'x' * 256})
+      self.assertEqual(link.dropped, 0)
+      link.send({'i': 0})
+      self.assertDictEqual(link.recv(), {'i': 0})
+    finally:
+      link._close()
@@ -0,0 +1,75 @@
+# coding: utf-8
+
+import unittest
+from typing import List
+from crappy.links import Link, Batch
+
+
+class FakeBlock:
+  """"""
+
+  def __init__(self) -> None:
+    """"""
+
+    self.inputs: List[Link] = list()
+    self.outputs: List[Link] = list()
+
+  def add_input(self, link: Link) -> None:
+    """"""
+
+    self.inputs.append(link)
+
+  def add_output(self, link: Link) -> None:
+    """"""
+
+    self.outputs.append(link)
+
+
+class TestLinkStats(unittest.TestCase):
+  """"""
+
+  def test_empty(self) -> None:
+    """"""
+
+    stats = Link(FakeBlock(), FakeBlock(), name='test').stats()
+    self.assertEqual(stats['name'], 'test')
+    self.assertEqual(stats['sent'], 0)
+    self.assertEqual(stats['backlog'], 0)
+    self.assertIsNone(stats['latency_mean'])
+    self.assertEqual(sum(stats['latency_hist']), 0)
+
+  def test_counters(self) -> None:
+    """"""
+
+    for transport in ('pipe', 'shm'):
+      with self.subTest(transport=transport):
+        link = Link(FakeBlock(), FakeBlock(), transport=transport,
+                    capacity=4)
+        for i in range(5):
+          link.send({'i': i})
+        stats = link.stats()
+        self.assertEqual(stats['sent'], 4)
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(stats['backlog'], 4)
+        self.assertGreater(stats['bytes_sent'], 0)
+
+        link.recv()
+        link.recv()
+        stats = link.stats()
+        self.assertEqual(stats['received'], 2)
+        self.assertEqual(stats['backlog'], 2)
+        self.assertEqual(sum(stats['latency_hist']), 2)
+        self.assertGreaterEqual(stats['latency_max'], stats['latency_mean'])
+        self.assertGreaterEqual(stats['latency_p99'], stats['latency_mean'])
+        link._close()
+
+  def test_batch_backlog(self) -> None:
+    """"""
+
+    link = Link(FakeBlock(), FakeBlock())
+    link.send(Batch.from_columns({'i': [0, 1, 2]}))
+    self.assertEqual(link.stats()['backlog'], 1)
+
+    # The backlog counts messages, not the rows left in the received Batch
+    link.recv()
+    self.assertEqual(link.stats()['backlog'], 0)
@@ -0,0 +1,70 @@
+# coding: utf-8
+
+import unittest
+from pickle import dumps, loads
+from crappy.links import SharedMemoryRing
+
+
+class TestSharedMemoryRing(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._ring = SharedMemoryRing(size=256)
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._ring.close()
+    self._ring.unlink()
+
+  def test_send_recv(self) -> None:
+    """"""
+
+    self.assertFalse(self._ring.poll())
+    self.assertTrue(self._ring.send({'a': 1, 'b': 'c'}))
+    self.assertTrue(self._ring.send({'a': 2}))
+    self.assertTrue(self._ring.poll())
+    self.assertDictEqual(self._ring.recv(), {'a': 1, 'b': 'c'})
+    self.assertDictEqual(self._ring.recv(), {'a': 2})
+    self.assertFalse(self._ring.poll())
+
+  def test_wrap_around(self) -> None:
+    """"""
+
+    for i in range(100):
+      self.assertTrue(self._ring.send({'i': i, 'pad': 'x' * 40}))
+      self.assertDictEqual(self._ring.recv(), {'i': i, 'pad': 'x' * 40})
+    self.assertEqual(self._ring.free(), 256)
+
+  def test_full(self) -> None:
+    """"""
+
+    n = 0
+    while self._ring.send({'i': n}):
+      n += 1
+    self.assertGreater(n, 0)
+    self.assertFalse(self._ring.send({'i': n}))
+
+    for i in range(n):
+      self.assertDictEqual(self._ring.recv(), {'i': i})
+    self.assertFalse(self._ring.poll())
+
+  def test_pickle(self) -> None:
+    """"""
+
+    other = loads(dumps(self._ring))
+    self._ring.send({'a': 1})
+    self.assertTrue(other.poll())
+    self.assertDictEqual(other.recv(), {'a': 1})
+    self.assertFalse(self._ring.poll())
+    other.close()
+
+  def test_too_large(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      self._ring.send({'pad': 'x' * 256})
+    self.assertFalse(self._ring.poll())
+    self.assertEqual(self._ring.free(), 256)
@@ -0,0 +1,53 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+from crappy import resources
+from crappy.tool import ApplyStrainToImage
+from crappy.tool.camera_config import SpotsBoxes
+from crappy.tool.image_processing import DICVETool
+
+
+class TestDICVETool(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._ref = np.ascontiguousarray(np.tile(resources.speckle, (1, 2)))
+    strain = ApplyStrainToImage(self._ref)
+    self._images = [strain(exx, exx / 2) for exx in (0.5, 1, 1.5, 2)]
+
+  def _track(self, method: str, patch_threads: int) -> list:
+    """"""
+
+    patches = SpotsBoxes()
+    patches.set_spots([(200, 100, 64, 64), (200, 850, 64, 64),
+                       (40, 480, 64, 64), (400, 480, 64, 64)])
+    patches.save_length()
+    tool = DICVETool(patches=patches, method=method,
+                     patch_threads=patch_threads)
+    tool.set_img0(self._ref)
+    try:
+      return [tool.calculate_displacement(img) for img in self._images]
+    finally:
+      tool.close()
+
+  def test_threads(self) -> None:
+    """"""
+
+    for method in ('Disflow', 'Parabola', 'Lucas Kanade'):
+      with self.subTest(method=method):
+        sequential = self._track(method, 1)
+        self.assertEqual(self._track(method, 3), sequential)
+
+    # The strains are correctly measured in parallel
+    *_, (_, eyy, exx, _) = self._track('Disflow', 4)
+    self.assertAlmostEqual(exx, 2, delta=0.1)
+    self.assertAlmostEqual(eyy, 1, delta=0.1)
+
+  def test_invalid_threads(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      DICVETool(patches=SpotsBoxes(), patch_threads=0)
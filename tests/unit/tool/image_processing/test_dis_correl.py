@@ -0,0 +1,85 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+import cv2
+from crappy import resources
+from crappy.tool.camera_config import Box
+from crappy.tool.image_processing import DISCorrelTool
+from crappy.tool.image_processing.fields import get_field
+
+
+class TestDISCorrelTool(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    speckle = np.tile(resources.speckle, (1, 2))
+    self._ref = np.ascontiguousarray(speckle[:480, :640])
+    matrix = np.array([[1, 0, 2.5], [0, 1, -1.]])
+    self._img = cv2.warpAffine(self._ref, matrix, (640, 480),
+                               flags=cv2.INTER_CUBIC)
+    self._box = Box(x_start=250, x_end=400, y_start=200, y_end=260)
+
+  def _correl(self, **kwargs) -> DISCorrelTool:
+    """"""
+
+    tool = DISCorrelTool(box=self._box, fields=['x', 'y'], **kwargs)
+    tool.set_box()
+    tool.set_img0(self._ref)
+    return tool
+
+  def test_full_image(self) -> None:
+    """"""
+
+    tool = self._correl()
+    x, y, res = tool.get_data(self._img, residuals=True)
+    self.assertAlmostEqual(x, 2.5, delta=0.1)
+    self.assertAlmostEqual(y, -1, delta=0.1)
+    self.assertEqual(tool._dis_flow.shape, (480, 640, 2))
+
+  def test_roi_margin(self) -> None:
+    """"""
+
+    tool = self._correl(roi_margin=20)
+    x, y, res = tool.get_data(self._img, residuals=True)
+    self.assertAlmostEqual(x, 2.5, delta=0.1)
+    self.assertAlmostEqual(y, -1, delta=0.1)
+    self.assertEqual(tool._dis_flow.shape, (100, 190, 2))
+
+    # The window is clipped to the image
+    self._box = Box(x_start=600, x_end=640, y_start=0, y_end=50)
+    tool = self._correl(roi_margin=30)
+    tool.get_data(self._img)
+    self.assertEqual(tool._dis_flow.shape, (80, 70, 2))
+
+  def test_invalid_margin(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      DISCorrelTool(box=self._box, roi_margin=-1)
+
+  def test_non_orthogonal_fields(self) -> None:
+    """"""
+
+    # The 'r' field shares its component along x with the 'exy' field
+    tool = DISCorrelTool(box=self._box, fields=['x', 'r', 'exy'])
+    tool.set_box()
+    fields = [np.stack(get_field(name, 60, 150), axis=-1)
+              for name in ('x', 'r', 'exy')]
+    flow = 1.5 * fields[0] + 0.5 * fields[1] - 2 * fields[2]
+
+    values = tool._projection @ flow.reshape(-1)
+    np.testing.assert_allclose(values, (1.5, 0.5, -2), atol=1e-4)
+
+  def test_residual_stride(self) -> None:
+    """"""
+
+    *_, full = self._correl().get_data(self._img, residuals=True)
+    *_, strided = self._correl(residual_stride=4).get_data(self._img,
+                                                            residuals=True)
+    self.assertAlmostEqual(strided, full, delta=0.2 * full)
+
+    with self.assertRaises(ValueError):
+      DISCorrelTool(box=self._box, residual_stride=0)
@@ -0,0 +1,48 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+from crappy.tool.camera_config import Box, SpotsBoxes
+from crappy.tool.image_processing.downscale import (downscale_image,
+                                                    downscale_box,
+                                                    downscale_spots,
+                                                    upscale_spots,
+                                                    downscale_fields)
+
+
+class TestDownscale(unittest.TestCase):
+  """"""
+
+  def test_image(self) -> None:
+    """"""
+
+    img = np.arange(7 * 9, dtype=np.float32).reshape(7, 9)
+    small = downscale_image(img, 2)
+    self.assertEqual(small.shape, (3, 4))
+    np.testing.assert_allclose(small, img[:6, :8].reshape(3, 2, 4, 2)
+                               .mean(axis=(1, 3)))
+    self.assertIs(downscale_image(img, 1), img)
+
+  def test_boxes(self) -> None:
+    """"""
+
+    box = downscale_box(Box(x_start=101, x_end=150, y_start=40, y_end=20), 4)
+    self.assertEqual(box.sorted(), (25, 37, 5, 10))
+
+    spots = SpotsBoxes()
+    spots.set_spots([(20, 40, 10, 10), (20, 80, 10, 10)])
+    small = downscale_spots(spots, 2)
+    self.assertEqual(small.x_l0, 20)
+    self.assertEqual(upscale_spots(small, 2)[1].sorted(), (80, 90, 20, 30))
+
+  def test_fields(self) -> None:
+    """"""
+
+    box = Box(x_start=0, x_end=40, y_start=0, y_end=20)
+    user = np.ones((20, 40, 2), dtype=np.float32)
+    x, exx, custom = downscale_fields(['x', 'exx', user], box, 4)
+    self.assertEqual(x.shape, (5, 10, 2))
+    np.testing.assert_allclose(x[..., 0], 1)
+    np.testing.assert_allclose(custom, 1)
+    # The strain field keeps its full-scale values
+    self.assertAlmostEqual(float(exx[0, -1, 0]), 0.185, delta=0.01)
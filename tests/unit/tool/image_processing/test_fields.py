@@ -0,0 +1,50 @@
+# coding: utf-8
+
+import unittest
+import numpy as np
+import cv2
+from crappy import resources
+from crappy.tool.image_processing.fields import get_res, Residuals
+
+
+class TestResiduals(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._ref = np.ascontiguousarray(resources.speckle[:300, :400])
+    matrix = np.array([[1, 0, 2.5], [0, 1, -1.]])
+    self._img = cv2.warpAffine(self._ref, matrix, (400, 300),
+                               flags=cv2.INTER_CUBIC)
+    rng = np.random.default_rng(0)
+    self._flow = (np.array((2.5, -1), dtype=np.float32) +
+                  rng.normal(0, 0.2, (300, 400, 2)).astype(np.float32))
+
+  def test_same_as_get_res(self) -> None:
+    """"""
+
+    residuals = Residuals(self._ref)
+    expected = get_res(self._ref, self._img, self._flow)
+    for _ in range(2):
+      np.testing.assert_allclose(residuals.get(self._img, self._flow),
+                                 expected, atol=1e-4)
+    self.assertAlmostEqual(residuals.mean(self._img, self._flow),
+                           float(np.average(np.abs(expected))), places=3)
+
+  def test_stride(self) -> None:
+    """"""
+
+    residuals = Residuals(self._ref, stride=3)
+    expected = get_res(self._ref, self._img, self._flow)[::3, ::3]
+    res = residuals.get(self._img, self._flow)
+    self.assertEqual(res.shape, (100, 134))
+    np.testing.assert_allclose(res, expected, atol=1e-4)
+
+  def test_invalid(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      Residuals(self._ref, stride=0)
+    with self.assertRaises(ValueError):
+      Residuals(self._ref).get(self._img[:-1], self._flow[:-1])
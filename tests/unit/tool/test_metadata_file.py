@@ -0,0 +1,56 @@
+# coding: utf-8
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+from crappy.tool.metadata_file import MetadataWriter, read_metadata
+
+
+class TestMetadataFile(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._dir = TemporaryDirectory()
+    self._path = Path(self._dir.name) / 'metadata.bin'
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._dir.cleanup()
+
+  def test_write_read(self) -> None:
+    """"""
+
+    writer = MetadataWriter(self._path)
+    writer.write([{'t(s)': i / 10, 'ImageUniqueID': i, 'Model': 'cam'}
+                  for i in range(5)])
+    writer.write([{'t(s)': 0.5, 'ImageUniqueID': 5}])
+    writer.write([])
+    writer.close()
+
+    records = read_metadata(self._path)
+    self.assertEqual(records.dtype.names, ('t(s)', 'ImageUniqueID', 'Model'))
+    np.testing.assert_array_equal(records['ImageUniqueID'], np.arange(6))
+    np.testing.assert_allclose(records['t(s)'], np.arange(6) / 10)
+    self.assertEqual(records['Model'].tolist(), [b'cam'] * 5 + [b''])
+
+  def test_truncated(self) -> None:
+    """"""
+
+    writer = MetadataWriter(self._path)
+    writer.write([{'ImageUniqueID': i} for i in range(3)])
+    writer.close()
+    with open(self._path, 'r+b') as file:
+      file.truncate(self._path.stat().st_size - 3)
+
+    self.assertEqual(len(read_metadata(self._path)), 2)
+
+  def test_invalid_file(self) -> None:
+    """"""
+
+    self._path.write_bytes(bytes(64))
+    with self.assertRaises(ValueError):
+      read_metadata(self._path)
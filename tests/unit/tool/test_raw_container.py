@@ -0,0 +1,94 @@
+# coding: utf-8
+
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy as np
+from crappy.tool.raw_container import (RawFrameWriter, RawFrameReader,
+                                       list_containers)
+
+
+class TestRawContainer(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._dir = TemporaryDirectory()
+    self._folder = Path(self._dir.name)
+
+  def tearDown(self) -> None:
+    """"""
+
+    self._dir.cleanup()
+
+  def test_write_read(self) -> None:
+    """"""
+
+    path = self._folder / 'frames_00000.raw'
+    writer = RawFrameWriter(path, (20, 30), 'uint16', capacity=10)
+    for i in range(7):
+      writer.append(np.full((20, 30), i, dtype='uint16'), 10 + i, i / 10)
+    writer.close()
+
+    reader = RawFrameReader(path)
+    self.assertEqual(len(reader), 7)
+    self.assertEqual(reader.shape, (20, 30))
+    self.assertEqual(reader.dtype, np.dtype('uint16'))
+    np.testing.assert_array_equal(reader.ids, np.arange(10, 17))
+    np.testing.assert_allclose(reader.timestamps, np.arange(7) / 10)
+
+    # Random access to the frames
+    for i in (6, 0, 3):
+      self.assertTrue(np.all(reader[i] == i))
+    self.assertFalse(reader[0].flags.writeable)
+
+  def test_color(self) -> None:
+    """"""
+
+    path = self._folder / 'frames_00000.raw'
+    img = np.random.randint(0, 256, (8, 9, 3), dtype='uint8')
+    writer = RawFrameWriter(path, img.shape, img.dtype, capacity=1)
+    writer.append(img, 0, 0.)
+    self.assertTrue(writer.full)
+    with self.assertRaises(IndexError):
+      writer.append(img, 1, 1.)
+    writer.close()
+
+    reader = RawFrameReader(path)
+    self.assertEqual(reader.shape, (8, 9, 3))
+    np.testing.assert_array_equal(reader[0], img)
+
+  def test_interrupted(self) -> None:
+    """"""
+
+    path = self._folder / 'frames_00000.raw'
+    writer = RawFrameWriter(path, (4, 4), 'uint8', capacity=100,
+                            flush_every=5)
+    for i in range(12):
+      writer.append(np.full((4, 4), i, dtype='uint8'), i, float(i))
+
+    # Only the frames written before the last flush are readable
+    reader = RawFrameReader(path)
+    self.assertEqual(len(reader), 10)
+    self.assertTrue(np.all(reader[9] == 9))
+    writer.close()
+    self.assertEqual(len(RawFrameReader(path)), 12)
+
+  def test_invalid_file(self) -> None:
+    """"""
+
+    path = self._folder / 'frames_00000.raw'
+    path.write_bytes(bytes(4096))
+    with self.assertRaises(ValueError):
+      RawFrameReader(path)
+
+  def test_list_containers(self) -> None:
+    """"""
+
+    for i in (2, 0, 1):
+      RawFrameWriter(self._folder / f'frames_{i:05d}.raw', (2, 2), 'uint8',
+                     capacity=1).close()
+    (self._folder / 'metadata.csv').touch()
+    self.assertEqual([path.name for path in list_containers(self._folder)],
+                     [f'frames_{i:05d}.raw' for i in range(3)])
@@ -0,0 +1,55 @@
+# coding: utf-8
+
+import unittest
+import os
+import logging
+from crappy.tool.scheduling import set_scheduling
+
+
+class TestScheduling(unittest.TestCase):
+  """"""
+
+  def setUp(self) -> None:
+    """"""
+
+    self._logs = list()
+
+  def _log(self, level: int, msg: str) -> None:
+    """"""
+
+    self._logs.append((level, msg))
+
+  def test_wrong_policy(self) -> None:
+    """"""
+
+    with self.assertRaises(ValueError):
+      set_scheduling(self._log, rt_priority=1, rt_policy='batch')
+
+  def test_nothing(self) -> None:
+    """"""
+
+    set_scheduling(self._log)
+    self.assertListEqual(self._logs, list())
+
+  @unittest.skipUnless(hasattr(os, 'sched_setaffinity'), 'Linux only')
+  def test_affinity(self) -> None:
+    """"""
+
+    affinity = os.sched_getaffinity(0)
+    set_scheduling(self._log, cpu_affinity=affinity)
+    self.assertSetEqual(os.sched_getaffinity(0), affinity)
+    self.assertEqual(self._logs[-1][0], logging.INFO)
+
+    # Failures are only logged
+    set_scheduling(self._log, cpu_affinity=(max(affinity) + 4096,))
+    self.assertSetEqual(os.sched_getaffinity(0), affinity)
+    self.assertEqual(self._logs[-1][0], logging.WARNING)
+
+  @unittest.skipUnless(hasattr(os, 'sched_setscheduler'), 'Linux only')
+  def test_priority_failure(self) -> None:
+    """"""
+
+    policy = os.sched_getscheduler(0)
+    set_scheduling(self._log, rt_priority=1000)
+    self.assertEqual(os.sched_getscheduler(0), policy)
+    self.assertEqual(self._logs[-1][0], logging.WARNING)